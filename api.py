@@ -0,0 +1,114 @@
+"""Helpers for the /api/v1 JSON endpoints and the streaming matchup export.
+
+The API returns the same data the HTML pages render: app.py builds both from
+one function per view, and jsonable() turns what those functions return into
+plain JSON (the record book's inf sentinels become null, NumPy scalars become
+numbers).
+
+The export walks weekly_matchups in matchup_id order with keyset pagination.
+Each batch is `WHERE matchup_id > <last id> ORDER BY matchup_id LIMIT n`, a
+range seek on the primary key, and its rows are written out as NDJSON or CSV
+before the next batch is read. Memory stays at one batch however much history
+there is, and a client can page or resume with ?after=<last matchup_id>.
+"""
+import csv
+import io
+import json
+import math
+
+API_PREFIX = '/api/v1'
+EXPORT_BATCH = 1000
+EXPORT_FORMATS = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+EXPORT_COLUMNS = ('matchup_id', 'season_id', 'year', 'week_start', 'week_end', 'weeks_included', 'game_type',
+                  'player1_id', 'player1_name', 'player1_score', 'player2_id', 'player2_name', 'player2_score', 'notes')
+_EXPORT_FROM = "FROM weekly_matchups wm JOIN seasons s ON wm.season_id = s.season_id JOIN players p1 ON wm.player1_id = p1.player_id JOIN players p2 ON wm.player2_id = p2.player_id"
+# Query argument -> WHERE condition; season and player must be numbers.
+_FILTER_CONDITIONS = {'season': 's.year = ?', 'player': '(wm.player1_id = ? OR wm.player2_id = ?)', 'game_type': 'wm.game_type = ?'}
+_EXPORT_SELECT = "SELECT wm.matchup_id, wm.season_id, s.year, wm.week_start, wm.week_end, wm.weeks_included, wm.game_type, wm.player1_id, p1.name, wm.player1_score, wm.player2_id, p2.name, wm.player2_score, wm.notes " + _EXPORT_FROM
+
+
+def jsonable(value):
+    """value with every float that JSON can't represent replaced by None and NumPy scalars unwrapped."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [jsonable(v) for v in value]
+    if hasattr(value, 'item'):  # NumPy scalar
+        return jsonable(value.item())
+    return value
+
+
+def export_filters(args):
+    """(conditions, params) for the export's optional filters; raises ValueError for a bad value."""
+    conditions, params = [], []
+    for name, condition in _FILTER_CONDITIONS.items():
+        value = args.get(name)
+        if not value:
+            continue
+        if name != 'game_type':
+            if not value.isdigit():
+                raise ValueError(f"{name} must be a number, not '{value}'")
+            value = int(value)
+        conditions.append(condition)
+        params += [value] * condition.count('?')
+    return conditions, params
+
+
+def _where(conditions):
+    return ' WHERE ' + ' AND '.join(['wm.matchup_id > ?'] + list(conditions))
+
+
+def _batch_sql(conditions):
+    return f"{_EXPORT_SELECT}{_where(conditions)} ORDER BY wm.matchup_id LIMIT ?"
+
+
+def _next_after_sql(conditions):
+    return f"SELECT wm.matchup_id {_EXPORT_FROM}{_where(conditions)} ORDER BY wm.matchup_id LIMIT 2 OFFSET ?"
+
+
+def plan_samples():
+    """The export SQL for no filter, each filter and all of them, for `db_indexes.py check`."""
+    filters = [[], *([c] for c in _FILTER_CONDITIONS.values()), list(_FILTER_CONDITIONS.values())]
+    return {'export_batches': [_batch_sql(c) for c in filters], 'next_after': [_next_after_sql(c) for c in filters]}
+
+
+def export_batches(conn, after=0, conditions=(), params=(), limit=None, batch=EXPORT_BATCH):
+    """Yields lists of rows (in EXPORT_COLUMNS order) with matchup_id > after, at most `limit` rows in all."""
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = batch if remaining is None else min(batch, remaining)
+        rows = conn.execute(_batch_sql(conditions), [after] + list(params) + [size]).fetchall()
+        if not rows:
+            return
+        yield rows
+        after = rows[-1][0]
+        if remaining is not None:
+            remaining -= len(rows)
+        if len(rows) < size:
+            return
+
+
+def next_after(conn, after, conditions, params, limit):
+    """The ?after= value for the page following this one, or None if this is the last page."""
+    rows = conn.execute(_next_after_sql(conditions), [after] + list(params) + [limit - 1]).fetchall()
+    return rows[0][0] if len(rows) == 2 else None
+
+
+def ndjson_chunks(batches):
+    for rows in batches:
+        yield ''.join(json.dumps(dict(zip(EXPORT_COLUMNS, row)), separators=(',', ':')) + '\n' for row in rows)
+
+
+def csv_chunks(batches):
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in batches:
+        writer.writerows(rows)
+        yield out.getvalue()
+        out.seek(0)
+        out.truncate()
+    if out.tell():
+        yield out.getvalue()  # header of an empty export
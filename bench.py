@@ -0,0 +1,287 @@
+"""Route latency benchmark over synthetic leagues of increasing size.
+
+    python bench.py [--scales small,medium,large] [--per-route 20] [--repeat 5] [--out bench.json]
+    python bench.py --compare baseline.json [--out new.json] [--threshold 1.25]
+
+For each scale a league DB is generated with synth_league (kept in --cache-dir
+and reused while its parameters match). A fresh process then drives the app
+against it through the Flask test client, with FFL_DATABASE pointing at the DB
+and FFL_LEAGUES_DIR at --cache-dir. Every GET route in the app's URL map is
+sampled, its arguments filled in from the DB (sample_urls), and one URL per
+endpoint is also requested under the /l/<league> prefix as its own group. For
+each endpoint the JSON baseline records:
+
+    first_ms            the endpoint's first request, including any cache build
+    cold_max_ms         slowest first request of any sampled URL
+    cold_queries        SQL statements over those first requests
+    p50_ms / p99_ms     latency of the warm requests (--repeat per URL)
+    queries             SQL statements per warm request (from metrics.py)
+    peak_kib            peak Python allocation of a cold request above what was
+                        already allocated (tracemalloc)
+
+plus the worker's max RSS. --compare flags any endpoint whose p50 grew by more
+than --threshold (and by at least --min-delta-ms, so sub-millisecond noise
+isn't reported), or whose query count went up, and exits non-zero.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+APP_ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+SCALES = {
+    'small': {'managers': 10, 'seasons': 9, 'teams': 10},
+    'medium': {'managers': 100, 'seasons': 20, 'teams': 40},
+    'large': {'managers': 1000, 'seasons': 50, 'teams': 200},
+}
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def league_db(scale, cache_dir):
+    """Path to the scale's synthetic DB, generating it if missing."""
+    import synth_league
+    params = SCALES[scale]
+    path = os.path.join(cache_dir, f"synth_{params['managers']}m_{params['seasons']}s_{params['teams']}t.db")
+    if not os.path.exists(path):
+        synth_league.generate(path + '.tmp', **params)
+        os.replace(path + '.tmp', path)
+    return path
+
+
+def _rows(conn, sql, rng, n):
+    rows = conn.execute(sql).fetchall()
+    return rng.sample(rows, min(n, len(rows)))
+
+
+def _pairs(conn, rng, n):
+    player_ids = [r[0] for r in conn.execute("SELECT player_id FROM players")]
+    pairs = {tuple(rng.sample(player_ids, 2)) for _ in range(n)} if len(player_ids) > 1 else set()
+    return [{'player1_id': a, 'player2_id': b} for a, b in sorted(pairs)]
+
+
+def _streak_kinds(conn, rng, n):
+    from game_log import STREAK_KINDS
+    return [{'kind': kind} for kind in STREAK_KINDS]
+
+
+def _export_formats(conn, rng, n):
+    from api import EXPORT_FORMATS
+    return [{'fmt': fmt} for fmt in EXPORT_FORMATS]
+
+
+def _search_queries(conn, rng):
+    names = [f"q={name.split()[0]}" for (name,) in _rows(conn, "SELECT name FROM players", rng, 4)]
+    return names + ['q=championship', 'game_type=regular&min_score=120', 'min_margin=40&page=2']
+
+
+# Values for a rule's arguments, keyed by its sorted argument names: (conn, rng, n) -> up to n
+# dicts of values that exist in the league. Arguments that depend on each other (a week of a
+# season, two players) are drawn together. A route with arguments not listed here stops the run.
+ARGUMENTS = {
+    (): lambda conn, rng, n: [{}],
+    ('year',): lambda conn, rng, n: [{'year': y} for (y,) in _rows(conn, "SELECT year FROM seasons", rng, n)],
+    ('week_num', 'year'): lambda conn, rng, n: [{'year': y, 'week_num': w} for y, w in _rows(
+        conn, "SELECT DISTINCT s.year, wm.week_start FROM weekly_matchups wm JOIN seasons s ON wm.season_id = s.season_id", rng, n)],
+    ('player_id',): lambda conn, rng, n: [{'player_id': p} for (p,) in _rows(conn, "SELECT player_id FROM players", rng, n)],
+    ('player1_id', 'player2_id'): _pairs,
+    ('kind',): _streak_kinds,
+    ('fmt',): _export_formats,
+}
+# Query strings for the endpoints that read request.args, given (conn, rng); the bare URL is sampled too.
+QUERY_STRINGS = {
+    'head_to_head': lambda conn, rng: [f"player1_id={p['player1_id']}&player2_id={p['player2_id']}" for p in _pairs(conn, rng, 4)],
+    'player_compare': lambda conn, rng: ['ids=' + ','.join(str(p) for (p,) in _rows(conn, "SELECT player_id FROM players", rng, 4))],
+    'search_page': _search_queries,
+    'search_suggest': lambda conn, rng: [f"q={name[:2]}" for (name,) in _rows(conn, "SELECT name FROM players", rng, 4)],
+    'api_export_matchups': lambda conn, rng: ['limit=1000'] + [f"season={y}" for (y,) in _rows(conn, "SELECT year FROM seasons", rng, 2)],
+}
+SKIP_ENDPOINTS = {'static'}
+LEAGUE_ROUTE = '/l/<league>'  # the group of league-prefixed URLs; its queries are counted over every endpoint
+
+
+def sample_urls(app, db_path, per_route, seed=0):
+    """endpoint -> up to per_route URLs, for every GET rule in app.url_map.
+
+    Each rule's arguments come from ARGUMENTS and each endpoint's query strings
+    from QUERY_STRINGS, so a new route is benchmarked without listing it here.
+    """
+    rng = random.Random(seed)
+    adapter = app.url_map.bind('localhost')
+    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    try:
+        by_endpoint = {}
+        for rule in sorted(app.url_map.iter_rules(), key=lambda r: r.rule):
+            if rule.endpoint in SKIP_ENDPOINTS or 'GET' not in rule.methods:
+                continue
+            names = tuple(sorted(rule.arguments))
+            if names not in ARGUMENTS:
+                raise KeyError(f"No bench.ARGUMENTS entry for {rule.rule} (arguments {', '.join(names)})")
+            urls = by_endpoint.setdefault(rule.endpoint, [])
+            urls += [adapter.build(rule.endpoint, values) for values in ARGUMENTS[names](conn, rng, per_route)]
+            if not names and rule.endpoint in QUERY_STRINGS:
+                urls += [f"{rule.rule}?{qs}" for qs in QUERY_STRINGS[rule.endpoint](conn, rng)]
+    finally:
+        conn.close()
+    return {endpoint: sorted(rng.sample(group, min(per_route, len(group)))) for endpoint, group in sorted(by_endpoint.items())}
+
+
+def run_worker(db_path, per_route, repeat):
+    """Benchmarks every endpoint against db_path in this process (FFL_DATABASE must already point at it)."""
+    import metrics
+    from app import app, league_registry
+    from db_cache import derived_cache
+    client = app.test_client()
+    routes = sample_urls(app, db_path, per_route)
+    slug = os.path.splitext(os.path.basename(db_path))[0]
+    if league_registry.path_for(slug) == db_path:
+        routes[LEAGUE_ROUTE] = [f'/l/{slug}{urls[0]}' for urls in routes.values()]
+    results = {}
+
+    def queries(endpoint):
+        if endpoint == LEAGUE_ROUTE:
+            return sum(metrics.SQL_QUERIES.values.values())
+        return metrics.SQL_QUERIES.values.get((endpoint,), 0)
+
+    for endpoint, urls in routes.items():
+        # Cold pass: every URL once, so per-season/per-league caches are built before timing.
+        cold, statuses = [], set()
+        before = queries(endpoint)
+        for url in urls:
+            started = time.perf_counter()
+            statuses.add(client.get(url).status_code)
+            cold.append((time.perf_counter() - started) * 1000)
+        first_queries = queries(endpoint) - before
+        before = queries(endpoint)
+        latencies = []
+        for _ in range(repeat):
+            for url in urls:
+                started = time.perf_counter()
+                client.get(url)
+                latencies.append((time.perf_counter() - started) * 1000)
+        results[endpoint] = {'urls': len(urls), 'requests': len(latencies), 'statuses': sorted(statuses),
+                             'first_ms': round(cold[0], 3), 'cold_max_ms': round(max(cold), 3), 'cold_queries': first_queries,
+                             'p50_ms': round(_percentile(latencies, 50), 3), 'p99_ms': round(_percentile(latencies, 99), 3),
+                             'queries': round((queries(endpoint) - before) / len(latencies), 2)}
+
+    # Memory pass: cold caches again so engine builds count towards the endpoint that triggers them.
+    derived_cache.clear()
+    tracemalloc.start()
+    for endpoint, urls in routes.items():
+        peak = 0
+        for url in urls:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            client.get(url)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+        results[endpoint]['peak_kib'] = peak // 1024
+    tracemalloc.stop()
+    max_rss_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+    return {'routes': results, 'max_rss_kib': max_rss_kib}
+
+
+def bench_scale(scale, cache_dir, per_route, repeat):
+    started = time.perf_counter()
+    db_path = league_db(scale, cache_dir)
+    generate_seconds = time.perf_counter() - started
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+        out = f.name
+    try:
+        env = dict(os.environ, FFL_DATABASE=db_path, FFL_LEAGUES_DIR=os.path.dirname(db_path))
+        proc = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', db_path, '--worker-out', out,
+                               '--per-route', str(per_route), '--repeat', str(repeat)],
+                              env=env, cwd=APP_ROOT_DIR, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"{scale} worker failed:\n{proc.stdout[-2000:]}{proc.stderr[-4000:]}")
+        with open(out, encoding='utf-8') as f:
+            result = json.load(f)
+    finally:
+        os.remove(out)
+    return dict(result, params=SCALES[scale], db_bytes=os.path.getsize(db_path), generate_seconds=round(generate_seconds, 2))
+
+
+def compare(old, new, threshold, min_delta_ms):
+    """Prints per-endpoint changes; returns the number of regressions."""
+    regressions = 0
+    for scale, result in new['scales'].items():
+        before = old.get('scales', {}).get(scale)
+        if before is None:
+            continue
+        print(f"{scale}:")
+        for endpoint, stats in result['routes'].items():
+            prev = before['routes'].get(endpoint)
+            if prev is None:
+                print(f"  {endpoint:<22} new")
+                continue
+            ratio = stats['p50_ms'] / prev['p50_ms'] if prev['p50_ms'] else 1.0
+            slower = ratio > threshold and stats['p50_ms'] - prev['p50_ms'] >= min_delta_ms
+            more_queries = stats['queries'] > prev['queries']
+            regressions += slower or more_queries
+            flag = '  <-- REGRESSION' if slower or more_queries else ''
+            print(f"  {endpoint:<22} p50 {prev['p50_ms']:9.2f} -> {stats['p50_ms']:9.2f} ms ({ratio:5.2f}x)  "
+                  f"queries {prev['queries']:g} -> {stats['queries']:g}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', default='small,medium,large', help=f"Comma-separated, from {', '.join(SCALES)}")
+    parser.add_argument('--per-route', type=int, default=20, help="URLs sampled per endpoint")
+    parser.add_argument('--repeat', type=int, default=5, help="Warm requests per URL")
+    parser.add_argument('--cache-dir', default=os.path.join(tempfile.gettempdir(), 'ffl-bench'))
+    parser.add_argument('--out', help="Write the JSON baseline here (default: stdout)")
+    parser.add_argument('--compare', help="Baseline JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=1.25, help="p50 slowdown ratio counted as a regression")
+    parser.add_argument('--min-delta-ms', type=float, default=1.0, help="Ignore p50 slowdowns smaller than this")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    parser.add_argument('--worker-out', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        result = run_worker(args.worker, args.per_route, args.repeat)
+        with open(args.worker_out, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        return 0
+
+    scales = [s.strip() for s in args.scales.split(',') if s.strip()]
+    unknown = [s for s in scales if s not in SCALES]
+    if unknown:
+        parser.error(f"unknown scale(s): {', '.join(unknown)}")
+    os.makedirs(args.cache_dir, exist_ok=True)
+    report = {'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': platform.python_version(),
+              'machine': platform.platform(), 'per_route': args.per_route, 'repeat': args.repeat, 'scales': {}}
+    for scale in scales:
+        print(f"Benchmarking {scale} {SCALES[scale]} ...", file=sys.stderr)
+        report['scales'][scale] = bench_scale(scale, args.cache_dir, args.per_route, args.repeat)
+
+    text = json.dumps(report, indent=1, sort_keys=True)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    elif not args.compare:
+        print(text)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(json.load(f), report, args.threshold, args.min_delta_ms)
+        print(f"{regressions} regression(s)." if regressions else "No regressions.")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""The deployed code's version, computed once at build time.
+
+    python build_info.py            # print the version the current sources hash to
+
+Rendered pages depend on the DB, the Python sources and the templates.
+code_version() hashes the sources and templates: freeze.py compares it with
+its manifest to decide on a full rebuild, and http_cache puts it in every ETag.
+Reading and stat'ing every file is too much for each cold start, so
+`python coldstart.py compile` calls write(), which saves the version and the
+newest source mtime next to the compiled templates, and the file is committed
+with them (`coldstart.py check` fails CI when it is stale). load() reads that
+file and only hashes the sources itself when it is missing.
+"""
+import glob
+import hashlib
+import json
+import os
+
+APP_ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+BUILD_INFO_PATH = os.path.join(APP_ROOT_DIR, 'compiled_templates', 'build_info.json')
+
+
+def source_files():
+    """Everything besides the DB that can change rendered output."""
+    return sorted(glob.glob(os.path.join(APP_ROOT_DIR, '*.py')) + glob.glob(os.path.join(APP_ROOT_DIR, 'templates', '*.html')))
+
+
+def code_version():
+    digest = hashlib.sha1()
+    for path in source_files():
+        digest.update(os.path.relpath(path, APP_ROOT_DIR).encode())
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def compute():
+    """{'code_version', 'code_mtime'} from the sources as they are now."""
+    return {'code_version': code_version(), 'code_mtime': max(os.path.getmtime(path) for path in source_files())}
+
+
+def write(path=BUILD_INFO_PATH):
+    info = compute()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(info, f)
+    return info
+
+
+def load(path=BUILD_INFO_PATH):
+    """The build's {'code_version', 'code_mtime'}, or compute() if there is no build."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return compute()
+
+
+if __name__ == '__main__':
+    print(code_version())
@@ -0,0 +1,85 @@
+"""Career profiles for every player, built in one pass over the league tables.
+
+player_detail used to run ~13 queries per player (six of them re-joining
+season_results to seasons just for the best/worst entries) and sum career
+totals in Python. build_profiles reads season_results, championships and the
+podium/toilet-bowl matchups once for the whole league and returns, per
+player, exactly what player_detail.html renders. The result is cached in
+db_cache until the DB changes, so /players/<id> and /players/compare are
+lookups.
+"""
+
+HISTORY_COLUMNS = ('year', 'rank', 'regular_season_record', 'wins', 'losses', 'ties', 'points_for', 'points_against', 'made_playoffs')
+
+# player_records key -> (season_results column, pick the lowest?)
+SEASON_EXTREMES = {
+    'best_rank': ('rank', True),
+    'worst_rank': ('rank', False),
+    'highest_pf': ('points_for', False),
+    'highest_ppg': ('points_per_game', False),
+    'lowest_pf': ('points_for', True),
+    'lowest_ppg': ('points_per_game', True),
+}
+
+
+def _empty_profile(player_id, name):
+    return {'player_id': player_id, 'player_name': name, 'history': [], 'championship_wins': [], 'runner_up_finishes': [],
+            'third_place_finishes': [], 'toilet_bowl_wins': 0, 'toilet_bowl_losses': 0, 'toilet_bowl_history': {},
+            'player_records': {key: {'value': None, 'year': None} for key in SEASON_EXTREMES}}
+
+
+def _career_stats(history):
+    seasons_played = len(history)
+    total_wins = sum(s['wins'] or 0 for s in history)
+    total_losses = sum(s['losses'] or 0 for s in history)
+    total_ties = sum(s['ties'] or 0 for s in history)
+    total_pf = sum(s['points_for'] or 0.0 for s in history)
+    total_pa = sum(s['points_against'] or 0.0 for s in history)
+    total_rank = sum(s['rank'] or 0 for s in history)
+    total_games = total_wins + total_losses + total_ties
+    return {'seasons_played': seasons_played, 'total_wins': total_wins, 'total_losses': total_losses, 'total_ties': total_ties,
+            'win_percentage': (total_wins / total_games * 100) if total_games > 0 else 0.0,
+            'total_pf': total_pf, 'total_pa': total_pa,
+            'avg_rank': (total_rank / seasons_played) if seasons_played > 0 else 0.0,
+            'avg_pf_per_season': (total_pf / seasons_played) if seasons_played > 0 else 0.0,
+            'avg_pa_per_season': (total_pa / seasons_played) if seasons_played > 0 else 0.0,
+            'playoff_appearances': sum(1 for s in history if s['made_playoffs'] == 1)}
+
+
+def build_profiles(conn):
+    profiles = {pid: _empty_profile(pid, name) for pid, name in conn.execute("SELECT player_id, name FROM players")}
+
+    # Oldest season first, so the first season to reach a best/worst value keeps it.
+    results = conn.execute("SELECT sr.player_id, s.year, sr.rank, sr.regular_season_record, sr.wins, sr.losses, sr.ties, sr.points_for, sr.points_against, sr.made_playoffs, sr.points_per_game FROM season_results sr JOIN seasons s ON sr.season_id = s.season_id ORDER BY s.year ASC, sr.result_id ASC").fetchall()
+    for row in results:
+        profile = profiles.get(row[0])
+        if profile is None:
+            continue
+        season = dict(zip(HISTORY_COLUMNS, row[1:10]))
+        profile['history'].append(season)
+        values = {'rank': season['rank'], 'points_for': season['points_for'], 'points_per_game': row[10]}
+        for key, (column, lowest) in SEASON_EXTREMES.items():
+            value, best = values[column], profile['player_records'][key]
+            if value is not None and (best['value'] is None or (value < best['value'] if lowest else value > best['value'])):
+                profile['player_records'][key] = {'value': value, 'year': season['year']}
+
+    for winner_id, runner_up_id, year in conn.execute("SELECT c.winner_id, c.runner_up_id, s.year FROM championships c JOIN seasons s ON c.season_id = s.season_id ORDER BY s.year DESC"):
+        if winner_id in profiles: profiles[winner_id]['championship_wins'].append({'year': year})
+        if runner_up_id in profiles: profiles[runner_up_id]['runner_up_finishes'].append({'year': year})
+
+    for game_type, year, p1, p2, s1, s2 in conn.execute("SELECT wm.game_type, s.year, wm.player1_id, wm.player2_id, wm.player1_score, wm.player2_score FROM weekly_matchups wm JOIN seasons s ON wm.season_id = s.season_id WHERE wm.game_type IN ('3rd_place', 'toilet_bowl') ORDER BY s.year DESC"):
+        if s1 is None or s2 is None or s1 == s2:
+            continue
+        winner, loser = (p1, p2) if s1 > s2 else (p2, p1)
+        if game_type == '3rd_place':
+            if winner in profiles: profiles[winner]['third_place_finishes'].append({'year': year})
+            continue
+        if winner in profiles:
+            profiles[winner]['toilet_bowl_history'][year] = 'win'; profiles[winner]['toilet_bowl_wins'] += 1
+        if loser in profiles:
+            profiles[loser]['toilet_bowl_history'][year] = 'loss'; profiles[loser]['toilet_bowl_losses'] += 1
+
+    for profile in profiles.values():
+        profile['history'].reverse()  # most recent season first, as the page lists it
+        profile['career_stats'] = _career_stats(profile['history'])
+    return profiles
@@ -0,0 +1,179 @@
+"""Cold-start helpers for the serverless deploy: precompiled templates and startup timing.
+
+    python coldstart.py compile                     # templates/ -> compiled_templates/ plus the code version, run before committing
+    python coldstart.py check                       # fails if compiled_templates/ is older than the sources (CI)
+    python coldstart.py measure [--runs 5] [--url /] [--json PATH]
+
+The first render of a page in a fresh process has Jinja lex, parse and
+generate Python for base.html and the page template. `compile` does that once
+at build time. Every template is written as a Python module with
+Environment.compile_templates and byte-compiled, together with a hash of the
+template sources. `compile` also records the code version for the HTTP cache
+(build_info.write()), which covers the templates too. install() trusts that
+build: it puts a ModuleLoader in front of the normal loader whenever both files
+are there and reads no template source, so a cold start doesn't hash them
+again. Freshness is checked where it is cheap to fail, by `check` in CI. The
+generated modules are plain Python, so they work under any interpreter; the
+.pyc files are used when the build and runtime Python versions match.
+FFL_COMPILED_TEMPLATES=0 turns this off, e.g. while editing templates locally
+without recompiling.
+
+The Vercel deploy has no build step, so compiled_templates/ is committed (the
+.pyc files aren't). Run `compile` before committing a change to any template or
+.py file. `check` recompares both hashes with the sources and exits non-zero
+when either is stale; the CI workflow runs it, because a stale code version
+would keep old ETags alive after a deploy.
+
+`measure` starts fresh interpreters and reports the app import time and time
+to the first full response. It compares a plain start with the cold-start
+setup (DB_IN_MEMORY=1 plus compiled templates). A running app reports the same
+numbers as ffl_startup_seconds / ffl_cold_start_ttfb_seconds on /metrics and
+logs them once after its first request.
+"""
+import argparse
+import compileall
+import hashlib
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+
+import build_info
+
+APP_ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATES_DIR = os.path.join(APP_ROOT_DIR, 'templates')
+COMPILED_DIR = os.path.join(APP_ROOT_DIR, 'compiled_templates')
+SOURCE_HASH_FILE = 'templates.sha1'
+
+MEASURE_MODES = {
+    'baseline': {'DB_IN_MEMORY': '0', 'FFL_COMPILED_TEMPLATES': '0'},
+    'optimized': {'DB_IN_MEMORY': '1', 'FFL_COMPILED_TEMPLATES': '1'},
+}
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+response = app.app.test_client().get(sys.argv[1])
+response.get_data()
+done = time.perf_counter()
+print(json.dumps({'status': response.status_code, 'import_ms': (imported - started) * 1000,
+                  'first_request_ms': (done - imported) * 1000, 'ttfb_ms': (done - started) * 1000}))
+"""
+
+
+def templates_digest():
+    digest = hashlib.sha1()
+    for root, _, files in sorted(os.walk(TEMPLATES_DIR)):
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            digest.update(os.path.relpath(path, TEMPLATES_DIR).replace(os.sep, '/').encode())
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def compile_templates(app, target=COMPILED_DIR):
+    """Compiles every template of `app` into `target`; returns the number written."""
+    staging = target + '.tmp'
+    shutil.rmtree(staging, ignore_errors=True)
+    names = app.jinja_env.list_templates()
+    app.jinja_env.compile_templates(staging, zip=None, ignore_errors=False)
+    compileall.compile_dir(staging, quiet=1)
+    with open(os.path.join(staging, SOURCE_HASH_FILE), 'w', encoding='utf-8') as f:
+        f.write(templates_digest())
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(staging, target)
+    return len(names)
+
+
+def install(app, compiled_dir=COMPILED_DIR):
+    """Serves templates from compiled_dir if there is a complete build; returns whether it did.
+
+    Whether the build matches the sources is left to `check` (stale_outputs), so
+    this only looks for the files `compile` writes last.
+    """
+    if os.environ.get('FFL_COMPILED_TEMPLATES', '1').lower() in ('0', 'false', 'no'):
+        return False
+    info_path = os.path.join(compiled_dir, os.path.basename(build_info.BUILD_INFO_PATH))
+    if not (os.path.isfile(os.path.join(compiled_dir, SOURCE_HASH_FILE)) and os.path.isfile(info_path)):
+        return False
+    from jinja2 import ChoiceLoader, ModuleLoader
+    app.jinja_env.loader = ChoiceLoader([ModuleLoader(compiled_dir), app.jinja_env.loader])
+    return True
+
+
+def stale_outputs(compiled_dir=COMPILED_DIR):
+    """Descriptions of whatever in compiled_dir doesn't match the current sources ([] if it is all fresh)."""
+    stale = []
+    try:
+        with open(os.path.join(compiled_dir, SOURCE_HASH_FILE), encoding='utf-8') as f:
+            built_from = f.read().strip()
+    except OSError:
+        built_from = None
+    if built_from != templates_digest():
+        stale.append(f"compiled templates ({SOURCE_HASH_FILE} {'missing' if built_from is None else 'differs from templates/'})")
+    info_path = os.path.join(compiled_dir, os.path.basename(build_info.BUILD_INFO_PATH))
+    try:
+        with open(info_path, encoding='utf-8') as f:
+            built_version = json.load(f).get('code_version')
+    except (OSError, ValueError):
+        built_version = None
+    if built_version != build_info.code_version():
+        stale.append(f"code version ({os.path.basename(info_path)} {'missing' if built_version is None else 'differs from the sources'})")
+    return stale
+
+
+def measure(url='/', runs=5):
+    """mode -> median import/first-request/ttfb milliseconds over `runs` fresh processes."""
+    results = {}
+    for mode, env in MEASURE_MODES.items():
+        samples = []
+        for _ in range(runs):
+            proc = subprocess.run([sys.executable, '-c', _PROBE, url], env=dict(os.environ, **env),
+                                  cwd=APP_ROOT_DIR, capture_output=True, text=True)
+            if proc.returncode != 0:
+                raise RuntimeError(f"{mode} probe failed:\n{proc.stderr[-4000:]}")
+            samples.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+        results[mode] = {key: round(statistics.median(s[key] for s in samples), 1)
+                         for key in ('import_ms', 'first_request_ms', 'ttfb_ms')}
+        results[mode]['status'] = samples[-1]['status']
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('command', choices=['compile', 'check', 'measure'])
+    parser.add_argument('--url', default='/', help="Page requested first (measure only)")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh processes per mode (measure only)")
+    parser.add_argument('--json', help="Also write the measurements to this file (measure only)")
+    args = parser.parse_args(argv)
+    if args.command == 'compile':
+        os.environ['FFL_COMPILED_TEMPLATES'] = '0'  # compile from the sources, not an older build
+        from app import app
+        count = compile_templates(app)
+        info = build_info.write()
+        print(f"Compiled {count} template(s) to {COMPILED_DIR}; code version {info['code_version'][:12]}")
+        return 0
+    if args.command == 'check':
+        stale = stale_outputs()
+        for what in stale:
+            print(f"Out of date: {what}")
+        print("Run `python coldstart.py compile` and commit compiled_templates/." if stale else "compiled_templates/ matches the sources.")
+        return 1 if stale else 0
+    if not os.path.exists(os.path.join(COMPILED_DIR, SOURCE_HASH_FILE)):
+        print("No compiled templates yet; run `python coldstart.py compile` first for the optimized numbers.")
+    results = measure(args.url, args.runs)
+    for mode, r in results.items():
+        print(f"{mode:<10} import {r['import_ms']:7.1f} ms   first request {r['first_request_ms']:7.1f} ms   "
+              f"time to first byte {r['ttfb_ms']:7.1f} ms   (median of {args.runs}, {args.url} -> {r['status']})")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=1)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,189 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'season_timeline.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'season_timeline.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_year = resolve('year')
+    pass
+    yield escape((undefined(name='year') if l_0_year is missing else l_0_year))
+    yield ' Season Timeline - Fantasy League'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_year = resolve('year')
+    l_0_timeline = resolve('timeline')
+    l_0_power_order = resolve('power_order')
+    l_0_url_for = resolve('url_for')
+    try:
+        t_1 = environment.tests['none']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No test named 'none' found.")
+    pass
+    yield '\n<div class="bg-white p-6 rounded-xl shadow-xl border border-neutral-200/80 mb-8 card-hover-effect">\n    <h1 class="text-3xl font-bold font-heading mb-6 text-primary-dark border-b border-neutral-300 pb-3">'
+    yield escape((undefined(name='year') if l_0_year is missing else l_0_year))
+    yield ' Season Timeline</h1>\n\n    '
+    if (undefined(name='timeline') if l_0_timeline is missing else l_0_timeline):
+        pass
+        yield '\n        <h2 class="text-2xl font-semibold font-heading mb-2 text-neutral-700">Standings by Week</h2>\n        <p class="text-sm text-neutral-500 mb-4">Regular-season standing after each week, by wins then points for. Hover a cell for the record and points at that point.</p>\n        <div class="overflow-x-auto shadow-md rounded-lg border border-neutral-200/80 mb-8">\n            <table class="min-w-full divide-y divide-neutral-200 text-sm">\n                <thead class="bg-neutral-100">\n                    <tr>\n                        <th scope="col" class="px-3 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Player</th>\n                        '
+        for l_1_week in environment.getattr((undefined(name='timeline') if l_0_timeline is missing else l_0_timeline), 'weeks'):
+            _loop_vars = {}
+            pass
+            yield '\n                            <th scope="col" class="px-3 py-3 text-center text-xs font-semibold text-neutral-600 uppercase tracking-wider">\n                                <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'weekly_results', year=(undefined(name='year') if l_0_year is missing else l_0_year), week_num=l_1_week, _loop_vars=_loop_vars))
+            yield '" class="hover:underline">Wk '
+            yield escape(l_1_week)
+            yield '</a>\n                            </th>\n                        '
+        l_1_week = missing
+        yield '\n                        <th scope="col" class="px-3 py-3 text-center text-xs font-semibold text-neutral-600 uppercase tracking-wider">Record</th>\n                        <th scope="col" class="px-3 py-3 text-center text-xs font-semibold text-neutral-600 uppercase tracking-wider">PF</th>\n                        <th scope="col" class="px-3 py-3 text-center text-xs font-semibold text-neutral-600 uppercase tracking-wider">PA</th>\n                    </tr>\n                </thead>\n                <tbody class="bg-white divide-y divide-neutral-200">\n                    '
+        l_1_loop = missing
+        for l_1_row, l_1_loop in LoopContext(environment.getattr((undefined(name='timeline') if l_0_timeline is missing else l_0_timeline), 'players'), undefined):
+            _loop_vars = {}
+            pass
+            yield '\n                        <tr class="hover:bg-primary-light/20 transition duration-150">\n                            <th scope="row" class="px-3 py-2 whitespace-nowrap text-left font-medium text-primary-medium hover:text-primary-dark hover:underline">\n                                <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr(l_1_row, 'player_id'), _loop_vars=_loop_vars))
+            yield '">'
+            yield escape(environment.getattr(l_1_row, 'name'))
+            yield '</a>\n                            </th>\n                            '
+            l_2_loop = missing
+            for l_2_week, l_2_loop in LoopContext(environment.getattr((undefined(name='timeline') if l_0_timeline is missing else l_0_timeline), 'weeks'), undefined):
+                l_2_k = missing
+                _loop_vars = {}
+                pass
+                yield '\n                                '
+                l_2_k = environment.getattr(l_2_loop, 'index0')
+                _loop_vars['k'] = l_2_k
+                yield '\n                                <td class="px-3 py-2 whitespace-nowrap text-center text-neutral-700"\n                                    title="'
+                yield escape(environment.getattr(l_1_row, 'name'))
+                yield ' after week '
+                yield escape(l_2_week)
+                yield ': '
+                yield escape(environment.getitem(environment.getattr(l_1_row, 'wins'), (undefined(name='k') if l_2_k is missing else l_2_k)))
+                yield '-'
+                yield escape(environment.getitem(environment.getattr(l_1_row, 'losses'), (undefined(name='k') if l_2_k is missing else l_2_k)))
+                if environment.getitem(environment.getattr(l_1_row, 'ties'), (undefined(name='k') if l_2_k is missing else l_2_k)):
+                    pass
+                    yield '-'
+                    yield escape(environment.getitem(environment.getattr(l_1_row, 'ties'), (undefined(name='k') if l_2_k is missing else l_2_k)))
+                yield ', '
+                yield escape(environment.getitem(environment.getattr(l_1_row, 'points_for'), (undefined(name='k') if l_2_k is missing else l_2_k)))
+                yield ' PF'
+                if (not t_1(environment.getitem(environment.getattr(l_1_row, 'scores'), (undefined(name='k') if l_2_k is missing else l_2_k)))):
+                    pass
+                    yield ' ('
+                    yield escape(environment.getitem(environment.getattr(l_1_row, 'scores'), (undefined(name='k') if l_2_k is missing else l_2_k)))
+                    yield ' this week)'
+                yield '">\n                                    '
+                yield escape(environment.getitem(environment.getattr(l_1_row, 'rank'), (undefined(name='k') if l_2_k is missing else l_2_k)))
+                if ((undefined(name='k') if l_2_k is missing else l_2_k) and (environment.getitem(environment.getattr(l_1_row, 'rank'), (undefined(name='k') if l_2_k is missing else l_2_k)) < environment.getitem(environment.getattr(l_1_row, 'rank'), ((undefined(name='k') if l_2_k is missing else l_2_k) - 1)))):
+                    pass
+                    yield '<span class="text-green-600 text-xs">&#9650;</span>'
+                elif ((undefined(name='k') if l_2_k is missing else l_2_k) and (environment.getitem(environment.getattr(l_1_row, 'rank'), (undefined(name='k') if l_2_k is missing else l_2_k)) > environment.getitem(environment.getattr(l_1_row, 'rank'), ((undefined(name='k') if l_2_k is missing else l_2_k) - 1)))):
+                    pass
+                    yield '<span class="text-red-600 text-xs">&#9660;</span>'
+                yield '\n                                </td>\n                            '
+            l_2_loop = l_2_week = l_2_k = missing
+            yield '\n                            <td class="px-3 py-2 whitespace-nowrap text-center font-semibold text-neutral-800">'
+            yield escape(environment.getitem(environment.getattr(l_1_row, 'wins'), -1))
+            yield '-'
+            yield escape(environment.getitem(environment.getattr(l_1_row, 'losses'), -1))
+            if environment.getitem(environment.getattr(l_1_row, 'ties'), -1):
+                pass
+                yield '-'
+                yield escape(environment.getitem(environment.getattr(l_1_row, 'ties'), -1))
+            yield '</td>\n                            <td class="px-3 py-2 whitespace-nowrap text-center text-neutral-600">'
+            yield escape(environment.getitem(environment.getattr(l_1_row, 'points_for'), -1))
+            yield '</td>\n                            <td class="px-3 py-2 whitespace-nowrap text-center text-neutral-600">'
+            yield escape(environment.getitem(environment.getattr(l_1_row, 'points_against'), -1))
+            yield '</td>\n                        </tr>\n                    '
+        l_1_loop = l_1_row = missing
+        yield '\n                </tbody>\n            </table>\n        </div>\n\n        <h2 class="text-2xl font-semibold font-heading mb-2 text-neutral-700">All-Play Power Rankings</h2>\n        <p class="text-sm text-neutral-500 mb-4">Each week\'s score against every other team that week. The power ranking orders teams by all-play win share to date, whoever they actually played.</p>\n        <div class="overflow-x-auto shadow-md rounded-lg border border-neutral-200/80">\n            <table class="min-w-full divide-y divide-neutral-200 text-sm">\n                <thead class="bg-neutral-100">\n                    <tr>\n                        <th scope="col" class="px-3 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Player</th>\n                        '
+        for l_1_week in environment.getattr((undefined(name='timeline') if l_0_timeline is missing else l_0_timeline), 'weeks'):
+            _loop_vars = {}
+            pass
+            yield '\n                            <th scope="col" class="px-3 py-3 text-center text-xs font-semibold text-neutral-600 uppercase tracking-wider">Wk '
+            yield escape(l_1_week)
+            yield '</th>\n                        '
+        l_1_week = missing
+        yield '\n                        <th scope="col" class="px-3 py-3 text-center text-xs font-semibold text-neutral-600 uppercase tracking-wider">All-Play (W-L-T)</th>\n                        <th scope="col" class="px-3 py-3 text-center text-xs font-semibold text-neutral-600 uppercase tracking-wider">Standing</th>\n                    </tr>\n                </thead>\n                <tbody class="bg-white divide-y divide-neutral-200">\n                    '
+        l_1_loop = missing
+        for l_1_row, l_1_loop in LoopContext((undefined(name='power_order') if l_0_power_order is missing else l_0_power_order), undefined):
+            _loop_vars = {}
+            pass
+            yield '\n                        <tr class="hover:bg-primary-light/20 transition duration-150">\n                            <th scope="row" class="px-3 py-2 whitespace-nowrap text-left font-medium text-primary-medium hover:text-primary-dark hover:underline">\n                                <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr(l_1_row, 'player_id'), _loop_vars=_loop_vars))
+            yield '">'
+            yield escape(environment.getattr(l_1_row, 'name'))
+            yield '</a>\n                            </th>\n                            '
+            l_2_loop = missing
+            for l_2_week, l_2_loop in LoopContext(environment.getattr((undefined(name='timeline') if l_0_timeline is missing else l_0_timeline), 'weeks'), undefined):
+                l_2_k = missing
+                _loop_vars = {}
+                pass
+                yield '\n                                '
+                l_2_k = environment.getattr(l_2_loop, 'index0')
+                _loop_vars['k'] = l_2_k
+                yield '\n                                <td class="px-3 py-2 whitespace-nowrap text-center text-neutral-700"\n                                    title="'
+                yield escape(environment.getattr(l_1_row, 'name'))
+                yield ' after week '
+                yield escape(l_2_week)
+                yield ': '
+                yield escape(environment.getitem(environment.getattr(l_1_row, 'all_play_wins'), (undefined(name='k') if l_2_k is missing else l_2_k)))
+                yield '-'
+                yield escape(environment.getitem(environment.getattr(l_1_row, 'all_play_losses'), (undefined(name='k') if l_2_k is missing else l_2_k)))
+                yield '-'
+                yield escape(environment.getitem(environment.getattr(l_1_row, 'all_play_ties'), (undefined(name='k') if l_2_k is missing else l_2_k)))
+                yield ' all-play">'
+                yield escape(environment.getitem(environment.getattr(l_1_row, 'power_rank'), (undefined(name='k') if l_2_k is missing else l_2_k)))
+                yield '</td>\n                            '
+            l_2_loop = l_2_week = l_2_k = missing
+            yield '\n                            <td class="px-3 py-2 whitespace-nowrap text-center font-semibold text-neutral-800">'
+            yield escape(environment.getitem(environment.getattr(l_1_row, 'all_play_wins'), -1))
+            yield '-'
+            yield escape(environment.getitem(environment.getattr(l_1_row, 'all_play_losses'), -1))
+            yield '-'
+            yield escape(environment.getitem(environment.getattr(l_1_row, 'all_play_ties'), -1))
+            yield '</td>\n                            <td class="px-3 py-2 whitespace-nowrap text-center text-neutral-600">'
+            yield escape(environment.getitem(environment.getattr(l_1_row, 'rank'), -1))
+            yield '</td>\n                        </tr>\n                    '
+        l_1_loop = l_1_row = missing
+        yield '\n                </tbody>\n            </table>\n        </div>\n    '
+    else:
+        pass
+        yield '\n        <p class="text-neutral-500">No regular-season games found for the '
+        yield escape((undefined(name='year') if l_0_year is missing else l_0_year))
+        yield ' season.</p>\n    '
+    yield '\n\n    <div class="mt-6 flex gap-4">\n        <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'season_detail', year=(undefined(name='year') if l_0_year is missing else l_0_year), _block_vars=_block_vars))
+    yield '" class="text-sm text-primary-medium hover:text-primary-dark hover:underline">&larr; Back to '
+    yield escape((undefined(name='year') if l_0_year is missing else l_0_year))
+    yield ' Season</a>\n        <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'season_timeline_json', year=(undefined(name='year') if l_0_year is missing else l_0_year), _block_vars=_block_vars))
+    yield '" class="text-sm text-primary-medium hover:text-primary-dark hover:underline">JSON</a>\n    </div>\n</div>\n'
+
+blocks = {'title': block_title, 'content': block_content}
+debug_info = '1=12&3=17&5=29&7=48&9=50&17=53&19=57&28=64&31=68&33=73&34=78&36=81&37=101&40=111&41=119&42=121&56=125&57=129&64=134&67=138&69=143&70=148&72=151&74=165&75=171&82=178&86=181&87=185'
\ No newline at end of file
@@ -0,0 +1,48 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = '404.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', '404.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Page Not Found - Fantasy League'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_error_description = resolve('error_description')
+    l_0_url_for = resolve('url_for')
+    pass
+    yield '\n<div class="bg-white p-8 rounded-lg shadow-md text-center">\n    <h1 class="text-6xl font-bold text-red-600 mb-4">404</h1>\n    <h2 class="text-2xl font-semibold text-gray-800 mb-4">Oops! Page Not Found</h2>\n    <p class="text-gray-600 mb-6">\n        Sorry, the page you are looking for doesn\'t exist or has been moved.\n        '
+    if (undefined(name='error_description') if l_0_error_description is missing else l_0_error_description):
+        pass
+        yield '\n            <br><em>('
+        yield escape((undefined(name='error_description') if l_0_error_description is missing else l_0_error_description))
+        yield ')</em>\n        '
+    yield '\n    </p>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'index', _block_vars=_block_vars))
+    yield '"\n       class="inline-block bg-indigo-600 hover:bg-indigo-700 text-white font-bold py-2 px-4 rounded transition duration-200">\n        Go Back Home\n    </a>\n</div>\n'
+
+blocks = {'title': block_title, 'content': block_content}
+debug_info = '1=12&3=17&5=27&11=38&12=41&15=44'
\ No newline at end of file
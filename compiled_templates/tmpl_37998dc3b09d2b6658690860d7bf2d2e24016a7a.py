@@ -0,0 +1,799 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'record_book.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'record_book.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'League Record Book - Full Service Fantasy League'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_records = resolve('records')
+    l_0_float = resolve('float')
+    l_0_lc_p1s_numeric = resolve('lc_p1s_numeric')
+    l_0_lc_p2s_numeric = resolve('lc_p2s_numeric')
+    l_0_lm_p1s_numeric = resolve('lm_p1s_numeric')
+    l_0_lm_p2s_numeric = resolve('lm_p2s_numeric')
+    l_0_lm_winner_name = resolve('lm_winner_name')
+    l_0_lm_loser_name = resolve('lm_loser_name')
+    l_0_lpm_p1s_numeric = resolve('lpm_p1s_numeric')
+    l_0_lpm_p2s_numeric = resolve('lpm_p2s_numeric')
+    l_0_lpm_winner_name = resolve('lpm_winner_name')
+    l_0_lpm_loser_name = resolve('lpm_loser_name')
+    l_0_sm_p1s_numeric = resolve('sm_p1s_numeric')
+    l_0_sm_p2s_numeric = resolve('sm_p2s_numeric')
+    l_0_sm_winner_name = resolve('sm_winner_name')
+    l_0_sm_loser_name = resolve('sm_loser_name')
+    l_0_cpg_p1s_numeric = resolve('cpg_p1s_numeric')
+    l_0_cpg_p2s_numeric = resolve('cpg_p2s_numeric')
+    l_0_cpg_winner_name = resolve('cpg_winner_name')
+    l_0_cpg_loser_name = resolve('cpg_loser_name')
+    try:
+        t_1 = environment.filters['capitalize']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'capitalize' found.")
+    try:
+        t_2 = environment.filters['float']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'float' found.")
+    try:
+        t_3 = environment.filters['join']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'join' found.")
+    try:
+        t_4 = environment.filters['map']
+    except KeyError:
+        @internalcode
+        def t_4(*unused):
+            raise TemplateRuntimeError("No filter named 'map' found.")
+    try:
+        t_5 = environment.filters['replace']
+    except KeyError:
+        @internalcode
+        def t_5(*unused):
+            raise TemplateRuntimeError("No filter named 'replace' found.")
+    try:
+        t_6 = environment.filters['round']
+    except KeyError:
+        @internalcode
+        def t_6(*unused):
+            raise TemplateRuntimeError("No filter named 'round' found.")
+    try:
+        t_7 = environment.tests['none']
+    except KeyError:
+        @internalcode
+        def t_7(*unused):
+            raise TemplateRuntimeError("No test named 'none' found.")
+    pass
+    yield '\n<div class="bg-white p-6 rounded-xl shadow-lg border border-gray-200 mb-8">\n    <h1 class="text-3xl font-bold mb-6 text-primary-dark border-b pb-2">League Record Book</h1>\n\n    <div class="grid grid-cols-1 md:grid-cols-2 gap-6">\n\n        <div class="bg-gray-50 p-4 rounded-lg border border-gray-200 shadow-sm">\n            <h2 class="text-xl font-semibold mb-3 text-indigo-700">Single Week Records</h2>\n            <ul class="space-y-3 text-sm">\n                <li>\n                    <span class="font-medium text-gray-600 block">Highest Score (Reg Season):</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_reg') and ((environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_reg'), 'score') != 0.0) or (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_reg'), 'player_name') != 'N/A'))):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-green-700">'
+        yield escape(t_6(t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_reg'), 'score')), 2))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_reg'), 'player_name'))
+        yield ' (vs '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_reg'), 'opponent_name'))
+        yield ', Week '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_reg'), 'week'))
+        yield ', '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_reg'), 'year'))
+        yield ')</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n\n                <li>\n                    <span class="font-medium text-gray-600 block">Highest Score (Playoffs - Single Week):</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_playoff') and ((environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_playoff'), 'score') != 0.0) or (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_playoff'), 'player_name') != 'N/A'))):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-green-700">'
+        yield escape(t_6(t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_playoff'), 'score')), 2))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_playoff'), 'player_name'))
+        yield ' (vs '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_playoff'), 'opponent_name'))
+        yield ', '
+        yield escape(t_1(t_5(context.eval_ctx, environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_playoff'), 'game_type'), '_', ' ')))
+        yield ', '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_score_playoff'), 'year'))
+        yield ')</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n\n                <li>\n                    <span class="font-medium text-gray-600 block">Lowest Score (Single Week):</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_score') and (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_score'), 'score') != context.call((undefined(name='float') if l_0_float is missing else l_0_float), 'inf', _block_vars=_block_vars))):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-red-700">'
+        yield escape(t_6(t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_score'), 'score')), 2))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_score'), 'player_name'))
+        yield ' (vs '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_score'), 'opponent_name'))
+        yield ', Week '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_score'), 'week'))
+        yield ', '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_score'), 'year'))
+        yield ')</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                <li>\n                    <span class="font-medium text-gray-600 block">Lowest Combined Score (Single Week):</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_combined_score') and (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_combined_score'), 'combined_score') != context.call((undefined(name='float') if l_0_float is missing else l_0_float), 'inf', _block_vars=_block_vars))):
+        pass
+        yield '\n                        '
+        l_0_lc_p1s_numeric = t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_combined_score'), 'player1_score'), default=None)
+        _block_vars['lc_p1s_numeric'] = l_0_lc_p1s_numeric
+        yield '\n                        '
+        l_0_lc_p2s_numeric = t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_combined_score'), 'player2_score'), default=None)
+        _block_vars['lc_p2s_numeric'] = l_0_lc_p2s_numeric
+        yield '\n                        <span class="text-lg font-semibold text-rose-700">'
+        yield escape(t_6(t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_combined_score'), 'combined_score')), 2))
+        yield '</span>\n                        <span class="text-gray-800">\n                            ('
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_combined_score'), 'p1_name'))
+        yield ' '
+        if (not t_7((undefined(name='lc_p1s_numeric') if l_0_lc_p1s_numeric is missing else l_0_lc_p1s_numeric))):
+            pass
+            yield escape(t_6((undefined(name='lc_p1s_numeric') if l_0_lc_p1s_numeric is missing else l_0_lc_p1s_numeric), 2))
+        else:
+            pass
+            yield 'N/A'
+        yield ' vs\n                             '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_combined_score'), 'p2_name'))
+        yield ' '
+        if (not t_7((undefined(name='lc_p2s_numeric') if l_0_lc_p2s_numeric is missing else l_0_lc_p2s_numeric))):
+            pass
+            yield escape(t_6((undefined(name='lc_p2s_numeric') if l_0_lc_p2s_numeric is missing else l_0_lc_p2s_numeric), 2))
+        else:
+            pass
+            yield 'N/A'
+        yield ',\n                             Week '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_combined_score'), 'week_start'))
+        yield ', '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'low_combined_score'), 'year'))
+        yield ')\n                        </span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n\n                <li>\n                    <span class="font-medium text-gray-600 block">Largest Margin of Victory (Single Week):</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov') and ((environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'margin') != 0.0) or (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'p1_name') != 'N/A'))):
+        pass
+        yield '\n                        '
+        l_0_lm_p1s_numeric = t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'player1_score'), default=None)
+        _block_vars['lm_p1s_numeric'] = l_0_lm_p1s_numeric
+        yield '\n                        '
+        l_0_lm_p2s_numeric = t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'player2_score'), default=None)
+        _block_vars['lm_p2s_numeric'] = l_0_lm_p2s_numeric
+        yield '\n                        '
+        l_0_lm_winner_name = 'N/A'
+        _block_vars['lm_winner_name'] = l_0_lm_winner_name
+        yield '\n                        '
+        l_0_lm_loser_name = 'N/A'
+        _block_vars['lm_loser_name'] = l_0_lm_loser_name
+        yield '\n\n                        '
+        if ((not t_7((undefined(name='lm_p1s_numeric') if l_0_lm_p1s_numeric is missing else l_0_lm_p1s_numeric))) and (not t_7((undefined(name='lm_p2s_numeric') if l_0_lm_p2s_numeric is missing else l_0_lm_p2s_numeric)))):
+            pass
+            yield '\n                            '
+            if ((undefined(name='lm_p1s_numeric') if l_0_lm_p1s_numeric is missing else l_0_lm_p1s_numeric) > (undefined(name='lm_p2s_numeric') if l_0_lm_p2s_numeric is missing else l_0_lm_p2s_numeric)):
+                pass
+                yield '\n                                '
+                l_0_lm_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'p1_name')
+                _block_vars['lm_winner_name'] = l_0_lm_winner_name
+                yield '\n                                '
+                l_0_lm_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'p2_name')
+                _block_vars['lm_loser_name'] = l_0_lm_loser_name
+                yield '\n                            '
+            elif ((undefined(name='lm_p2s_numeric') if l_0_lm_p2s_numeric is missing else l_0_lm_p2s_numeric) > (undefined(name='lm_p1s_numeric') if l_0_lm_p1s_numeric is missing else l_0_lm_p1s_numeric)):
+                pass
+                yield '\n                                '
+                l_0_lm_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'p2_name')
+                _block_vars['lm_winner_name'] = l_0_lm_winner_name
+                yield '\n                                '
+                l_0_lm_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'p1_name')
+                _block_vars['lm_loser_name'] = l_0_lm_loser_name
+                yield '\n                            '
+            else:
+                pass
+                yield ' \n                                '
+                l_0_lm_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'p1_name')
+                _block_vars['lm_winner_name'] = l_0_lm_winner_name
+                yield ' \n                                '
+                l_0_lm_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'p2_name')
+                _block_vars['lm_loser_name'] = l_0_lm_loser_name
+                yield '\n                            '
+            yield '\n                        '
+        elif (not t_7((undefined(name='lm_p1s_numeric') if l_0_lm_p1s_numeric is missing else l_0_lm_p1s_numeric))):
+            pass
+            yield ' \n                            '
+            l_0_lm_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'p1_name')
+            _block_vars['lm_winner_name'] = l_0_lm_winner_name
+            yield '\n                            '
+            l_0_lm_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'p2_name')
+            _block_vars['lm_loser_name'] = l_0_lm_loser_name
+            yield '\n                        '
+        elif (not t_7((undefined(name='lm_p2s_numeric') if l_0_lm_p2s_numeric is missing else l_0_lm_p2s_numeric))):
+            pass
+            yield ' \n                            '
+            l_0_lm_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'p2_name')
+            _block_vars['lm_winner_name'] = l_0_lm_winner_name
+            yield '\n                            '
+            l_0_lm_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'p1_name')
+            _block_vars['lm_loser_name'] = l_0_lm_loser_name
+            yield '\n                        '
+        yield '\n\n                        <span class="text-lg font-semibold text-blue-700">'
+        yield escape(t_6(t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'margin')), 2))
+        yield ' points</span>\n                        <span class="text-gray-800">\n                            by '
+        yield escape((undefined(name='lm_winner_name') if l_0_lm_winner_name is missing else l_0_lm_winner_name))
+        yield ' over '
+        yield escape((undefined(name='lm_loser_name') if l_0_lm_loser_name is missing else l_0_lm_loser_name))
+        yield '\n                            ('
+        if (not t_7((undefined(name='lm_p1s_numeric') if l_0_lm_p1s_numeric is missing else l_0_lm_p1s_numeric))):
+            pass
+            yield escape(t_6((undefined(name='lm_p1s_numeric') if l_0_lm_p1s_numeric is missing else l_0_lm_p1s_numeric), 2))
+        else:
+            pass
+            yield 'N/A'
+        yield ' -\n                             '
+        if (not t_7((undefined(name='lm_p2s_numeric') if l_0_lm_p2s_numeric is missing else l_0_lm_p2s_numeric))):
+            pass
+            yield escape(t_6((undefined(name='lm_p2s_numeric') if l_0_lm_p2s_numeric is missing else l_0_lm_p2s_numeric), 2))
+        else:
+            pass
+            yield 'N/A'
+        yield ',\n                             Week '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'week_start'))
+        yield ', '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_mov'), 'year'))
+        yield ')\n                        </span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                <li>\n                    <span class="font-medium text-gray-600 block">Largest Playoff MOV (Single Week):</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov') and ((environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'margin') != 0.0) or (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'p1_name') != 'N/A'))):
+        pass
+        yield '\n                        \n                        '
+        l_0_lpm_p1s_numeric = t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'player1_score'), default=None)
+        _block_vars['lpm_p1s_numeric'] = l_0_lpm_p1s_numeric
+        yield '\n                        '
+        l_0_lpm_p2s_numeric = t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'player2_score'), default=None)
+        _block_vars['lpm_p2s_numeric'] = l_0_lpm_p2s_numeric
+        yield '\n                        '
+        l_0_lpm_winner_name = 'N/A'
+        _block_vars['lpm_winner_name'] = l_0_lpm_winner_name
+        yield '\n                        '
+        l_0_lpm_loser_name = 'N/A'
+        _block_vars['lpm_loser_name'] = l_0_lpm_loser_name
+        yield '\n\n                        '
+        if ((not t_7((undefined(name='lpm_p1s_numeric') if l_0_lpm_p1s_numeric is missing else l_0_lpm_p1s_numeric))) and (not t_7((undefined(name='lpm_p2s_numeric') if l_0_lpm_p2s_numeric is missing else l_0_lpm_p2s_numeric)))):
+            pass
+            yield '\n                            '
+            if ((undefined(name='lpm_p1s_numeric') if l_0_lpm_p1s_numeric is missing else l_0_lpm_p1s_numeric) > (undefined(name='lpm_p2s_numeric') if l_0_lpm_p2s_numeric is missing else l_0_lpm_p2s_numeric)):
+                pass
+                yield '\n                                '
+                l_0_lpm_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'p1_name')
+                _block_vars['lpm_winner_name'] = l_0_lpm_winner_name
+                yield '\n                                '
+                l_0_lpm_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'p2_name')
+                _block_vars['lpm_loser_name'] = l_0_lpm_loser_name
+                yield '\n                            '
+            elif ((undefined(name='lpm_p2s_numeric') if l_0_lpm_p2s_numeric is missing else l_0_lpm_p2s_numeric) > (undefined(name='lpm_p1s_numeric') if l_0_lpm_p1s_numeric is missing else l_0_lpm_p1s_numeric)):
+                pass
+                yield '\n                                '
+                l_0_lpm_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'p2_name')
+                _block_vars['lpm_winner_name'] = l_0_lpm_winner_name
+                yield '\n                                '
+                l_0_lpm_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'p1_name')
+                _block_vars['lpm_loser_name'] = l_0_lpm_loser_name
+                yield '\n                            '
+            else:
+                pass
+                yield ' \n                                '
+                l_0_lpm_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'p1_name')
+                _block_vars['lpm_winner_name'] = l_0_lpm_winner_name
+                yield '\n                                '
+                l_0_lpm_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'p2_name')
+                _block_vars['lpm_loser_name'] = l_0_lpm_loser_name
+                yield '\n                            '
+            yield '\n                        '
+        elif (not t_7((undefined(name='lpm_p1s_numeric') if l_0_lpm_p1s_numeric is missing else l_0_lpm_p1s_numeric))):
+            pass
+            yield ' \n                            '
+            l_0_lpm_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'p1_name')
+            _block_vars['lpm_winner_name'] = l_0_lpm_winner_name
+            yield '\n                            '
+            l_0_lpm_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'p2_name')
+            _block_vars['lpm_loser_name'] = l_0_lpm_loser_name
+            yield '\n                        '
+        elif (not t_7((undefined(name='lpm_p2s_numeric') if l_0_lpm_p2s_numeric is missing else l_0_lpm_p2s_numeric))):
+            pass
+            yield ' \n                            '
+            l_0_lpm_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'p2_name')
+            _block_vars['lpm_winner_name'] = l_0_lpm_winner_name
+            yield '\n                            '
+            l_0_lpm_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'p1_name')
+            _block_vars['lpm_loser_name'] = l_0_lpm_loser_name
+            yield '\n                        '
+        yield '\n\n                        <span class="text-lg font-semibold text-indigo-700">'
+        yield escape(t_6(t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'margin')), 2))
+        yield ' points</span>\n                        <span class="text-gray-800">\n                            by '
+        yield escape((undefined(name='lpm_winner_name') if l_0_lpm_winner_name is missing else l_0_lpm_winner_name))
+        yield ' over '
+        yield escape((undefined(name='lpm_loser_name') if l_0_lpm_loser_name is missing else l_0_lpm_loser_name))
+        yield '\n                            ('
+        if (not t_7((undefined(name='lpm_p1s_numeric') if l_0_lpm_p1s_numeric is missing else l_0_lpm_p1s_numeric))):
+            pass
+            yield escape(t_6((undefined(name='lpm_p1s_numeric') if l_0_lpm_p1s_numeric is missing else l_0_lpm_p1s_numeric), 2))
+        else:
+            pass
+            yield 'N/A'
+        yield ' -\n                             '
+        if (not t_7((undefined(name='lpm_p2s_numeric') if l_0_lpm_p2s_numeric is missing else l_0_lpm_p2s_numeric))):
+            pass
+            yield escape(t_6((undefined(name='lpm_p2s_numeric') if l_0_lpm_p2s_numeric is missing else l_0_lpm_p2s_numeric), 2))
+        else:
+            pass
+            yield 'N/A'
+        yield ',\n                             '
+        yield escape(t_1(t_5(context.eval_ctx, environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'game_type'), '_', ' ')))
+        yield ', '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'largest_playoff_mov'), 'year'))
+        yield ')\n                        </span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n\n                 <li>\n                    <span class="font-medium text-gray-600 block">Smallest Margin of Victory (Single Week):</span>\n                     '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov') and (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'margin') != context.call((undefined(name='float') if l_0_float is missing else l_0_float), 'inf', _block_vars=_block_vars))):
+        pass
+        yield '\n                        '
+        l_0_sm_p1s_numeric = t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'player1_score'), default=None)
+        _block_vars['sm_p1s_numeric'] = l_0_sm_p1s_numeric
+        yield '\n                        '
+        l_0_sm_p2s_numeric = t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'player2_score'), default=None)
+        _block_vars['sm_p2s_numeric'] = l_0_sm_p2s_numeric
+        yield '\n                        '
+        l_0_sm_winner_name = 'N/A'
+        _block_vars['sm_winner_name'] = l_0_sm_winner_name
+        yield '\n                        '
+        l_0_sm_loser_name = 'N/A'
+        _block_vars['sm_loser_name'] = l_0_sm_loser_name
+        yield '\n\n                        '
+        if ((not t_7((undefined(name='sm_p1s_numeric') if l_0_sm_p1s_numeric is missing else l_0_sm_p1s_numeric))) and (not t_7((undefined(name='sm_p2s_numeric') if l_0_sm_p2s_numeric is missing else l_0_sm_p2s_numeric)))):
+            pass
+            yield '\n                            '
+            if ((undefined(name='sm_p1s_numeric') if l_0_sm_p1s_numeric is missing else l_0_sm_p1s_numeric) > (undefined(name='sm_p2s_numeric') if l_0_sm_p2s_numeric is missing else l_0_sm_p2s_numeric)):
+                pass
+                yield '\n                                '
+                l_0_sm_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'p1_name')
+                _block_vars['sm_winner_name'] = l_0_sm_winner_name
+                yield '\n                                '
+                l_0_sm_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'p2_name')
+                _block_vars['sm_loser_name'] = l_0_sm_loser_name
+                yield '\n                            '
+            elif ((undefined(name='sm_p2s_numeric') if l_0_sm_p2s_numeric is missing else l_0_sm_p2s_numeric) > (undefined(name='sm_p1s_numeric') if l_0_sm_p1s_numeric is missing else l_0_sm_p1s_numeric)):
+                pass
+                yield '\n                                '
+                l_0_sm_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'p2_name')
+                _block_vars['sm_winner_name'] = l_0_sm_winner_name
+                yield '\n                                '
+                l_0_sm_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'p1_name')
+                _block_vars['sm_loser_name'] = l_0_sm_loser_name
+                yield '\n                            '
+            else:
+                pass
+                yield '\n                                '
+                l_0_sm_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'p1_name')
+                _block_vars['sm_winner_name'] = l_0_sm_winner_name
+                yield '\n                                '
+                l_0_sm_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'p2_name')
+                _block_vars['sm_loser_name'] = l_0_sm_loser_name
+                yield '\n                            '
+            yield '\n                        '
+        elif (not t_7((undefined(name='sm_p1s_numeric') if l_0_sm_p1s_numeric is missing else l_0_sm_p1s_numeric))):
+            pass
+            yield '\n                            '
+            l_0_sm_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'p1_name')
+            _block_vars['sm_winner_name'] = l_0_sm_winner_name
+            yield '\n                            '
+            l_0_sm_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'p2_name')
+            _block_vars['sm_loser_name'] = l_0_sm_loser_name
+            yield '\n                        '
+        elif (not t_7((undefined(name='sm_p2s_numeric') if l_0_sm_p2s_numeric is missing else l_0_sm_p2s_numeric))):
+            pass
+            yield '\n                            '
+            l_0_sm_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'p2_name')
+            _block_vars['sm_winner_name'] = l_0_sm_winner_name
+            yield '\n                            '
+            l_0_sm_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'p1_name')
+            _block_vars['sm_loser_name'] = l_0_sm_loser_name
+            yield '\n                        '
+        yield '\n                        <span class="text-lg font-semibold text-orange-700">'
+        yield escape(t_6(t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'margin')), 2))
+        yield ' points</span>\n                         <span class="text-gray-800">\n                            by '
+        yield escape((undefined(name='sm_winner_name') if l_0_sm_winner_name is missing else l_0_sm_winner_name))
+        yield ' over '
+        yield escape((undefined(name='sm_loser_name') if l_0_sm_loser_name is missing else l_0_sm_loser_name))
+        yield '\n                            ('
+        if (not t_7((undefined(name='sm_p1s_numeric') if l_0_sm_p1s_numeric is missing else l_0_sm_p1s_numeric))):
+            pass
+            yield escape(t_6((undefined(name='sm_p1s_numeric') if l_0_sm_p1s_numeric is missing else l_0_sm_p1s_numeric), 2))
+        else:
+            pass
+            yield 'N/A'
+        yield ' -\n                             '
+        if (not t_7((undefined(name='sm_p2s_numeric') if l_0_sm_p2s_numeric is missing else l_0_sm_p2s_numeric))):
+            pass
+            yield escape(t_6((undefined(name='sm_p2s_numeric') if l_0_sm_p2s_numeric is missing else l_0_sm_p2s_numeric), 2))
+        else:
+            pass
+            yield 'N/A'
+        yield ',\n                             Week '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'week_start'))
+        yield ', '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'smallest_mov'), 'year'))
+        yield ')\n                        </span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n\n                 <li>\n                    <span class="font-medium text-gray-600 block">Closest Playoff Game (Single Week):</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game') and (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'margin') != context.call((undefined(name='float') if l_0_float is missing else l_0_float), 'inf', _block_vars=_block_vars))):
+        pass
+        yield '\n                        '
+        l_0_cpg_p1s_numeric = t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'player1_score'), default=None)
+        _block_vars['cpg_p1s_numeric'] = l_0_cpg_p1s_numeric
+        yield '\n                        '
+        l_0_cpg_p2s_numeric = t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'player2_score'), default=None)
+        _block_vars['cpg_p2s_numeric'] = l_0_cpg_p2s_numeric
+        yield '\n                        '
+        l_0_cpg_winner_name = 'N/A'
+        _block_vars['cpg_winner_name'] = l_0_cpg_winner_name
+        yield '\n                        '
+        l_0_cpg_loser_name = 'N/A'
+        _block_vars['cpg_loser_name'] = l_0_cpg_loser_name
+        yield '\n\n                        '
+        if ((not t_7((undefined(name='cpg_p1s_numeric') if l_0_cpg_p1s_numeric is missing else l_0_cpg_p1s_numeric))) and (not t_7((undefined(name='cpg_p2s_numeric') if l_0_cpg_p2s_numeric is missing else l_0_cpg_p2s_numeric)))):
+            pass
+            yield '\n                            '
+            if ((undefined(name='cpg_p1s_numeric') if l_0_cpg_p1s_numeric is missing else l_0_cpg_p1s_numeric) > (undefined(name='cpg_p2s_numeric') if l_0_cpg_p2s_numeric is missing else l_0_cpg_p2s_numeric)):
+                pass
+                yield '\n                                '
+                l_0_cpg_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'p1_name')
+                _block_vars['cpg_winner_name'] = l_0_cpg_winner_name
+                yield '\n                                '
+                l_0_cpg_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'p2_name')
+                _block_vars['cpg_loser_name'] = l_0_cpg_loser_name
+                yield '\n                            '
+            elif ((undefined(name='cpg_p2s_numeric') if l_0_cpg_p2s_numeric is missing else l_0_cpg_p2s_numeric) > (undefined(name='cpg_p1s_numeric') if l_0_cpg_p1s_numeric is missing else l_0_cpg_p1s_numeric)):
+                pass
+                yield '\n                                '
+                l_0_cpg_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'p2_name')
+                _block_vars['cpg_winner_name'] = l_0_cpg_winner_name
+                yield '\n                                '
+                l_0_cpg_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'p1_name')
+                _block_vars['cpg_loser_name'] = l_0_cpg_loser_name
+                yield '\n                            '
+            else:
+                pass
+                yield '\n                                '
+                l_0_cpg_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'p1_name')
+                _block_vars['cpg_winner_name'] = l_0_cpg_winner_name
+                yield '\n                                '
+                l_0_cpg_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'p2_name')
+                _block_vars['cpg_loser_name'] = l_0_cpg_loser_name
+                yield '\n                            '
+            yield '\n                        '
+        elif (not t_7((undefined(name='cpg_p1s_numeric') if l_0_cpg_p1s_numeric is missing else l_0_cpg_p1s_numeric))):
+            pass
+            yield '\n                            '
+            l_0_cpg_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'p1_name')
+            _block_vars['cpg_winner_name'] = l_0_cpg_winner_name
+            yield '\n                            '
+            l_0_cpg_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'p2_name')
+            _block_vars['cpg_loser_name'] = l_0_cpg_loser_name
+            yield '\n                        '
+        elif (not t_7((undefined(name='cpg_p2s_numeric') if l_0_cpg_p2s_numeric is missing else l_0_cpg_p2s_numeric))):
+            pass
+            yield '\n                            '
+            l_0_cpg_winner_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'p2_name')
+            _block_vars['cpg_winner_name'] = l_0_cpg_winner_name
+            yield '\n                            '
+            l_0_cpg_loser_name = environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'p1_name')
+            _block_vars['cpg_loser_name'] = l_0_cpg_loser_name
+            yield '\n                        '
+        yield '\n                        <span class="text-lg font-semibold text-purple-700">'
+        yield escape(t_6(t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'margin')), 2))
+        yield ' points</span>\n                         <span class="text-gray-800">\n                            by '
+        yield escape((undefined(name='cpg_winner_name') if l_0_cpg_winner_name is missing else l_0_cpg_winner_name))
+        yield ' over '
+        yield escape((undefined(name='cpg_loser_name') if l_0_cpg_loser_name is missing else l_0_cpg_loser_name))
+        yield '\n                            ('
+        if (not t_7((undefined(name='cpg_p1s_numeric') if l_0_cpg_p1s_numeric is missing else l_0_cpg_p1s_numeric))):
+            pass
+            yield escape(t_6((undefined(name='cpg_p1s_numeric') if l_0_cpg_p1s_numeric is missing else l_0_cpg_p1s_numeric), 2))
+        else:
+            pass
+            yield 'N/A'
+        yield ' -\n                             '
+        if (not t_7((undefined(name='cpg_p2s_numeric') if l_0_cpg_p2s_numeric is missing else l_0_cpg_p2s_numeric))):
+            pass
+            yield escape(t_6((undefined(name='cpg_p2s_numeric') if l_0_cpg_p2s_numeric is missing else l_0_cpg_p2s_numeric), 2))
+        else:
+            pass
+            yield 'N/A'
+        yield ',\n                             '
+        yield escape(t_1(t_5(context.eval_ctx, environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'game_type'), '_', ' ')))
+        yield ', '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'closest_playoff_game'), 'year'))
+        yield ')\n                        </span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n            </ul>\n        </div>\n\n        <div class="bg-gray-50 p-4 rounded-lg border border-gray-200 shadow-sm">\n            <h2 class="text-xl font-semibold mb-3 text-indigo-700">Season & Career Records</h2>\n             <ul class="space-y-3 text-sm">\n                 <li>\n                    <span class="font-medium text-gray-600 block">Most Points For (Single Season):</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_pf_season') and ((environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_pf_season'), 'value') != 0.0) or (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_pf_season'), 'player_name') != 'N/A'))):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-green-700">'
+        yield escape(t_6(t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_pf_season'), 'value')), 2))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_pf_season'), 'player_name'))
+        yield ' ('
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_pf_season'), 'year'))
+        yield ')</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                <li>\n                    <span class="font-medium text-gray-600 block">Lowest Points For (Single Season):</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'lowest_pf_season') and (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'lowest_pf_season'), 'value') != context.call((undefined(name='float') if l_0_float is missing else l_0_float), 'inf', _block_vars=_block_vars))):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-red-700">'
+        yield escape(t_6(t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'lowest_pf_season'), 'value')), 2))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'lowest_pf_season'), 'player_name'))
+        yield ' ('
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'lowest_pf_season'), 'year'))
+        yield ')</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                <li>\n                    <span class="font-medium text-gray-600 block">Most Points Against (Single Season):</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_pa_season') and ((environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_pa_season'), 'value') != 0.0) or (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_pa_season'), 'player_name') != 'N/A'))):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-orange-700">'
+        yield escape(t_6(t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_pa_season'), 'value')), 2))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_pa_season'), 'player_name'))
+        yield ' ('
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_pa_season'), 'year'))
+        yield ')</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                <li>\n                    <span class="font-medium text-gray-600 block">Highest Points Per Game Avg (Single Season):</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_ppg_season') and ((environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_ppg_season'), 'value') != 0.0) or (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_ppg_season'), 'player_name') != 'N/A'))):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-green-700">'
+        yield escape(t_6(t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_ppg_season'), 'value')), 2))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_ppg_season'), 'player_name'))
+        yield ' ('
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'high_ppg_season'), 'year'))
+        yield ')</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                 <li>\n                    <span class="font-medium text-gray-600 block">Lowest Points Per Game Avg (Single Season):</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'lowest_ppg_season') and (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'lowest_ppg_season'), 'value') != context.call((undefined(name='float') if l_0_float is missing else l_0_float), 'inf', _block_vars=_block_vars))):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-red-700">'
+        yield escape(t_6(t_2(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'lowest_ppg_season'), 'value')), 2))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'lowest_ppg_season'), 'player_name'))
+        yield ' ('
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'lowest_ppg_season'), 'year'))
+        yield ')</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                <li>\n                    <span class="font-medium text-gray-600 block">Best Regular Season Record:</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'best_season_rec') and (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'best_season_rec'), 'player_name') != 'N/A')):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-blue-700">'
+        yield escape((environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'best_season_rec'), 'regular_season_record') or context.call(environment.getattr('{w}-{l}-{t}', 'format'), w=environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'best_season_rec'), 'wins'), l=environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'best_season_rec'), 'losses'), t=environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'best_season_rec'), 'ties'), _block_vars=_block_vars)))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'best_season_rec'), 'player_name'))
+        yield ' ('
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'best_season_rec'), 'year'))
+        yield ')</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                 <li>\n                    <span class="font-medium text-gray-600 block">Worst Regular Season Record:</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'worst_season_rec') and (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'worst_season_rec'), 'player_name') != 'N/A')):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-red-700">'
+        yield escape((environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'worst_season_rec'), 'regular_season_record') or context.call(environment.getattr('{w}-{l}-{t}', 'format'), w=environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'worst_season_rec'), 'wins'), l=environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'worst_season_rec'), 'losses'), t=environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'worst_season_rec'), 'ties'), _block_vars=_block_vars)))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'worst_season_rec'), 'player_name'))
+        yield ' ('
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'worst_season_rec'), 'year'))
+        yield ')</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                <li>\n                    <span class="font-medium text-gray-600 block">Longest Winning Streak (Single Season):</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'longest_win_streak') and (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'longest_win_streak'), 'streak') > 0)):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-emerald-700">'
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'longest_win_streak'), 'streak'))
+        yield ' games</span>\n                        <span class="text-gray-800">by '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'longest_win_streak'), 'player_name'))
+        yield ' ('
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'longest_win_streak'), 'details'))
+        yield ')</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                 <li>\n                    <span class="font-medium text-gray-600 block">Longest Losing Streak (Single Season):</span>\n                    '
+    if (environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'longest_loss_streak') and (environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'longest_loss_streak'), 'streak') > 0)):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-rose-700">'
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'longest_loss_streak'), 'streak'))
+        yield ' games</span>\n                        <span class="text-gray-800">by '
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'longest_loss_streak'), 'player_name'))
+        yield ' ('
+        yield escape(environment.getattr(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'longest_loss_streak'), 'details'))
+        yield ')</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                <li>\n                    <span class="font-medium text-gray-600 block">Most Points For (Career):</span>\n                    '
+    if environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_career_pf'):
+        pass
+        yield ' \n                        <span class="text-lg font-semibold text-emerald-700">'
+        yield escape(context.call(environment.getattr('{:,.2f}', 'format'), t_2(environment.getattr(environment.getitem(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_career_pf'), 0), 'count')), _block_vars=_block_vars))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(t_3(context.eval_ctx, t_4(context, environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_career_pf'), attribute='player_name'), ', '))
+        yield '</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                 <li>\n                    <span class="font-medium text-gray-600 block">Highest PPG Avg (Career):</span>\n                    '
+    if environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'highest_career_ppg'):
+        pass
+        yield ' \n                        <span class="text-lg font-semibold text-emerald-700">'
+        yield escape(t_6(t_2(environment.getattr(environment.getitem(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'highest_career_ppg'), 0), 'count')), 2))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(t_3(context.eval_ctx, t_4(context, environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'highest_career_ppg'), attribute='player_name'), ', '))
+        yield '</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                <li>\n                    <span class="font-medium text-gray-600 block">Most Championships (Career):</span>\n                    '
+    if environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_championships'):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-amber-700">'
+        yield escape(environment.getattr(environment.getitem(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_championships'), 0), 'count'))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(t_3(context.eval_ctx, t_4(context, environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_championships'), attribute='player_name'), ', '))
+        yield '</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                 <li>\n                    <span class="font-medium text-gray-600 block">Most Championship Appearances (Career):</span>\n                    '
+    if environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_champ_appearances'):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-amber-600">'
+        yield escape(environment.getattr(environment.getitem(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_champ_appearances'), 0), 'count'))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(t_3(context.eval_ctx, t_4(context, environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_champ_appearances'), attribute='player_name'), ', '))
+        yield '</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                <li>\n                    <span class="font-medium text-gray-600 block">Most Playoff Appearances (Career):</span>\n                    '
+    if environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_playoffs'):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-cyan-700">'
+        yield escape(environment.getattr(environment.getitem(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_playoffs'), 0), 'count'))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(t_3(context.eval_ctx, t_4(context, environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_playoffs'), attribute='player_name'), ', '))
+        yield '</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                 <li>\n                    <span class="font-medium text-gray-600 block">Most Toilet Bowl Wins (Career):</span>\n                    '
+    if environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_toilet_wins'):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-lime-700">'
+        yield escape(environment.getattr(environment.getitem(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_toilet_wins'), 0), 'count'))
+        yield ' 🚽</span>\n                        <span class="text-gray-800">by '
+        yield escape(t_3(context.eval_ctx, t_4(context, environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_toilet_wins'), attribute='player_name'), ', '))
+        yield '</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                 <li>\n                    <span class="font-medium text-gray-600 block">Most Toilet Bowl Losses (Career):</span>\n                    '
+    if environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_toilet_losses'):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-rose-700">'
+        yield escape(environment.getattr(environment.getitem(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_toilet_losses'), 0), 'count'))
+        yield ' 💩</span>\n                        <span class="text-gray-800">by '
+        yield escape(t_3(context.eval_ctx, t_4(context, environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_toilet_losses'), attribute='player_name'), ', '))
+        yield '</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n                 <li>\n                    <span class="font-medium text-gray-600 block">Most Toilet Bowl Appearances (Career):</span>\n                    '
+    if environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_toilet_appearances'):
+        pass
+        yield '\n                        <span class="text-lg font-semibold text-gray-600">'
+        yield escape(environment.getattr(environment.getitem(environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_toilet_appearances'), 0), 'count'))
+        yield '</span>\n                        <span class="text-gray-800">by '
+        yield escape(t_3(context.eval_ctx, t_4(context, environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'most_toilet_appearances'), attribute='player_name'), ', '))
+        yield '</span>\n                    '
+    else:
+        pass
+        yield '\n                        <span class="text-gray-500">N/A</span>\n                    '
+    yield '\n                </li>\n\n             </ul>\n        </div>\n    </div>\n\n    <div class="mt-6 bg-gray-50 p-4 rounded-lg border border-gray-200 shadow-sm">\n        <h2 class="text-xl font-semibold mb-1 text-indigo-700">All-Time Streaks (Across Seasons)</h2>\n        <p class="text-xs text-gray-500 mb-3">Regular-season games; a streak carries over from the end of one season into the next.</p>\n        <div class="grid grid-cols-1 md:grid-cols-3 gap-6">\n            '
+    for l_1_group in environment.getattr((undefined(name='records') if l_0_records is missing else l_0_records), 'all_time_streaks'):
+        _loop_vars = {}
+        pass
+        yield '\n            <div>\n                <h3 class="font-medium text-gray-600 mb-2">'
+        yield escape(environment.getattr(l_1_group, 'label'))
+        yield '</h3>\n                '
+        if environment.getattr(l_1_group, 'leaders'):
+            pass
+            yield '\n                <ol class="space-y-1 text-sm">\n                    '
+            for l_2_s in environment.getattr(l_1_group, 'leaders'):
+                l_2_url_for = resolve('url_for')
+                _loop_vars = {}
+                pass
+                yield '\n                    <li>\n                        <span class="font-semibold text-gray-800">'
+                yield escape(environment.getattr(l_2_s, 'streak'))
+                yield '</span>\n                        <a href="'
+                yield escape(context.call((undefined(name='url_for') if l_2_url_for is missing else l_2_url_for), 'player_detail', player_id=environment.getattr(l_2_s, 'player_id'), _loop_vars=_loop_vars))
+                yield '" class="text-indigo-700 hover:underline">'
+                yield escape(environment.getattr(l_2_s, 'player_name'))
+                yield '</a>\n                        <span class="text-gray-500">('
+                yield escape(environment.getattr(l_2_s, 'details'))
+                yield ')</span>\n                        '
+                if environment.getattr(l_2_s, 'active'):
+                    pass
+                    yield '<span class="ml-1 bg-emerald-100 text-emerald-800 px-1.5 py-0.5 rounded text-xs font-semibold">Active</span>'
+                yield '\n                    </li>\n                    '
+            l_2_s = l_2_url_for = missing
+            yield '\n                </ol>\n                '
+        else:
+            pass
+            yield '\n                <span class="text-gray-500">N/A</span>\n                '
+        yield '\n            </div>\n            '
+    l_1_group = missing
+    yield '\n        </div>\n    </div>\n</div>\n'
+
+blocks = {'title': block_title, 'content': block_content}
+debug_info = '1=12&3=17&5=27&16=98&17=101&18=103&26=115&27=118&28=120&36=132&37=135&38=137&45=149&46=152&47=155&48=158&50=160&51=169&52=178&61=186&62=189&63=192&64=195&65=198&67=201&68=204&69=207&70=210&71=213&72=216&73=219&75=225&76=228&78=232&79=235&80=238&81=241&82=244&83=247&86=251&88=253&89=257&90=264&91=271&99=279&101=282&102=285&103=288&104=291&106=294&107=297&108=300&109=303&110=306&111=309&112=312&114=318&115=321&117=325&118=328&119=331&120=334&121=337&122=340&125=344&127=346&128=350&129=357&130=364&139=372&140=375&141=378&142=381&143=384&145=387&146=390&147=393&148=396&149=399&150=402&151=405&153=411&154=414&156=418&157=421&158=424&159=427&160=430&161=433&163=437&165=439&166=443&167=450&168=457&177=465&178=468&179=471&180=474&181=477&183=480&184=483&185=486&186=489&187=492&188=495&189=498&191=504&192=507&194=511&195=514&196=517&197=520&198=523&199=526&201=530&203=532&204=536&205=543&206=550&220=558&221=561&222=563&229=571&230=574&231=576&238=584&239=587&240=589&247=597&248=600&249=602&256=610&257=613&258=615&265=623&266=626&267=628&274=636&275=639&276=641&283=649&284=652&285=654&292=662&293=665&294=667&301=675&302=678&303=680&310=686&311=689&312=691&319=697&320=700&321=702&328=708&329=711&330=713&337=719&338=722&339=724&346=730&347=733&348=735&355=741&356=744&357=746&364=752&365=755&366=757&380=763&382=767&383=769&385=772&387=777&388=779&389=783&390=785'
\ No newline at end of file
@@ -0,0 +1,376 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'player_detail.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'player_detail.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_player_name = resolve('player_name')
+    pass
+    yield escape((undefined(name='player_name') if l_0_player_name is missing else l_0_player_name))
+    yield ' - Player Details - Full Service Fantasy League'
+
+def block_head(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_super = context.super('head', block_head)
+    _block_vars = {}
+    pass
+    yield '\n    '
+    yield escape(context.call(l_0_super, _block_vars=_block_vars))
+    yield " \n    <style>\n        .chart-container {\n            position: relative;\n            height: 280px; /* Slightly increased height */\n            width: 100%;\n            max-width: 700px; /* Slightly increased max-width */\n            margin-left: auto;\n            margin-right: auto;\n            padding: 0.5rem; /* Added padding inside container */\n        }\n        .player-image {\n            width: 100px;\n            height: 100px;\n            object-fit: cover;\n            object-position: center top;\n            border-radius: 0.375rem; /* rounded-md */\n            /* Referencing primary.medium color directly as an example if needed elsewhere, but JS will use hex */\n            border: 3px solid #0d9488; /* primary-medium from your config */\n            box-shadow: 0 4px 6px -1px rgba(0,0,0,0.1), 0 2px 4px -1px rgba(0,0,0,0.06); /* shadow-md */\n            cursor: pointer;\n        }\n        /* Style for the placeholder text if chart doesn't load */\n        .chart-placeholder-text {\n            display: flex;\n            align-items: center;\n            justify-content: center;\n            height: 100%;\n            color: #64748b; /* neutral-500 from your config */\n            font-size: 0.875rem; /* text-sm */\n        }\n    </style>\n"
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_url_for = resolve('url_for')
+    l_0_player_id = resolve('player_id')
+    l_0_player_name = resolve('player_name')
+    l_0_championship_wins = resolve('championship_wins')
+    l_0_runner_up_finishes = resolve('runner_up_finishes')
+    l_0_third_place_finishes = resolve('third_place_finishes')
+    l_0_toilet_bowl_wins = resolve('toilet_bowl_wins')
+    l_0_toilet_bowl_losses = resolve('toilet_bowl_losses')
+    l_0_career_stats = resolve('career_stats')
+    l_0_player_records = resolve('player_records')
+    l_0_streaks = resolve('streaks')
+    l_0_history = resolve('history')
+    try:
+        t_1 = environment.filters['default']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'default' found.")
+    try:
+        t_2 = environment.filters['join']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'join' found.")
+    try:
+        t_3 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    try:
+        t_4 = environment.filters['list']
+    except KeyError:
+        @internalcode
+        def t_4(*unused):
+            raise TemplateRuntimeError("No filter named 'list' found.")
+    try:
+        t_5 = environment.filters['map']
+    except KeyError:
+        @internalcode
+        def t_5(*unused):
+            raise TemplateRuntimeError("No filter named 'map' found.")
+    try:
+        t_6 = environment.filters['round']
+    except KeyError:
+        @internalcode
+        def t_6(*unused):
+            raise TemplateRuntimeError("No filter named 'round' found.")
+    try:
+        t_7 = environment.filters['selectattr']
+    except KeyError:
+        @internalcode
+        def t_7(*unused):
+            raise TemplateRuntimeError("No filter named 'selectattr' found.")
+    try:
+        t_8 = environment.filters['string']
+    except KeyError:
+        @internalcode
+        def t_8(*unused):
+            raise TemplateRuntimeError("No filter named 'string' found.")
+    try:
+        t_9 = environment.filters['upper']
+    except KeyError:
+        @internalcode
+        def t_9(*unused):
+            raise TemplateRuntimeError("No filter named 'upper' found.")
+    try:
+        t_10 = environment.tests['defined']
+    except KeyError:
+        @internalcode
+        def t_10(*unused):
+            raise TemplateRuntimeError("No test named 'defined' found.")
+    pass
+    yield '\n<div class="bg-white p-6 rounded-xl shadow-xl border border-neutral-200/80 mb-8 card-hover-effect">\n    <div class="flex flex-col sm:flex-row items-center sm:items-end mb-6 border-b border-neutral-300 pb-6">\n         <img\n            src="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename=(('images/players/' + t_8((undefined(name='player_id') if l_0_player_id is missing else l_0_player_id))) + '.png'), _block_vars=_block_vars))
+    yield '"\n            alt="'
+    yield escape((undefined(name='player_name') if l_0_player_name is missing else l_0_player_name))
+    yield '\'s profile picture"\n            class="player-image mb-4 sm:mb-0 sm:mr-6"\n            onerror="this.onerror=null; this.src=\'https://placehold.co/100x100/e2e8f0/94a3b8?text='
+    yield escape((t_9(environment.getitem((undefined(name='player_name') if l_0_player_name is missing else l_0_player_name), 0)) if (undefined(name='player_name') if l_0_player_name is missing else l_0_player_name) else 'P'))
+    yield '\'; this.classList.add(\'bg-neutral-300\');"\n            onclick="openModal(this)"\n          >\n        <h1 class="text-3xl lg:text-4xl font-bold font-heading text-primary-dark text-center sm:text-left">'
+    yield escape((undefined(name='player_name') if l_0_player_name is missing else l_0_player_name))
+    yield '</h1>\n    </div>\n\n    <div class="mb-8 flex flex-wrap gap-3 items-center">\n        '
+    if (undefined(name='championship_wins') if l_0_championship_wins is missing else l_0_championship_wins):
+        pass
+        yield '\n            <div class="bg-amber-100 text-amber-800 px-3 py-1.5 rounded-full text-xs sm:text-sm font-semibold shadow-sm flex items-center" title="'
+        yield escape(t_2(context.eval_ctx, t_5(context, (undefined(name='championship_wins') if l_0_championship_wins is missing else l_0_championship_wins), attribute='year'), ', '))
+        yield '">\n                <span class="mr-1.5">🏆</span> Championships: '
+        yield escape(t_3((undefined(name='championship_wins') if l_0_championship_wins is missing else l_0_championship_wins)))
+        yield '\n            </div>\n        '
+    yield '\n        '
+    if (undefined(name='runner_up_finishes') if l_0_runner_up_finishes is missing else l_0_runner_up_finishes):
+        pass
+        yield '\n             <div class="bg-neutral-200 text-neutral-700 px-3 py-1.5 rounded-full text-xs sm:text-sm font-semibold shadow-sm flex items-center" title="'
+        yield escape(t_2(context.eval_ctx, t_5(context, (undefined(name='runner_up_finishes') if l_0_runner_up_finishes is missing else l_0_runner_up_finishes), attribute='year'), ', '))
+        yield '">\n                <span class="mr-1.5">🥈</span> Runner-up: '
+        yield escape(t_3((undefined(name='runner_up_finishes') if l_0_runner_up_finishes is missing else l_0_runner_up_finishes)))
+        yield '\n            </div>\n        '
+    yield '\n        '
+    if (undefined(name='third_place_finishes') if l_0_third_place_finishes is missing else l_0_third_place_finishes):
+        pass
+        yield '\n             <div class="bg-orange-100 text-orange-800 px-3 py-1.5 rounded-full text-xs sm:text-sm font-semibold shadow-sm flex items-center" title="'
+        yield escape(t_2(context.eval_ctx, t_5(context, (undefined(name='third_place_finishes') if l_0_third_place_finishes is missing else l_0_third_place_finishes), attribute='year'), ', '))
+        yield '">\n                <span class="mr-1.5">🥉</span> 3rd Place: '
+        yield escape(t_3((undefined(name='third_place_finishes') if l_0_third_place_finishes is missing else l_0_third_place_finishes)))
+        yield '\n            </div>\n        '
+    yield '\n        '
+    if (t_10((undefined(name='toilet_bowl_wins') if l_0_toilet_bowl_wins is missing else l_0_toilet_bowl_wins)) and ((undefined(name='toilet_bowl_wins') if l_0_toilet_bowl_wins is missing else l_0_toilet_bowl_wins) > 0)):
+        pass
+        yield '\n             <div class="bg-lime-100 text-lime-800 px-3 py-1.5 rounded-full text-xs sm:text-sm font-semibold shadow-sm flex items-center">\n                <span class="mr-1.5">🚽</span> Toilet Wins: '
+        yield escape((undefined(name='toilet_bowl_wins') if l_0_toilet_bowl_wins is missing else l_0_toilet_bowl_wins))
+        yield '\n            </div>\n        '
+    yield '\n         '
+    if (t_10((undefined(name='toilet_bowl_losses') if l_0_toilet_bowl_losses is missing else l_0_toilet_bowl_losses)) and ((undefined(name='toilet_bowl_losses') if l_0_toilet_bowl_losses is missing else l_0_toilet_bowl_losses) > 0)):
+        pass
+        yield '\n             <div class="bg-rose-100 text-rose-800 px-3 py-1.5 rounded-full text-xs sm:text-sm font-semibold shadow-sm flex items-center">\n                <span class="mr-1.5">💩</span> Toilet Losses: '
+        yield escape((undefined(name='toilet_bowl_losses') if l_0_toilet_bowl_losses is missing else l_0_toilet_bowl_losses))
+        yield '\n            </div>\n        '
+    yield '\n        '
+    if ((undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats) and environment.getattr((undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats), 'playoff_appearances')):
+        pass
+        yield '\n         <div class="bg-green-100 text-green-800 px-3 py-1.5 rounded-full text-xs sm:text-sm font-semibold shadow-sm">\n            Playoff Apps: '
+        yield escape(environment.getattr((undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats), 'playoff_appearances'))
+        yield '\n         </div>\n        '
+    yield '\n        '
+    if ((undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats) and environment.getattr((undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats), 'seasons_played')):
+        pass
+        yield '\n         <div class="bg-blue-100 text-blue-800 px-3 py-1.5 rounded-full text-xs sm:text-sm font-semibold shadow-sm">\n            Seasons: '
+        yield escape(environment.getattr((undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats), 'seasons_played'))
+        yield '\n         </div>\n        '
+    yield '\n         '
+    if (undefined(name='player_records') if l_0_player_records is missing else l_0_player_records):
+        pass
+        yield '\n            '
+        if (environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'best_rank') and environment.getattr(environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'best_rank'), 'value')):
+            pass
+            yield '\n                <div class="bg-sky-100 text-sky-800 px-3 py-1.5 rounded-full text-xs sm:text-sm font-semibold shadow-sm">\n                    Best Rank: '
+            yield escape(environment.getattr(environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'best_rank'), 'value'))
+            yield ' ('
+            yield escape(environment.getattr(environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'best_rank'), 'year'))
+            yield ')\n                </div>\n            '
+        yield '\n             '
+        if (environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'worst_rank') and environment.getattr(environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'worst_rank'), 'value')):
+            pass
+            yield '\n                <div class="bg-red-100 text-red-800 px-3 py-1.5 rounded-full text-xs sm:text-sm font-semibold shadow-sm">\n                    Worst Rank: '
+            yield escape(environment.getattr(environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'worst_rank'), 'value'))
+            yield ' ('
+            yield escape(environment.getattr(environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'worst_rank'), 'year'))
+            yield ')\n                </div>\n            '
+        yield '\n             '
+        if (environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'highest_pf') and environment.getattr(environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'highest_pf'), 'value')):
+            pass
+            yield '\n                <div class="bg-emerald-100 text-emerald-800 px-3 py-1.5 rounded-full text-xs sm:text-sm font-semibold shadow-sm">\n                    Top Season PF: '
+            yield escape(t_6(environment.getattr(environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'highest_pf'), 'value'), 2))
+            yield ' ('
+            yield escape(environment.getattr(environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'highest_pf'), 'year'))
+            yield ')\n                </div>\n            '
+        yield '\n             '
+        if (environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'highest_ppg') and environment.getattr(environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'highest_ppg'), 'value')):
+            pass
+            yield '\n                 <div class="bg-teal-100 text-teal-800 px-3 py-1.5 rounded-full text-xs sm:text-sm font-semibold shadow-sm">\n                    Top Season PPG: '
+            yield escape(t_6(environment.getattr(environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'highest_ppg'), 'value'), 2))
+            yield ' ('
+            yield escape(environment.getattr(environment.getattr((undefined(name='player_records') if l_0_player_records is missing else l_0_player_records), 'highest_ppg'), 'year'))
+            yield ')\n                </div>\n             '
+        yield '\n         '
+    yield '\n    </div>\n\n    '
+    if (undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats):
+        pass
+        yield '\n    <div class="mb-10 bg-neutral-50 p-4 sm:p-6 rounded-lg border border-neutral-200/70 shadow-md">\n        <h2 class="text-xl font-semibold font-heading mb-4 text-neutral-700">Career Summary (Regular Season)</h2>\n        <div class="grid grid-cols-2 md:grid-cols-3 gap-x-4 gap-y-5 text-sm">\n            <div>\n                <span class="font-medium text-neutral-600 block">Record (W-L-T):</span>\n                <span class="text-lg font-semibold text-neutral-800">'
+        yield escape(t_1(environment.getattr((undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats), 'total_wins'), 0, True))
+        yield '-'
+        yield escape(t_1(environment.getattr((undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats), 'total_losses'), 0, True))
+        yield '-'
+        yield escape(t_1(environment.getattr((undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats), 'total_ties'), 0, True))
+        yield '</span>\n                 <span class="text-xs text-neutral-500 block">('
+        yield escape(t_6(t_1(environment.getattr((undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats), 'win_percentage'), 0, True), 1))
+        yield '% Win Rate)</span>\n            </div>\n            <div>\n                <span class="font-medium text-neutral-600 block">Total Points For:</span>\n                <span class="text-lg font-semibold text-green-700">'
+        yield escape(context.call(environment.getattr('{:,.2f}', 'format'), t_1(environment.getattr((undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats), 'total_pf'), 0.0, True), _block_vars=_block_vars))
+        yield '</span>\n            </div>\n             <div>\n                <span class="font-medium text-neutral-600 block">Total Points Against:</span>\n                <span class="text-lg font-semibold text-red-700">'
+        yield escape(context.call(environment.getattr('{:,.2f}', 'format'), t_1(environment.getattr((undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats), 'total_pa'), 0.0, True), _block_vars=_block_vars))
+        yield '</span>\n            </div>\n            <div>\n                <span class="font-medium text-neutral-600 block">Avg PF / Season:</span>\n                <span class="text-lg font-semibold text-neutral-800">'
+        yield escape(t_6(t_1(environment.getattr((undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats), 'avg_pf_per_season'), 0.0, True), 2))
+        yield '</span>\n            </div>\n             <div>\n                <span class="font-medium text-neutral-600 block">Avg PA / Season:</span>\n                <span class="text-lg font-semibold text-neutral-800">'
+        yield escape(t_6(t_1(environment.getattr((undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats), 'avg_pa_per_season'), 0.0, True), 2))
+        yield '</span>\n            </div>\n             <div>\n                <span class="font-medium text-neutral-600 block">Average Rank:</span>\n                <span class="text-lg font-semibold text-neutral-800">'
+        yield escape(t_6(t_1(environment.getattr((undefined(name='career_stats') if l_0_career_stats is missing else l_0_career_stats), 'avg_rank'), 0, True), 2))
+        yield '</span>\n            </div>\n        </div>\n    </div>\n    '
+    yield '\n\n    '
+    if ((undefined(name='streaks') if l_0_streaks is missing else l_0_streaks) and t_4(context.eval_ctx, t_7(context, (undefined(name='streaks') if l_0_streaks is missing else l_0_streaks), 'longest'))):
+        pass
+        yield '\n    <div class="mb-10 bg-neutral-50 p-4 sm:p-6 rounded-lg border border-neutral-200/70 shadow-md">\n        <h2 class="text-xl font-semibold font-heading mb-4 text-neutral-700">Streaks (Regular Season, Across Seasons)</h2>\n        <div class="grid grid-cols-1 md:grid-cols-3 gap-x-4 gap-y-5 text-sm">\n            '
+        for l_1_s in (undefined(name='streaks') if l_0_streaks is missing else l_0_streaks):
+            _loop_vars = {}
+            pass
+            yield '\n            <div>\n                <span class="font-medium text-neutral-600 block">'
+            yield escape(environment.getattr(l_1_s, 'label'))
+            yield ':</span>\n                '
+            if (environment.getattr(l_1_s, 'current') and environment.getattr(environment.getattr(l_1_s, 'current'), 'active')):
+                pass
+                yield '\n                    <span class="text-lg font-semibold text-neutral-800">'
+                yield escape(environment.getattr(environment.getattr(l_1_s, 'current'), 'streak'))
+                yield ' active</span>\n                    <span class="text-xs text-neutral-500 block">(since '
+                yield escape(environment.getattr(environment.getattr(l_1_s, 'current'), 'start_year'))
+                yield ' Wk '
+                yield escape(environment.getattr(environment.getattr(l_1_s, 'current'), 'start_week'))
+                yield ')</span>\n                '
+            elif environment.getattr(l_1_s, 'current'):
+                pass
+                yield '\n                    <span class="text-lg font-semibold text-neutral-800">'
+                yield escape(environment.getattr(environment.getattr(l_1_s, 'current'), 'streak'))
+                yield ' at last game</span>\n                    <span class="text-xs text-neutral-500 block">('
+                yield escape(environment.getattr(environment.getattr(l_1_s, 'current'), 'details'))
+                yield ')</span>\n                '
+            else:
+                pass
+                yield '\n                    <span class="text-lg font-semibold text-neutral-400">None active</span>\n                '
+            yield '\n                '
+            if environment.getattr(l_1_s, 'longest'):
+                pass
+                yield '\n                    <span class="text-xs text-neutral-500 block">Longest: '
+                yield escape(environment.getattr(environment.getattr(l_1_s, 'longest'), 'streak'))
+                yield ' ('
+                yield escape(environment.getattr(environment.getattr(l_1_s, 'longest'), 'details'))
+                yield ')</span>\n                '
+            yield '\n            </div>\n            '
+        l_1_s = missing
+        yield '\n        </div>\n    </div>\n    '
+    yield '\n\n    <div class="mb-10 border-t border-neutral-300 pt-8">\n        <h2 class="text-2xl font-semibold font-heading mb-5 text-neutral-800">Rank History</h2>\n        <div class="chart-container bg-white p-3 sm:p-4 rounded-lg shadow-lg border border-neutral-200/80">\n            <canvas id="rankChart">\n                \n                <p class="chart-placeholder-text">Rank history chart will be displayed here.</p>\n            </canvas>\n        </div>\n    </div>\n\n    <div class="border-t border-neutral-300 pt-8">\n        <h2 class="text-2xl font-semibold font-heading mb-5 text-neutral-800">Season History</h2>\n        '
+    if (undefined(name='history') if l_0_history is missing else l_0_history):
+        pass
+        yield '\n            <div class="overflow-x-auto shadow-md rounded-lg border border-neutral-200/80">\n                <table class="min-w-full divide-y divide-neutral-200">\n                    <thead class="bg-neutral-100">\n                        <tr>\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Year</th>\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Rank</th>\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Record (W-L-T)</th>\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">PF</th>\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">PA</th>\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Playoffs?</th>\n                        </tr>\n                    </thead>\n                    <tbody class="bg-white divide-y divide-neutral-200">\n                        '
+        for l_1_season in (undefined(name='history') if l_0_history is missing else l_0_history):
+            l_1_toilet_bowl_history = resolve('toilet_bowl_history')
+            _loop_vars = {}
+            pass
+            yield '\n                            <tr class="hover:bg-primary-light/20 transition duration-150">\n                                <td class="px-4 py-3 whitespace-nowrap text-sm font-medium text-primary-medium hover:text-primary-dark hover:underline">\n                                    <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'season_detail', year=environment.getattr(l_1_season, 'year'), _loop_vars=_loop_vars))
+            yield '">'
+            yield escape(environment.getattr(l_1_season, 'year'))
+            yield '</a>\n                                </td>\n                                <td class="px-4 py-3 whitespace-nowrap text-sm font-medium '
+            if (environment.getattr(l_1_season, 'rank') == 1):
+                pass
+                yield 'text-amber-600'
+            elif (environment.getattr(l_1_season, 'rank') == 2):
+                pass
+                yield 'text-neutral-500'
+            elif (environment.getattr(l_1_season, 'rank') == 3):
+                pass
+                yield 'text-orange-600'
+            else:
+                pass
+                yield 'text-neutral-700'
+            yield '">\n                                    '
+            yield escape(t_1(environment.getattr(l_1_season, 'rank'), 'N/A', True))
+            yield '\n                                    '
+            if (environment.getattr(l_1_season, 'rank') == 1):
+                pass
+                yield ' <span title="Champion">🏆</span>\n                                    '
+            elif (environment.getattr(l_1_season, 'rank') == 2):
+                pass
+                yield ' <span title="Runner-up">🥈</span>\n                                    '
+            elif (environment.getattr(l_1_season, 'rank') == 3):
+                pass
+                yield ' <span title="3rd Place">🥉</span>\n                                    '
+            elif ((undefined(name='toilet_bowl_history') if l_1_toilet_bowl_history is missing else l_1_toilet_bowl_history) and (environment.getattr(l_1_season, 'year') in (undefined(name='toilet_bowl_history') if l_1_toilet_bowl_history is missing else l_1_toilet_bowl_history))):
+                pass
+                yield '\n                                        '
+                if (environment.getitem((undefined(name='toilet_bowl_history') if l_1_toilet_bowl_history is missing else l_1_toilet_bowl_history), environment.getattr(l_1_season, 'year')) == 'win'):
+                    pass
+                    yield ' <span title="Toilet Bowl Winner">🚽</span>\n                                        '
+                elif (environment.getitem((undefined(name='toilet_bowl_history') if l_1_toilet_bowl_history is missing else l_1_toilet_bowl_history), environment.getattr(l_1_season, 'year')) == 'loss'):
+                    pass
+                    yield ' <span title="Toilet Bowl Loser">💩</span>\n                                        '
+                yield '\n                                    '
+            yield '\n                                </td>\n                                <td class="px-4 py-3 whitespace-nowrap text-sm text-neutral-600">'
+            yield escape((environment.getattr(l_1_season, 'regular_season_record') or context.call(environment.getattr('{w}-{l}-{t}', 'format'), w=t_1(environment.getattr(l_1_season, 'wins'), 0, True), l=t_1(environment.getattr(l_1_season, 'losses'), 0, True), t=t_1(environment.getattr(l_1_season, 'ties'), 0, True), _loop_vars=_loop_vars)))
+            yield '</td>\n                                <td class="px-4 py-3 whitespace-nowrap text-sm text-neutral-600">\n                                    '
+            yield escape(t_6(t_1(environment.getattr(l_1_season, 'points_for'), 'N/A', True), 2))
+            yield '\n                                </td>\n                                <td class="px-4 py-3 whitespace-nowrap text-sm text-neutral-600">\n                                    '
+            yield escape(t_6(t_1(environment.getattr(l_1_season, 'points_against'), 'N/A', True), 2))
+            yield '\n                                </td>\n                                <td class="px-4 py-3 whitespace-nowrap text-sm">\n                                    '
+            if (environment.getattr(l_1_season, 'made_playoffs') == 1):
+                pass
+                yield '\n                                        <span class="px-2.5 py-0.5 inline-flex text-xs leading-5 font-semibold rounded-full bg-green-100 text-green-800">Yes</span>\n                                    '
+            elif (environment.getattr(l_1_season, 'made_playoffs') == 0):
+                pass
+                yield '\n                                         <span class="px-2.5 py-0.5 inline-flex text-xs leading-5 font-semibold rounded-full bg-red-100 text-red-800">No</span>\n                                    '
+            else:
+                pass
+                yield '\n                                        <span class="px-2.5 py-0.5 inline-flex text-xs leading-5 font-semibold rounded-full bg-neutral-100 text-neutral-800">N/A</span>\n                                    '
+            yield '\n                                </td>\n                            </tr>\n                        '
+        l_1_season = l_1_toilet_bowl_history = missing
+        yield '\n                    </tbody>\n                </table>\n            </div>\n        '
+    else:
+        pass
+        yield '\n            <p class="text-neutral-500 mt-4">No season history found for this player.</p>\n        '
+    yield '\n    </div>\n</div>\n'
+
+def block_scripts(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_super = context.super('scripts', block_scripts)
+    _block_vars = {}
+    l_0_history = resolve('history')
+    try:
+        t_11 = environment.filters['safe']
+    except KeyError:
+        @internalcode
+        def t_11(*unused):
+            raise TemplateRuntimeError("No filter named 'safe' found.")
+    try:
+        t_12 = environment.filters['tojson']
+    except KeyError:
+        @internalcode
+        def t_12(*unused):
+            raise TemplateRuntimeError("No filter named 'tojson' found.")
+    pass
+    yield '\n    '
+    yield escape(context.call(l_0_super, _block_vars=_block_vars))
+    yield '\n    <script>\n    document.addEventListener(\'DOMContentLoaded\', function() {\n        const ctx = document.getElementById(\'rankChart\');\n        if (!ctx) {\n            console.error("Chart canvas element not found!");\n            return;\n        }\n\n        // Define fonts and colors based on your Tailwind config (hardcoded for JS context)\n        const fontFamilySans = \'Inter, ui-sans-serif, system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, "Noto Sans", sans-serif\';\n        const fontFamilyHeading = \'Lexend, ui-sans-serif, system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, "Noto Sans", sans-serif\';\n        const colorPrimaryDefault = \'#14b8a6\'; // primary.DEFAULT\n        const colorPrimaryDark = \'#0f766e\';   // primary.dark\n        const colorNeutral200 = \'#e2e8f0\';  // neutral.200\n        const colorNeutral500 = \'#64748b\';  // neutral.500\n        const colorNeutral600 = \'#475569\';  // neutral.600\n        const colorNeutral700 = \'#334155\';  // neutral.700\n        const colorNeutral800 = \'#1e293b\';  // neutral.800\n\n\n        const historyData = '
+    yield escape(t_11(t_12(context.eval_ctx, (undefined(name='history') if l_0_history is missing else l_0_history))))
+    yield ';\n        if (!historyData || historyData.length === 0) {\n            const context = ctx.getContext(\'2d\');\n            ctx.parentElement.classList.add(\'chart-placeholder-text\');\n            context.font = "14px " + fontFamilySans;\n            context.fillStyle = colorNeutral500;\n            context.textAlign = \'center\';\n            context.fillText(\'No rank history data available to display.\', ctx.width / 2, ctx.height / 2);\n            return;\n        }\n\n        const reversedHistory = [...historyData].reverse();\n        const labels = reversedHistory.map(season => season.year);\n        const ranks = reversedHistory.map(season => (season.rank !== null && season.rank !== undefined) ? season.rank : null);\n        const validRanks = ranks.filter(r => r !== null);\n\n        if (validRanks.length > 0) {\n            let minRank = Math.min(...validRanks);\n            let maxRank = Math.max(...validRanks);\n            minRank = Math.max(1, minRank -1); \n            maxRank = Math.min(12, maxRank + 1); \n            if (minRank >= maxRank) {\n                minRank = 1;\n                maxRank = Math.max(10, maxRank); \n            }\n\n            new Chart(ctx, {\n                type: \'line\',\n                data: {\n                    labels: labels,\n                    datasets: [{\n                        label: \'Season Rank\',\n                        data: ranks,\n                        fill: false,\n                        borderColor: colorPrimaryDefault,\n                        backgroundColor: colorPrimaryDefault,\n                        tension: 0.1,\n                        pointRadius: 5,\n                        pointHoverRadius: 7,\n                        pointBackgroundColor: colorPrimaryDefault,\n                        pointBorderColor: \'#fff\',\n                        pointHoverBackgroundColor: colorPrimaryDark,\n                        pointHoverBorderColor: \'#fff\',\n                        spanGaps: true\n                    }]\n                },\n                options: {\n                    responsive: true,\n                    maintainAspectRatio: false,\n                    scales: {\n                        y: {\n                            reverse: true,\n                            beginAtZero: false,\n                            min: minRank,\n                            max: maxRank,\n                            ticks: {\n                                stepSize: 1,\n                                color: colorNeutral600,\n                                font: { family: fontFamilySans }\n                            },\n                            title: {\n                                display: true,\n                                text: \'Rank (Lower is Better)\',\n                                color: colorNeutral700,\n                                font: { size: 14, family: fontFamilyHeading }\n                            },\n                            grid: { color: colorNeutral200 }\n                        },\n                        x: {\n                            title: {\n                                display: true,\n                                text: \'Season Year\',\n                                color: colorNeutral700,\n                                font: { size: 14, family: fontFamilyHeading }\n                            },\n                            ticks: {\n                                color: colorNeutral600,\n                                font: { family: fontFamilySans }\n                            },\n                             grid: { display: false }\n                        }\n                    },\n                    plugins: {\n                        legend: { display: false },\n                        tooltip: {\n                            backgroundColor: colorNeutral800,\n                            titleFont: { family: fontFamilyHeading, size: 14 },\n                            bodyFont: { family: fontFamilySans, size: 12 },\n                            padding: 10,\n                            cornerRadius: 4,\n                            callbacks: {\n                                label: function(context) {\n                                    let label = context.dataset.label || \'\';\n                                    if (label) { label += \': \'; }\n                                    if (context.parsed.y !== null) {\n                                        label += context.parsed.y;\n                                    } else {\n                                        label += \'(No Rank Data)\';\n                                    }\n                                    return label;\n                                }\n                            }\n                        }\n                    }\n                }\n            });\n        } else if (ctx.getContext) {\n            const context = ctx.getContext(\'2d\');\n            ctx.parentElement.classList.add(\'chart-placeholder-text\');\n            context.font = "14px " + fontFamilySans;\n            context.fillStyle = colorNeutral500;\n            context.textAlign = \'center\';\n            const textX = ctx.parentElement.clientWidth / 2;\n            const textY = ctx.parentElement.clientHeight / 2;\n            context.fillText(\'No rank history data available to display.\', textX, textY);\n        }\n    });\n    </script>\n'
+
+blocks = {'title': block_title, 'head': block_head, 'content': block_content, 'scripts': block_scripts}
+debug_info = '1=12&3=17&5=29&6=39&41=42&45=123&46=125&48=127&51=129&55=131&56=134&57=136&60=139&61=142&62=144&65=147&66=150&67=152&70=155&72=158&75=161&77=164&80=167&82=170&85=173&87=176&90=179&91=182&93=185&96=190&98=193&101=198&103=201&106=206&108=209&114=215&120=218&121=224&125=226&129=228&133=230&137=232&141=234&147=237&151=240&153=244&154=246&155=249&156=251&157=255&158=258&159=260&163=266&164=269&184=277&198=280&201=285&203=289&204=302&205=304&206=307&207=310&208=313&209=316&210=319&214=324&216=326&219=328&222=330&224=333&242=347&243=370&264=372'
\ No newline at end of file
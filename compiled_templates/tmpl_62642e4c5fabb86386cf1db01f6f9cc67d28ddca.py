@@ -0,0 +1,341 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'head_to_head.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'head_to_head.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Head-to-Head - Fantasy League'
+
+def block_head(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_super = context.super('head', block_head)
+    _block_vars = {}
+    l_0_tailwind = resolve('tailwind')
+    pass
+    yield '\n    '
+    yield escape(context.call(l_0_super, _block_vars=_block_vars))
+    yield '\n    <style>\n        .h2h-player-image {\n            width: 40px; /* Smaller image for H2H display */\n            height: 40px;\n            object-fit: cover;\n            object-position: center top;\n            border-radius: 0.375rem; /* rounded-md */\n            border: 2px solid '
+    yield escape((environment.getattr(environment.getattr(environment.getattr(environment.getattr(environment.getattr(environment.getattr((undefined(name='tailwind') if l_0_tailwind is missing else l_0_tailwind), 'config'), 'theme'), 'extend'), 'colors'), 'primary'), 'medium') if (undefined(name='tailwind') if l_0_tailwind is missing else l_0_tailwind) else '#0d9488'))
+    yield '; /* Default to hex if tailwind object not available in style block context */\n            box-shadow: 0 1px 3px 0 rgba(0,0,0,0.1), 0 1px 2px 0 rgba(0,0,0,0.06); /* shadow-sm */\n            flex-shrink: 0; /* Prevent image from shrinking in flex layout */\n        }\n    </style>\n'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_url_for = resolve('url_for')
+    l_0_selected_p1_id = resolve('selected_p1_id')
+    l_0_players = resolve('players')
+    l_0_selected_p2_id = resolve('selected_p2_id')
+    l_0_error_message = resolve('error_message')
+    l_0_player1 = resolve('player1')
+    l_0_player2 = resolve('player2')
+    l_0_h2h_stats = resolve('h2h_stats')
+    l_0_rivalry_stats = resolve('rivalry_stats')
+    l_0_matchups = resolve('matchups')
+    l_0_request = resolve('request')
+    try:
+        t_1 = environment.filters['float']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'float' found.")
+    try:
+        t_2 = environment.filters['replace']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'replace' found.")
+    try:
+        t_3 = environment.filters['round']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'round' found.")
+    try:
+        t_4 = environment.filters['string']
+    except KeyError:
+        @internalcode
+        def t_4(*unused):
+            raise TemplateRuntimeError("No filter named 'string' found.")
+    try:
+        t_5 = environment.filters['upper']
+    except KeyError:
+        @internalcode
+        def t_5(*unused):
+            raise TemplateRuntimeError("No filter named 'upper' found.")
+    try:
+        t_6 = environment.tests['none']
+    except KeyError:
+        @internalcode
+        def t_6(*unused):
+            raise TemplateRuntimeError("No test named 'none' found.")
+    pass
+    yield '\n<div class="bg-white p-6 rounded-xl shadow-xl border border-neutral-200/80 mb-8 card-hover-effect">\n    <h1 class="text-3xl font-bold font-heading mb-6 text-primary-dark border-b border-neutral-300 pb-3">Head-to-Head Matchups</h1>\n    <p class="text-sm text-neutral-600 mb-4 -mt-2">Or see every rivalry at once in the <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'head_to_head_matrix', _block_vars=_block_vars))
+    yield '" class="text-primary-medium hover:text-primary-dark hover:underline">league matrix</a>.</p>\n\n    <form id="h2hForm" method="GET" action="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'head_to_head', _block_vars=_block_vars))
+    yield '" class="mb-8 bg-neutral-50 p-4 rounded-lg border border-neutral-200/70 shadow-sm">\n        <div class="flex flex-col sm:flex-row items-center sm:items-end gap-4">\n            <div class="flex-grow w-full sm:w-auto">\n                <label for="player1_id" class="block text-sm font-medium text-neutral-700 mb-1">Player 1:</label>\n                <select name="player1_id" id="player1_id" required\n                        class="w-full px-3 py-2 border border-neutral-300 rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-primary-medium focus:border-primary-medium text-sm">\n                    <option value="" disabled '
+    if (not (undefined(name='selected_p1_id') if l_0_selected_p1_id is missing else l_0_selected_p1_id)):
+        pass
+        yield 'selected'
+    yield '>Select Player 1</option>\n                    '
+    for l_1_p in (undefined(name='players') if l_0_players is missing else l_0_players):
+        _loop_vars = {}
+        pass
+        yield '\n                        <option value="'
+        yield escape(environment.getattr(l_1_p, 'player_id'))
+        yield '" '
+        if (environment.getattr(l_1_p, 'player_id') == (undefined(name='selected_p1_id') if l_0_selected_p1_id is missing else l_0_selected_p1_id)):
+            pass
+            yield 'selected'
+        yield '>'
+        yield escape(environment.getattr(l_1_p, 'name'))
+        yield '</option>\n                    '
+    l_1_p = missing
+    yield '\n                </select>\n            </div>\n            <div class="text-center text-neutral-600 font-bold pt-1 sm:pt-6">vs</div>\n            <div class="flex-grow w-full sm:w-auto">\n                <label for="player2_id" class="block text-sm font-medium text-neutral-700 mb-1">Player 2:</label>\n                <select name="player2_id" id="player2_id" required\n                        class="w-full px-3 py-2 border border-neutral-300 rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-primary-medium focus:border-primary-medium text-sm">\n                     <option value="" disabled '
+    if (not (undefined(name='selected_p2_id') if l_0_selected_p2_id is missing else l_0_selected_p2_id)):
+        pass
+        yield 'selected'
+    yield '>Select Player 2</option>\n                   '
+    for l_1_p in (undefined(name='players') if l_0_players is missing else l_0_players):
+        _loop_vars = {}
+        pass
+        yield '\n                        <option value="'
+        yield escape(environment.getattr(l_1_p, 'player_id'))
+        yield '" '
+        if (environment.getattr(l_1_p, 'player_id') == (undefined(name='selected_p2_id') if l_0_selected_p2_id is missing else l_0_selected_p2_id)):
+            pass
+            yield 'selected'
+        yield '>'
+        yield escape(environment.getattr(l_1_p, 'name'))
+        yield '</option>\n                    '
+    l_1_p = missing
+    yield '\n                </select>\n            </div>\n            <div class="w-full sm:w-auto">\n                <button type="submit"\n                        class="w-full sm:w-auto inline-flex justify-center py-2 px-4 border border-transparent shadow-sm text-sm font-medium rounded-md text-white bg-primary hover:bg-primary-dark focus:outline-none focus:ring-4 focus:ring-primary-medium/50 transition duration-150">\n                    View Matchups\n                </button>\n            </div>\n        </div>\n        '
+    if (undefined(name='error_message') if l_0_error_message is missing else l_0_error_message):
+        pass
+        yield '\n            <p class="text-red-600 text-sm mt-2">'
+        yield escape((undefined(name='error_message') if l_0_error_message is missing else l_0_error_message))
+        yield '</p>\n        '
+    yield '\n    </form>\n\n    '
+    if (((undefined(name='player1') if l_0_player1 is missing else l_0_player1) and (undefined(name='player2') if l_0_player2 is missing else l_0_player2)) and (undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats)):
+        pass
+        yield '\n    <div class="mb-8">\n        <h2 class="text-2xl font-semibold font-heading mb-6 text-center flex flex-col sm:flex-row justify-center items-center gap-2 sm:gap-4">\n            <span class="flex items-center gap-2">\n                <img src="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename=(('images/players/' + t_4(environment.getattr((undefined(name='player1') if l_0_player1 is missing else l_0_player1), 'player_id'))) + '.png'), _block_vars=_block_vars))
+        yield '"\n                     alt="'
+        yield escape(environment.getattr((undefined(name='player1') if l_0_player1 is missing else l_0_player1), 'name'))
+        yield '"\n                     class="h2h-player-image"\n                     onerror="this.onerror=null; this.src=\'https://placehold.co/40x40/e2e8f0/94a3b8?text='
+        yield escape((t_5(environment.getitem(environment.getattr((undefined(name='player1') if l_0_player1 is missing else l_0_player1), 'name'), 0)) if environment.getattr((undefined(name='player1') if l_0_player1 is missing else l_0_player1), 'name') else 'P'))
+        yield '\'; this.classList.add(\'bg-neutral-300\');">\n                <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr((undefined(name='player1') if l_0_player1 is missing else l_0_player1), 'player_id'), _block_vars=_block_vars))
+        yield '" class="text-primary-dark hover:underline decoration-primary-dark/70 decoration-2 underline-offset-2">'
+        yield escape(environment.getattr((undefined(name='player1') if l_0_player1 is missing else l_0_player1), 'name'))
+        yield '</a>\n            </span>\n            <span class="text-neutral-500">vs</span>\n            <span class="flex items-center gap-2">\n                <img src="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename=(('images/players/' + t_4(environment.getattr((undefined(name='player2') if l_0_player2 is missing else l_0_player2), 'player_id'))) + '.png'), _block_vars=_block_vars))
+        yield '"\n                     alt="'
+        yield escape(environment.getattr((undefined(name='player2') if l_0_player2 is missing else l_0_player2), 'name'))
+        yield '"\n                     class="h2h-player-image"\n                     onerror="this.onerror=null; this.src=\'https://placehold.co/40x40/e2e8f0/94a3b8?text='
+        yield escape((t_5(environment.getitem(environment.getattr((undefined(name='player2') if l_0_player2 is missing else l_0_player2), 'name'), 0)) if environment.getattr((undefined(name='player2') if l_0_player2 is missing else l_0_player2), 'name') else 'P'))
+        yield '\'; this.classList.add(\'bg-neutral-300\');">\n                <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr((undefined(name='player2') if l_0_player2 is missing else l_0_player2), 'player_id'), _block_vars=_block_vars))
+        yield '" class="text-primary-dark hover:underline decoration-primary-dark/70 decoration-2 underline-offset-2">'
+        yield escape(environment.getattr((undefined(name='player2') if l_0_player2 is missing else l_0_player2), 'name'))
+        yield '</a>\n            </span>\n        </h2>\n\n        <div class="bg-gradient-to-r from-blue-50 via-teal-50 to-green-50 p-4 rounded-lg border border-primary-light/50 mb-6 shadow-md text-center">\n            <h3 class="text-lg font-semibold text-neutral-800 mb-2">All-Time Record</h3>\n            <p class="text-3xl font-bold">\n                <span class="'
+        yield escape(('text-green-600' if (environment.getattr((undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats), 'p1_wins') > environment.getattr((undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats), 'p2_wins')) else ('text-red-600' if (environment.getattr((undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats), 'p2_wins') > environment.getattr((undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats), 'p1_wins')) else 'text-neutral-700')))
+        yield '">\n                    '
+        yield escape(environment.getattr((undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats), 'p1_wins'))
+        yield '\n                </span> -\n                <span class="'
+        yield escape(('text-green-600' if (environment.getattr((undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats), 'p2_wins') > environment.getattr((undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats), 'p1_wins')) else ('text-red-600' if (environment.getattr((undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats), 'p1_wins') > environment.getattr((undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats), 'p2_wins')) else 'text-neutral-700')))
+        yield '">\n                    '
+        yield escape(environment.getattr((undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats), 'p2_wins'))
+        yield '\n                </span>\n                '
+        if (environment.getattr((undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats), 'ties') > 0):
+            pass
+            yield ' - <span class="text-neutral-700">'
+            yield escape(environment.getattr((undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats), 'ties'))
+            yield '</span>'
+        yield '\n            </p>\n            <p class="text-xs text-neutral-500 mt-1">('
+        yield escape(environment.getattr((undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats), 'total_matchups'))
+        yield ' Total Matchups)</p>\n            <p class="text-sm text-neutral-600 mt-2">\n                Total Score: '
+        yield escape(environment.getattr((undefined(name='player1') if l_0_player1 is missing else l_0_player1), 'name'))
+        yield ' '
+        yield escape(t_3(environment.getattr((undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats), 'p1_total_score'), 2))
+        yield ' - '
+        yield escape(environment.getattr((undefined(name='player2') if l_0_player2 is missing else l_0_player2), 'name'))
+        yield ' '
+        yield escape(t_3(environment.getattr((undefined(name='h2h_stats') if l_0_h2h_stats is missing else l_0_h2h_stats), 'p2_total_score'), 2))
+        yield '\n            </p>\n        </div>\n\n        '
+        if (undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats):
+            pass
+            yield '\n        <div class="mb-8 bg-neutral-50 p-4 rounded-lg border border-neutral-200/70 shadow-md">\n            <h3 class="text-lg font-semibold font-heading mb-4 text-neutral-700 text-center">Rivalry Breakdown</h3>\n            <div class="grid grid-cols-1 sm:grid-cols-2 md:grid-cols-3 gap-x-6 gap-y-4 text-sm">\n\n                <div class="space-y-3 border-b sm:border-b-0 sm:border-r border-neutral-200 pb-4 sm:pb-0 sm:pr-6">\n                     <div class="font-semibold text-neutral-700 text-center mb-2 flex items-center justify-center gap-2">\n                        <img src="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename=(('images/players/' + t_4(environment.getattr((undefined(name='player1') if l_0_player1 is missing else l_0_player1), 'player_id'))) + '.png'), _block_vars=_block_vars))
+            yield '" alt="'
+            yield escape(environment.getattr((undefined(name='player1') if l_0_player1 is missing else l_0_player1), 'name'))
+            yield '" class="h2h-player-image w-6 h-6 rounded-sm" onerror="this.style.display=\'none\'">\n                        '
+            yield escape(environment.getattr((undefined(name='player1') if l_0_player1 is missing else l_0_player1), 'name'))
+            yield '\n                    </div>\n                     <div>\n                        <span class="font-medium text-neutral-500 block">Highest Score:</span>\n                        <span class="font-semibold text-green-700">'
+            yield escape((t_3(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p1_max_score'), 2) if (not t_6(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p1_max_score'))) else 'N/A'))
+            yield '</span>\n                        <span class="text-xs text-neutral-500 ml-1">'
+            yield escape(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p1_max_score_details'))
+            yield '</span>\n                    </div>\n                    <div>\n                        <span class="font-medium text-neutral-500 block">Lowest Score:</span>\n                        <span class="font-semibold text-red-700">'
+            yield escape((t_3(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p1_min_score'), 2) if (not t_6(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p1_min_score'))) else 'N/A'))
+            yield '</span>\n                         <span class="text-xs text-neutral-500 ml-1">'
+            yield escape(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p1_min_score_details'))
+            yield '</span>\n                    </div>\n                     <div>\n                        <span class="font-medium text-neutral-500 block">Biggest MOV:</span>\n                        <span class="font-semibold text-blue-700">'
+            yield escape((t_3(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p1_max_mov'), 2) if (environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p1_max_mov') > 0) else 'N/A'))
+            yield ' pts</span>\n                         <span class="text-xs text-neutral-500 ml-1">'
+            yield escape(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p1_max_mov_details'))
+            yield '</span>\n                    </div>\n                </div>\n\n                <div class="space-y-3 border-b sm:border-b-0 md:border-r border-neutral-200 pb-4 sm:pb-0 md:pr-6">\n                     <div class="font-semibold text-neutral-700 text-center mb-2 flex items-center justify-center gap-2">\n                        <img src="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename=(('images/players/' + t_4(environment.getattr((undefined(name='player2') if l_0_player2 is missing else l_0_player2), 'player_id'))) + '.png'), _block_vars=_block_vars))
+            yield '" alt="'
+            yield escape(environment.getattr((undefined(name='player2') if l_0_player2 is missing else l_0_player2), 'name'))
+            yield '" class="h2h-player-image w-6 h-6 rounded-sm" onerror="this.style.display=\'none\'">\n                        '
+            yield escape(environment.getattr((undefined(name='player2') if l_0_player2 is missing else l_0_player2), 'name'))
+            yield '\n                    </div>\n                     <div>\n                        <span class="font-medium text-neutral-500 block">Highest Score:</span>\n                        <span class="font-semibold text-green-700">'
+            yield escape((t_3(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p2_max_score'), 2) if (not t_6(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p2_max_score'))) else 'N/A'))
+            yield '</span>\n                         <span class="text-xs text-neutral-500 ml-1">'
+            yield escape(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p2_max_score_details'))
+            yield '</span>\n                    </div>\n                    <div>\n                        <span class="font-medium text-neutral-500 block">Lowest Score:</span>\n                        <span class="font-semibold text-red-700">'
+            yield escape((t_3(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p2_min_score'), 2) if (not t_6(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p2_min_score'))) else 'N/A'))
+            yield '</span>\n                         <span class="text-xs text-neutral-500 ml-1">'
+            yield escape(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p2_min_score_details'))
+            yield '</span>\n                    </div>\n                     <div>\n                        <span class="font-medium text-neutral-500 block">Biggest MOV:</span>\n                        <span class="font-semibold text-blue-700">'
+            yield escape((t_3(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p2_max_mov'), 2) if (environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p2_max_mov') > 0) else 'N/A'))
+            yield ' pts</span>\n                         <span class="text-xs text-neutral-500 ml-1">'
+            yield escape(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'p2_max_mov_details'))
+            yield '</span>\n                    </div>\n                </div>\n\n                 <div class="space-y-3 sm:col-span-2 md:col-span-1 pt-4 sm:pt-0 md:border-l md:border-neutral-200 md:pl-6">\n                     <div class="font-semibold text-neutral-700 text-center mb-2">Combined</div>\n                     <div>\n                        <span class="font-medium text-neutral-500 block">Highest Combined Score:</span>\n                        <span class="font-semibold text-neutral-800">'
+            yield escape((t_3(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'max_combined'), 2) if (not t_6(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'max_combined'))) else 'N/A'))
+            yield '</span>\n                         <span class="text-xs text-neutral-500 ml-1">'
+            yield escape(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'max_combined_details'))
+            yield '</span>\n                    </div>\n                    <div>\n                        <span class="font-medium text-neutral-500 block">Lowest Combined Score:</span>\n                        <span class="font-semibold text-neutral-800">'
+            yield escape((t_3(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'min_combined'), 2) if (not t_6(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'min_combined'))) else 'N/A'))
+            yield '</span>\n                         <span class="text-xs text-neutral-500 ml-1">'
+            yield escape(environment.getattr((undefined(name='rivalry_stats') if l_0_rivalry_stats is missing else l_0_rivalry_stats), 'min_combined_details'))
+            yield '</span>\n                    </div>\n                 </div>\n            </div>\n        </div>\n        '
+        yield '\n\n        <h3 class="text-xl font-semibold font-heading mb-4 text-neutral-700">Matchup History</h3>\n        '
+        if (undefined(name='matchups') if l_0_matchups is missing else l_0_matchups):
+            pass
+            yield '\n            <div class="overflow-x-auto shadow-md rounded-lg border border-neutral-200/80">\n                <table class="min-w-full divide-y divide-neutral-200">\n                    <thead class="bg-neutral-100">\n                        <tr>\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Season</th>\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Week(s)</th>\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Type</th>\n                            <th scope="col" class="px-4 py-3 text-right text-xs font-semibold text-neutral-600 uppercase tracking-wider">'
+            yield escape(environment.getattr((undefined(name='player1') if l_0_player1 is missing else l_0_player1), 'name'))
+            yield ' Score</th>\n                            <th scope="col" class="px-4 py-3 text-right text-xs font-semibold text-neutral-600 uppercase tracking-wider">'
+            yield escape(environment.getattr((undefined(name='player2') if l_0_player2 is missing else l_0_player2), 'name'))
+            yield ' Score</th>\n                        </tr>\n                    </thead>\n                    <tbody class="bg-white divide-y divide-neutral-200">\n                        '
+            for l_1_m in (undefined(name='matchups') if l_0_matchups is missing else l_0_matchups):
+                l_1_p1_actual_score = l_1_p2_actual_score = l_1_p1_is_winner = l_1_p2_is_winner = missing
+                _loop_vars = {}
+                pass
+                yield '\n                            '
+                l_1_p1_actual_score = (environment.getattr(l_1_m, 'player1_score') if (environment.getattr(l_1_m, 'player1_id') == environment.getattr((undefined(name='player1') if l_0_player1 is missing else l_0_player1), 'player_id')) else environment.getattr(l_1_m, 'player2_score'))
+                _loop_vars['p1_actual_score'] = l_1_p1_actual_score
+                yield '\n                            '
+                l_1_p2_actual_score = (environment.getattr(l_1_m, 'player2_score') if (environment.getattr(l_1_m, 'player2_id') == environment.getattr((undefined(name='player2') if l_0_player2 is missing else l_0_player2), 'player_id')) else environment.getattr(l_1_m, 'player1_score'))
+                _loop_vars['p2_actual_score'] = l_1_p2_actual_score
+                yield '\n                            '
+                l_1_p1_is_winner = (t_1((undefined(name='p1_actual_score') if l_1_p1_actual_score is missing else l_1_p1_actual_score), default=-1) > t_1((undefined(name='p2_actual_score') if l_1_p2_actual_score is missing else l_1_p2_actual_score), default=-1))
+                _loop_vars['p1_is_winner'] = l_1_p1_is_winner
+                yield '\n                            '
+                l_1_p2_is_winner = (t_1((undefined(name='p2_actual_score') if l_1_p2_actual_score is missing else l_1_p2_actual_score), default=-1) > t_1((undefined(name='p1_actual_score') if l_1_p1_actual_score is missing else l_1_p1_actual_score), default=-1))
+                _loop_vars['p2_is_winner'] = l_1_p2_is_winner
+                yield '\n\n                            <tr class="hover:bg-primary-light/20 transition duration-150">\n                                <td class="px-4 py-3 whitespace-nowrap text-sm font-medium text-primary-medium hover:text-primary-dark hover:underline">\n                                    <a href="'
+                yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'season_detail', year=environment.getattr(l_1_m, 'year'), _loop_vars=_loop_vars))
+                yield '">'
+                yield escape(environment.getattr(l_1_m, 'year'))
+                yield '</a>\n                                </td>\n                                <td class="px-4 py-3 whitespace-nowrap text-sm text-neutral-600">\n                                    '
+                if environment.getattr(l_1_m, 'week_end'):
+                    pass
+                    yield ' '
+                    yield escape(environment.getattr(l_1_m, 'week_start'))
+                    yield ' - '
+                    yield escape(environment.getattr(l_1_m, 'week_end'))
+                    yield ' '
+                    if environment.getattr(l_1_m, 'weeks_included'):
+                        pass
+                        yield '('
+                        yield escape(environment.getattr(l_1_m, 'weeks_included'))
+                        yield ')'
+                    yield '\n                                    '
+                else:
+                    pass
+                    yield ' '
+                    yield escape(environment.getattr(l_1_m, 'week_start'))
+                    yield ' '
+                yield '\n                                </td>\n                                 <td class="px-4 py-3 whitespace-nowrap text-sm text-neutral-600 capitalize">'
+                yield escape(t_2(context.eval_ctx, (environment.getattr(l_1_m, 'game_type') or 'regular'), '_', ' '))
+                yield '</td>\n                                <td class="px-4 py-3 whitespace-nowrap text-sm text-right '
+                if (undefined(name='p1_is_winner') if l_1_p1_is_winner is missing else l_1_p1_is_winner):
+                    pass
+                    yield 'font-bold text-green-700'
+                elif (undefined(name='p2_is_winner') if l_1_p2_is_winner is missing else l_1_p2_is_winner):
+                    pass
+                    yield 'text-red-700'
+                else:
+                    pass
+                    yield 'text-neutral-700'
+                yield '">\n                                    '
+                yield escape((t_3((undefined(name='p1_actual_score') if l_1_p1_actual_score is missing else l_1_p1_actual_score), 2) if (not t_6((undefined(name='p1_actual_score') if l_1_p1_actual_score is missing else l_1_p1_actual_score))) else 'N/A'))
+                yield '\n                                </td>\n                                <td class="px-4 py-3 whitespace-nowrap text-sm text-right '
+                if (undefined(name='p2_is_winner') if l_1_p2_is_winner is missing else l_1_p2_is_winner):
+                    pass
+                    yield 'font-bold text-green-700'
+                elif (undefined(name='p1_is_winner') if l_1_p1_is_winner is missing else l_1_p1_is_winner):
+                    pass
+                    yield 'text-red-700'
+                else:
+                    pass
+                    yield 'text-neutral-700'
+                yield '">\n                                    '
+                yield escape((t_3((undefined(name='p2_actual_score') if l_1_p2_actual_score is missing else l_1_p2_actual_score), 2) if (not t_6((undefined(name='p2_actual_score') if l_1_p2_actual_score is missing else l_1_p2_actual_score))) else 'N/A'))
+                yield '\n                                </td>\n                            </tr>\n                        '
+            l_1_m = l_1_p1_actual_score = l_1_p2_actual_score = l_1_p1_is_winner = l_1_p2_is_winner = missing
+            yield '\n                    </tbody>\n                </table>\n            </div>\n        '
+        else:
+            pass
+            yield '\n            <p class="text-neutral-500 mt-4">No matchups found between these players.</p>\n        '
+        yield '\n        </div>\n    '
+    elif ((context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'args'), 'get'), 'player1_id', _block_vars=_block_vars) and context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'args'), 'get'), 'player2_id', _block_vars=_block_vars)) and (not (undefined(name='error_message') if l_0_error_message is missing else l_0_error_message))):
+        pass
+        yield '\n         <p class="text-neutral-600 text-center mt-6">No historical matchups found between selected players.</p>\n    '
+    yield '\n    </div>\n'
+
+def block_scripts(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_super = context.super('scripts', block_scripts)
+    _block_vars = {}
+    l_0_url_for = resolve('url_for')
+    pass
+    yield '\n    '
+    yield escape(context.call(l_0_super, _block_vars=_block_vars))
+    yield "\n    <script>\n        // Navigate to the path form of the pairing URL, which also exists as a pre-rendered page.\n        document.getElementById('h2hForm').addEventListener('submit', function(event) {\n            const p1 = this.elements['player1_id'].value, p2 = this.elements['player2_id'].value;\n            if (p1 && p2 && p1 !== p2) {\n                event.preventDefault();\n                window.location.href = '"
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'head_to_head', _block_vars=_block_vars))
+    yield "/' + encodeURIComponent(p1) + '/' + encodeURIComponent(p2);\n            }\n        });\n    </script>\n"
+
+blocks = {'title': block_title, 'head': block_head, 'content': block_content, 'scripts': block_scripts}
+debug_info = '1=12&3=17&5=27&6=38&14=40&21=43&24=99&26=101&32=103&33=107&34=111&43=121&44=125&45=129&56=139&57=142&61=145&65=148&66=150&68=152&69=154&73=158&74=160&76=162&77=164&84=168&85=170&87=172&88=174&90=176&92=182&94=184&98=192&105=195&106=199&110=201&111=203&115=205&116=207&120=209&121=211&127=213&128=217&132=219&133=221&137=223&138=225&142=227&143=229&151=231&152=233&156=235&157=237&165=240&173=243&174=245&178=247&179=252&180=255&181=258&182=261&186=264&189=268&190=284&192=287&193=289&194=299&196=301&197=311&208=319&214=324&215=335&222=337'
\ No newline at end of file
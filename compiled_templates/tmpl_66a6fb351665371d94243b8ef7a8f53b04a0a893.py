@@ -0,0 +1,267 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'season_detail.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'season_detail.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_year = resolve('year')
+    pass
+    yield escape((undefined(name='year') if l_0_year is missing else l_0_year))
+    yield ' Season Details - Fantasy League'
+
+def block_head(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_super = context.super('head', block_head)
+    _block_vars = {}
+    l_0_tailwind = resolve('tailwind')
+    pass
+    yield '\n    '
+    yield escape(context.call(l_0_super, _block_vars=_block_vars))
+    yield '\n    <style>\n        .season-image-clickable {\n            cursor: pointer;\n            transition: transform 0.2s ease-in-out;\n        }\n        .season-image-clickable:hover {\n            transform: scale(1.05);\n        }\n        /* Re-using table-player-image style from standings.html for consistency */\n        .table-player-image {\n            width: 32px;\n            height: 32px;\n            object-fit: cover;\n            object-position: center top;\n            border-radius: 0.25rem; /* rounded-sm */\n            border: 1px solid '
+    yield escape((environment.getitem(environment.getattr(environment.getattr(environment.getattr(environment.getattr(environment.getattr((undefined(name='tailwind') if l_0_tailwind is missing else l_0_tailwind), 'config'), 'theme'), 'extend'), 'colors'), 'neutral'), 300) if (undefined(name='tailwind') if l_0_tailwind is missing else l_0_tailwind) else '#cbd5e1'))
+    yield ';\n            box-shadow: 0 1px 2px 0 rgba(0,0,0,0.05);\n            margin-right: 0.75rem; /* mr-3 */\n            flex-shrink: 0;\n        }\n    </style>\n'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_url_for = resolve('url_for')
+    l_0_year = resolve('year')
+    l_0_championship = resolve('championship')
+    l_0_results = resolve('results')
+    l_0_odds = resolve('odds')
+    l_0_weeks = resolve('weeks')
+    try:
+        t_1 = environment.filters['default']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'default' found.")
+    try:
+        t_2 = environment.filters['format']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'format' found.")
+    try:
+        t_3 = environment.filters['round']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'round' found.")
+    try:
+        t_4 = environment.filters['string']
+    except KeyError:
+        @internalcode
+        def t_4(*unused):
+            raise TemplateRuntimeError("No filter named 'string' found.")
+    try:
+        t_5 = environment.filters['upper']
+    except KeyError:
+        @internalcode
+        def t_5(*unused):
+            raise TemplateRuntimeError("No filter named 'upper' found.")
+    pass
+    yield '\n<div class="bg-white p-6 rounded-xl shadow-xl border border-neutral-200/80 mb-8 card-hover-effect">\n     <div class="flex flex-col sm:flex-row items-center sm:items-end mb-6 border-b border-neutral-300 pb-6">\n         <img\n            src="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename=(('images/seasons/' + t_4((undefined(name='year') if l_0_year is missing else l_0_year))) + '.png'), _block_vars=_block_vars))
+    yield '"\n            alt="'
+    yield escape((undefined(name='year') if l_0_year is missing else l_0_year))
+    yield ' Season Image"\n            class="w-24 h-16 object-contain mb-3 sm:mb-0 sm:mr-4 rounded-md season-image-clickable"\n            onerror="this.onerror=null; this.src=\'https://placehold.co/96x64/e2e8f0/94a3b8?text='
+    yield escape((undefined(name='year') if l_0_year is missing else l_0_year))
+    yield '\'; this.classList.add(\'bg-neutral-300\');"\n            onclick="openModal(this)"\n          >\n        <h1 class="text-3xl font-bold font-heading text-primary-dark text-center sm:text-left">'
+    yield escape((undefined(name='year') if l_0_year is missing else l_0_year))
+    yield ' Season Standings</h1>\n    </div>\n\n    '
+    if (undefined(name='championship') if l_0_championship is missing else l_0_championship):
+        pass
+        yield '\n    <div class="mb-8 text-center bg-gradient-to-r from-amber-400 via-amber-500 to-orange-500 text-white p-4 rounded-lg shadow-lg">\n        <p class="text-xl font-semibold"><span class="text-2xl inline-block -mt-1 mr-1">🏆</span> Champion:\n            <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr((undefined(name='championship') if l_0_championship is missing else l_0_championship), 'winner_id'), _block_vars=_block_vars))
+        yield '" class="hover:underline font-bold">'
+        yield escape(environment.getattr((undefined(name='championship') if l_0_championship is missing else l_0_championship), 'winner_name'))
+        yield '</a>\n        </p>\n        <p class="text-lg"><span class="text-xl inline-block -mt-1 mr-1">🥈</span> Runner-up:\n            <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr((undefined(name='championship') if l_0_championship is missing else l_0_championship), 'runner_up_id'), _block_vars=_block_vars))
+        yield '" class="hover:underline">'
+        yield escape(environment.getattr((undefined(name='championship') if l_0_championship is missing else l_0_championship), 'runner_up_name'))
+        yield '</a>\n        </p>\n    </div>\n    '
+    yield '\n\n    '
+    if (undefined(name='results') if l_0_results is missing else l_0_results):
+        pass
+        yield '\n        <div class="overflow-x-auto mb-8 shadow-md rounded-lg border border-neutral-200/80">\n            <table class="min-w-full divide-y divide-neutral-200">\n                <thead class="bg-neutral-100">\n                    <tr>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Rank</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Player</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Record (W-L-T)</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">PF</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">PA</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Playoffs?</th>\n                    </tr>\n                </thead>\n                <tbody class="bg-white divide-y divide-neutral-200">\n                    '
+        for l_1_result in (undefined(name='results') if l_0_results is missing else l_0_results):
+            l_1_toilet_bowl_winner_id = resolve('toilet_bowl_winner_id')
+            l_1_toilet_bowl_loser_id = resolve('toilet_bowl_loser_id')
+            _loop_vars = {}
+            pass
+            yield '\n                        <tr class="hover:bg-primary-light/20 transition duration-150">\n                            <td class="px-4 py-3 whitespace-nowrap text-sm font-medium '
+            if (environment.getattr(l_1_result, 'rank') == 1):
+                pass
+                yield 'text-amber-600'
+            elif (environment.getattr(l_1_result, 'rank') == 2):
+                pass
+                yield 'text-neutral-500'
+            elif (environment.getattr(l_1_result, 'rank') == 3):
+                pass
+                yield 'text-orange-600'
+            else:
+                pass
+                yield 'text-neutral-700'
+            yield '">\n                                '
+            yield escape(environment.getattr(l_1_result, 'rank'))
+            yield '\n                                '
+            if (environment.getattr(l_1_result, 'rank') == 1):
+                pass
+                yield ' <span title="Champion">🏆</span>\n                                '
+            elif (environment.getattr(l_1_result, 'rank') == 2):
+                pass
+                yield ' <span title="Runner-up">🥈</span>\n                                '
+            elif (environment.getattr(l_1_result, 'rank') == 3):
+                pass
+                yield ' <span title="3rd Place">🥉</span>\n                                '
+            elif (environment.getattr(l_1_result, 'player_id') == (undefined(name='toilet_bowl_winner_id') if l_1_toilet_bowl_winner_id is missing else l_1_toilet_bowl_winner_id)):
+                pass
+                yield ' <span title="Toilet Bowl Winner">🚽</span>\n                                '
+            elif (environment.getattr(l_1_result, 'player_id') == (undefined(name='toilet_bowl_loser_id') if l_1_toilet_bowl_loser_id is missing else l_1_toilet_bowl_loser_id)):
+                pass
+                yield ' <span title="Toilet Bowl Loser">💩</span>\n                                '
+            yield '\n                            </td>\n                            <td class="px-4 py-3 whitespace-nowrap text-sm font-medium text-primary-medium">\n                                <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr(l_1_result, 'player_id'), _loop_vars=_loop_vars))
+            yield '" class="flex items-center hover:text-primary-dark hover:underline">\n                                    <img src="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename=(('images/players/' + t_4(environment.getattr(l_1_result, 'player_id'))) + '.png'), _loop_vars=_loop_vars))
+            yield '"\n                                         alt="'
+            yield escape(environment.getattr(l_1_result, 'name'))
+            yield '"\n                                         class="table-player-image"\n                                         onerror="this.onerror=null; this.src=\'https://placehold.co/32x32/e2e8f0/94a3b8?text='
+            yield escape((t_5(environment.getitem(environment.getattr(l_1_result, 'name'), 0)) if environment.getattr(l_1_result, 'name') else 'P'))
+            yield '\'; this.classList.add(\'bg-neutral-300\');">\n                                    <span>'
+            yield escape(environment.getattr(l_1_result, 'name'))
+            yield '</span>\n                                </a>\n                            </td>\n                            <td class="px-4 py-3 whitespace-nowrap text-sm text-neutral-600">\n                                '
+            yield escape((environment.getattr(l_1_result, 'regular_season_record') or t_2('{wins}-{losses}-{ties}', wins=t_1(environment.getattr(l_1_result, 'wins'), 0, True), losses=t_1(environment.getattr(l_1_result, 'losses'), 0, True), ties=t_1(environment.getattr(l_1_result, 'ties'), 0, True))))
+            yield '\n                            </td>\n                            <td class="px-4 py-3 whitespace-nowrap text-sm text-neutral-600">\n                                '
+            yield escape(t_3(t_1(environment.getattr(l_1_result, 'points_for'), 'N/A', True), 2))
+            yield '\n                            </td>\n                            <td class="px-4 py-3 whitespace-nowrap text-sm text-neutral-600">\n                                '
+            yield escape(t_3(t_1(environment.getattr(l_1_result, 'points_against'), 'N/A', True), 2))
+            yield '\n                            </td>\n                            <td class="px-4 py-3 whitespace-nowrap text-sm">\n                                '
+            if (environment.getattr(l_1_result, 'made_playoffs') == 1):
+                pass
+                yield '\n                                    <span class="px-2.5 py-0.5 inline-flex text-xs leading-5 font-semibold rounded-full bg-green-100 text-green-800">Yes</span>\n                                '
+            elif (environment.getattr(l_1_result, 'made_playoffs') == 0):
+                pass
+                yield '\n                                     <span class="px-2.5 py-0.5 inline-flex text-xs leading-5 font-semibold rounded-full bg-red-100 text-red-800">No</span>\n                                '
+            else:
+                pass
+                yield '\n                                     <span class="px-2.5 py-0.5 inline-flex text-xs leading-5 font-semibold rounded-full bg-neutral-100 text-neutral-700">N/A</span>\n                                '
+            yield '\n                            </td>\n                        </tr>\n                    '
+        l_1_result = l_1_toilet_bowl_winner_id = l_1_toilet_bowl_loser_id = missing
+        yield '\n                </tbody>\n            </table>\n        </div>\n    '
+    else:
+        pass
+        yield '\n        <p class="text-neutral-500 mt-4 mb-8">No results found for the '
+        yield escape((undefined(name='year') if l_0_year is missing else l_0_year))
+        yield ' season.</p>\n    '
+    yield '\n\n    '
+    if ((undefined(name='odds') if l_0_odds is missing else l_0_odds) and (undefined(name='results') if l_0_results is missing else l_0_results)):
+        pass
+        yield '\n    <div class="border-t border-neutral-300 pt-6 mb-8">\n        <h2 class="text-2xl font-semibold font-heading mb-2 text-neutral-700">Playoff Odds &amp; Luck</h2>\n        <p class="text-sm text-neutral-500 mb-4">Odds replay this schedule with each team\'s own weekly scores. All-play is each week\'s score against every other team; luck is actual wins minus all-play expected wins.</p>\n        <div class="overflow-x-auto shadow-md rounded-lg border border-neutral-200/80">\n            <table class="min-w-full divide-y divide-neutral-200">\n                <thead class="bg-neutral-100">\n                    <tr>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Player</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Wins</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">All-Play (W-L-T)</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Expected Wins</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Luck</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Playoff Odds</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Title Odds</th>\n                    </tr>\n                </thead>\n                <tbody class="bg-white divide-y divide-neutral-200">\n                    '
+        def t_6(fiter):
+            for l_1_result in fiter:
+                if environment.getitem((undefined(name='odds') if l_0_odds is missing else l_0_odds), environment.getattr(l_1_result, 'player_id')):
+                    yield l_1_result
+        for l_1_result in t_6((undefined(name='results') if l_0_results is missing else l_0_results)):
+            l_1_o = missing
+            _loop_vars = {}
+            pass
+            yield '\n                        '
+            l_1_o = environment.getitem((undefined(name='odds') if l_0_odds is missing else l_0_odds), environment.getattr(l_1_result, 'player_id'))
+            _loop_vars['o'] = l_1_o
+            yield '\n                        <tr class="hover:bg-primary-light/20 transition duration-150">\n                            <td class="px-4 py-3 whitespace-nowrap text-sm font-medium text-primary-medium">\n                                <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr(l_1_result, 'player_id'), _loop_vars=_loop_vars))
+            yield '" class="hover:text-primary-dark hover:underline">'
+            yield escape(environment.getattr(l_1_result, 'name'))
+            yield '</a>\n                            </td>\n                            <td class="px-4 py-3 whitespace-nowrap text-sm text-neutral-600">'
+            yield escape(t_3(environment.getattr((undefined(name='o') if l_1_o is missing else l_1_o), 'actual_wins'), 1))
+            yield '</td>\n                            <td class="px-4 py-3 whitespace-nowrap text-sm text-neutral-600">'
+            yield escape(environment.getattr((undefined(name='o') if l_1_o is missing else l_1_o), 'all_play_wins'))
+            yield '-'
+            yield escape(environment.getattr((undefined(name='o') if l_1_o is missing else l_1_o), 'all_play_losses'))
+            yield '-'
+            yield escape(environment.getattr((undefined(name='o') if l_1_o is missing else l_1_o), 'all_play_ties'))
+            yield '</td>\n                            <td class="px-4 py-3 whitespace-nowrap text-sm text-neutral-600">'
+            yield escape(t_3(environment.getattr((undefined(name='o') if l_1_o is missing else l_1_o), 'expected_wins'), 1))
+            yield '</td>\n                            <td class="px-4 py-3 whitespace-nowrap text-sm font-medium '
+            if (environment.getattr((undefined(name='o') if l_1_o is missing else l_1_o), 'luck') >= 1):
+                pass
+                yield 'text-green-700'
+            elif (environment.getattr((undefined(name='o') if l_1_o is missing else l_1_o), 'luck') <= -1):
+                pass
+                yield 'text-red-700'
+            else:
+                pass
+                yield 'text-neutral-600'
+            yield '">'
+            yield escape(t_2('%+.1f', environment.getattr((undefined(name='o') if l_1_o is missing else l_1_o), 'luck')))
+            yield '</td>\n                            <td class="px-4 py-3 whitespace-nowrap text-sm text-neutral-600">'
+            yield escape(t_3(environment.getattr((undefined(name='o') if l_1_o is missing else l_1_o), 'playoff_pct'), 1))
+            yield '%</td>\n                            <td class="px-4 py-3 whitespace-nowrap text-sm text-neutral-600">'
+            yield escape(t_3(environment.getattr((undefined(name='o') if l_1_o is missing else l_1_o), 'title_pct'), 1))
+            yield '%</td>\n                        </tr>\n                    '
+        l_1_result = l_1_o = missing
+        yield '\n                </tbody>\n            </table>\n        </div>\n    </div>\n    '
+    yield '\n\n    <div class="border-t border-neutral-300 pt-6">\n        <div class="flex items-baseline justify-between mb-4">\n            <h2 class="text-2xl font-semibold font-heading text-neutral-700">Weekly Results</h2>\n            '
+    if (undefined(name='weeks') if l_0_weeks is missing else l_0_weeks):
+        pass
+        yield '<a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'season_timeline', year=(undefined(name='year') if l_0_year is missing else l_0_year), _block_vars=_block_vars))
+        yield '" class="text-sm text-primary-medium hover:text-primary-dark hover:underline">Week-by-week timeline &rarr;</a>'
+    yield '\n        </div>\n        '
+    if (undefined(name='weeks') if l_0_weeks is missing else l_0_weeks):
+        pass
+        yield '\n            <div class="flex flex-wrap gap-2">\n                '
+        for l_1_week_info in (undefined(name='weeks') if l_0_weeks is missing else l_0_weeks):
+            l_1_week_num = missing
+            _loop_vars = {}
+            pass
+            yield '\n                    '
+            l_1_week_num = environment.getattr(l_1_week_info, 'week_start')
+            _loop_vars['week_num'] = l_1_week_num
+            yield '\n                    <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'weekly_results', year=(undefined(name='year') if l_0_year is missing else l_0_year), week_num=(undefined(name='week_num') if l_1_week_num is missing else l_1_week_num), _loop_vars=_loop_vars))
+            yield '"\n                       class="bg-primary-light hover:bg-teal-200 text-primary-darker font-medium py-1.5 px-3.5 rounded-full text-sm transition duration-150 shadow-sm hover:shadow-md focus:outline-none focus:ring-2 focus:ring-primary-medium focus:ring-offset-1">\n                       Week '
+            yield escape((undefined(name='week_num') if l_1_week_num is missing else l_1_week_num))
+            yield ' '
+            if environment.getattr(l_1_week_info, 'is_playoff'):
+                pass
+                yield '<span class="text-xs opacity-75">(P)</span>'
+            yield '\n                    </a>\n                '
+        l_1_week_info = l_1_week_num = missing
+        yield '\n            </div>\n        '
+    else:
+        pass
+        yield '\n            <p class="text-neutral-500">No weekly matchup data found for this season.</p>\n        '
+    yield '\n    </div>\n\n    <div class="mt-10">\n        <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'seasons_list', _block_vars=_block_vars))
+    yield '" class="text-sm text-primary-medium hover:text-primary-dark hover:underline">&larr; Back to Seasons List</a>\n    </div>\n</div>\n'
+
+blocks = {'title': block_title, 'head': block_head, 'content': block_content}
+debug_info = '1=12&3=17&5=29&6=40&22=42&30=45&34=90&35=92&37=94&40=96&43=98&46=101&49=105&54=110&68=113&70=119&71=132&72=134&73=137&74=140&75=143&76=146&80=150&81=152&82=154&84=156&85=158&89=160&92=162&95=164&98=166&100=169&112=181&115=184&133=187&134=196&137=199&139=203&140=205&141=211&142=213&143=225&144=227&156=232&158=238&160=241&161=246&162=249&164=251&174=263'
\ No newline at end of file
@@ -0,0 +1,57 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'seasons.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'seasons.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Seasons - Fantasy League'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_seasons = resolve('seasons')
+    pass
+    yield '\n<div class="bg-white p-6 rounded-lg shadow-md">\n    <h1 class="text-3xl font-bold mb-6 text-gray-800 border-b pb-2">League Seasons</h1>\n\n    '
+    if (undefined(name='seasons') if l_0_seasons is missing else l_0_seasons):
+        pass
+        yield '\n        <div class="grid grid-cols-2 sm:grid-cols-3 md:grid-cols-4 lg:grid-cols-5 gap-4">\n            '
+        for l_1_season in (undefined(name='seasons') if l_0_seasons is missing else l_0_seasons):
+            l_1_url_for = resolve('url_for')
+            _loop_vars = {}
+            pass
+            yield '\n                <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_1_url_for is missing else l_1_url_for), 'season_detail', year=environment.getattr(l_1_season, 'year'), _loop_vars=_loop_vars))
+            yield '"\n                   class="block bg-indigo-500 hover:bg-indigo-600 text-white font-semibold text-center p-4 rounded-lg shadow hover:shadow-md transition duration-200 transform hover:-translate-y-1">\n                    '
+            yield escape(environment.getattr(l_1_season, 'year'))
+            yield ' Season\n                </a>\n            '
+        l_1_season = l_1_url_for = missing
+        yield '\n        </div>\n    '
+    else:
+        pass
+        yield '\n        <p class="text-gray-500">No seasons found.</p>\n    '
+    yield '\n</div>\n'
+
+blocks = {'title': block_title, 'content': block_content}
+debug_info = '1=12&3=17&5=27&9=37&11=40&12=45&14=47'
\ No newline at end of file
@@ -0,0 +1,201 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'search.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'search.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Search - Fantasy League'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_url_for = resolve('url_for')
+    l_0_q = resolve('q')
+    l_0_years = resolve('years')
+    l_0_filters = resolve('filters')
+    l_0_game_types = resolve('game_types')
+    l_0_errors = resolve('errors')
+    l_0_results = resolve('results')
+    l_0_prev_url = resolve('prev_url')
+    l_0_next_url = resolve('next_url')
+    try:
+        t_1 = environment.filters['round']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'round' found.")
+    try:
+        t_2 = environment.tests['defined']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No test named 'defined' found.")
+    pass
+    yield '\n<div class="bg-white p-6 rounded-xl shadow-xl border border-neutral-200/80 mb-8 card-hover-effect">\n    <h1 class="text-3xl font-bold font-heading mb-6 text-primary-dark border-b border-neutral-300 pb-3">Search</h1>\n\n    <form method="GET" action="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'search_page', _block_vars=_block_vars))
+    yield '" class="mb-6 space-y-4">\n        <div class="relative">\n            <label for="searchInput" class="block text-sm font-medium text-neutral-700 mb-1">Players, seasons, game notes</label>\n            <input id="searchInput" type="search" name="q" value="'
+    yield escape((undefined(name='q') if l_0_q is missing else l_0_q))
+    yield '" autocomplete="off" placeholder="e.g. Santos championship"\n                   class="w-full border border-neutral-300 rounded-md px-3 py-2 focus:outline-none focus:ring-2 focus:ring-primary-medium">\n            <ul id="suggestions" class="hidden absolute z-20 left-0 right-0 mt-1 bg-white border border-neutral-200 rounded-md shadow-lg text-sm"></ul>\n        </div>\n        <div class="grid grid-cols-2 md:grid-cols-4 lg:grid-cols-7 gap-3 text-sm">\n            <label class="block">\n                <span class="text-neutral-600">Year</span>\n                <select name="year" class="mt-1 w-full border border-neutral-300 rounded-md px-2 py-1.5">\n                    <option value="">Any</option>\n                    '
+    for l_1_s in (undefined(name='years') if l_0_years is missing else l_0_years):
+        _loop_vars = {}
+        pass
+        yield '<option value="'
+        yield escape(environment.getattr(l_1_s, 'year'))
+        yield '" '
+        if (environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'year') == environment.getattr(l_1_s, 'year')):
+            pass
+            yield 'selected'
+        yield '>'
+        yield escape(environment.getattr(l_1_s, 'year'))
+        yield '</option>'
+    l_1_s = missing
+    yield '\n                </select>\n            </label>\n            <label class="block">\n                <span class="text-neutral-600">Week</span>\n                <input type="number" name="week" min="1" value="'
+    yield escape((environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'week') if t_2(environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'week')) else cond_expr_undefined("the inline if-expression on line 26 in 'search.html' evaluated to false and no else section was defined.")))
+    yield '" class="mt-1 w-full border border-neutral-300 rounded-md px-2 py-1.5">\n            </label>\n            <label class="block">\n                <span class="text-neutral-600">Game type</span>\n                <select name="game_type" class="mt-1 w-full border border-neutral-300 rounded-md px-2 py-1.5">\n                    <option value="">Any</option>\n                    '
+    for (l_1_value, l_1_label) in context.call(environment.getattr((undefined(name='game_types') if l_0_game_types is missing else l_0_game_types), 'items'), _block_vars=_block_vars):
+        _loop_vars = {}
+        pass
+        yield '<option value="'
+        yield escape(l_1_value)
+        yield '" '
+        if (environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'game_type') == l_1_value):
+            pass
+            yield 'selected'
+        yield '>'
+        yield escape(l_1_label)
+        yield '</option>'
+    l_1_value = l_1_label = missing
+    yield '\n                </select>\n            </label>\n            <label class="block">\n                <span class="text-neutral-600">Min score</span>\n                <input type="number" step="any" name="min_score" value="'
+    yield escape((environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'min_score') if t_2(environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'min_score')) else cond_expr_undefined("the inline if-expression on line 37 in 'search.html' evaluated to false and no else section was defined.")))
+    yield '" class="mt-1 w-full border border-neutral-300 rounded-md px-2 py-1.5">\n            </label>\n            <label class="block">\n                <span class="text-neutral-600">Max score</span>\n                <input type="number" step="any" name="max_score" value="'
+    yield escape((environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'max_score') if t_2(environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'max_score')) else cond_expr_undefined("the inline if-expression on line 41 in 'search.html' evaluated to false and no else section was defined.")))
+    yield '" class="mt-1 w-full border border-neutral-300 rounded-md px-2 py-1.5">\n            </label>\n            <label class="block">\n                <span class="text-neutral-600">Min margin</span>\n                <input type="number" step="any" min="0" name="min_margin" value="'
+    yield escape((environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'min_margin') if t_2(environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'min_margin')) else cond_expr_undefined("the inline if-expression on line 45 in 'search.html' evaluated to false and no else section was defined.")))
+    yield '" class="mt-1 w-full border border-neutral-300 rounded-md px-2 py-1.5">\n            </label>\n            <label class="block">\n                <span class="text-neutral-600">Max margin</span>\n                <input type="number" step="any" min="0" name="max_margin" value="'
+    yield escape((environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'max_margin') if t_2(environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'max_margin')) else cond_expr_undefined("the inline if-expression on line 49 in 'search.html' evaluated to false and no else section was defined.")))
+    yield '" class="mt-1 w-full border border-neutral-300 rounded-md px-2 py-1.5">\n            </label>\n        </div>\n        <button type="submit" class="bg-primary-medium hover:bg-primary-dark text-white font-semibold py-2 px-5 rounded-md shadow-sm transition duration-150">Search</button>\n    </form>\n\n    '
+    for l_1_error in (undefined(name='errors') if l_0_errors is missing else l_0_errors):
+        _loop_vars = {}
+        pass
+        yield '\n        <p class="text-sm text-red-600 mb-2">'
+        yield escape(l_1_error)
+        yield '</p>\n    '
+    l_1_error = missing
+    yield '\n\n    '
+    if (undefined(name='results') if l_0_results is missing else l_0_results):
+        pass
+        yield '\n        '
+        if environment.getattr((undefined(name='results') if l_0_results is missing else l_0_results), 'hits'):
+            pass
+            yield '\n            <div class="flex flex-wrap gap-2 mb-6">\n                '
+            for l_1_hit in environment.getattr((undefined(name='results') if l_0_results is missing else l_0_results), 'hits'):
+                _loop_vars = {}
+                pass
+                yield '\n                    <a href="'
+                yield escape(environment.getattr(l_1_hit, 'url'))
+                yield '" class="bg-primary-light hover:bg-teal-200 text-primary-darker font-medium py-1.5 px-3.5 rounded-full text-sm transition duration-150 shadow-sm">\n                        '
+                yield escape(environment.getattr(l_1_hit, 'label'))
+                yield ' <span class="text-xs opacity-75">('
+                yield escape(environment.getattr(l_1_hit, 'kind'))
+                yield ')</span>\n                    </a>\n                '
+            l_1_hit = missing
+            yield '\n            </div>\n        '
+        yield '\n\n        '
+        if environment.getattr((undefined(name='results') if l_0_results is missing else l_0_results), 'games'):
+            pass
+            yield '\n            <div class="overflow-x-auto shadow-md rounded-lg border border-neutral-200/80">\n                <table class="min-w-full divide-y divide-neutral-200 text-sm">\n                    <thead class="bg-neutral-100">\n                        <tr>\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Game</th>\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Type</th>\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Matchup</th>\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Score</th>\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Margin</th>\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Notes</th>\n                        </tr>\n                    </thead>\n                    <tbody class="bg-white divide-y divide-neutral-200">\n                        '
+            for l_1_game in environment.getattr((undefined(name='results') if l_0_results is missing else l_0_results), 'games'):
+                _loop_vars = {}
+                pass
+                yield '\n                            <tr class="hover:bg-primary-light/20 transition duration-150">\n                                <td class="px-4 py-3 whitespace-nowrap">\n                                    <a href="'
+                yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'weekly_results', year=environment.getattr(l_1_game, 'year'), week_num=environment.getattr(l_1_game, 'week'), _loop_vars=_loop_vars))
+                yield '" class="text-primary-medium hover:text-primary-dark hover:underline">'
+                yield escape(environment.getattr(l_1_game, 'year'))
+                yield ' Week '
+                yield escape(environment.getattr(l_1_game, 'week'))
+                yield '</a>\n                                </td>\n                                <td class="px-4 py-3 whitespace-nowrap text-neutral-600">'
+                yield escape(context.call(environment.getattr((undefined(name='game_types') if l_0_game_types is missing else l_0_game_types), 'get'), environment.getattr(l_1_game, 'game_type'), environment.getattr(l_1_game, 'game_type'), _loop_vars=_loop_vars))
+                yield '</td>\n                                <td class="px-4 py-3 whitespace-nowrap">\n                                    <a href="'
+                yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'head_to_head', player1_id=environment.getattr(l_1_game, 'player1_id'), player2_id=environment.getattr(l_1_game, 'player2_id'), _loop_vars=_loop_vars))
+                yield '" class="text-primary-medium hover:text-primary-dark hover:underline">'
+                yield escape(environment.getattr(l_1_game, 'p1_name'))
+                yield ' vs '
+                yield escape(environment.getattr(l_1_game, 'p2_name'))
+                yield '</a>\n                                </td>\n                                <td class="px-4 py-3 whitespace-nowrap text-neutral-700">'
+                yield escape(environment.getattr(l_1_game, 'player1_score'))
+                yield ' - '
+                yield escape(environment.getattr(l_1_game, 'player2_score'))
+                yield '</td>\n                                <td class="px-4 py-3 whitespace-nowrap text-neutral-600">'
+                yield escape(t_1(environment.getattr(l_1_game, 'margin'), 2))
+                yield '</td>\n                                <td class="px-4 py-3 text-neutral-500">'
+                yield escape((environment.getattr(l_1_game, 'notes') or ''))
+                yield '</td>\n                            </tr>\n                        '
+            l_1_game = missing
+            yield '\n                    </tbody>\n                </table>\n            </div>\n        '
+        elif (not environment.getattr((undefined(name='results') if l_0_results is missing else l_0_results), 'hits')):
+            pass
+            yield '\n            <p class="text-neutral-500">Nothing matched.</p>\n        '
+        yield '\n\n        '
+        if ((undefined(name='prev_url') if l_0_prev_url is missing else l_0_prev_url) or (undefined(name='next_url') if l_0_next_url is missing else l_0_next_url)):
+            pass
+            yield '\n            <div class="flex justify-between items-center mt-4 text-sm">\n                '
+            if (undefined(name='prev_url') if l_0_prev_url is missing else l_0_prev_url):
+                pass
+                yield '<a href="'
+                yield escape((undefined(name='prev_url') if l_0_prev_url is missing else l_0_prev_url))
+                yield '" class="text-primary-medium hover:text-primary-dark hover:underline">&larr; Previous</a>'
+            else:
+                pass
+                yield '<span></span>'
+            yield '\n                <span class="text-neutral-500">Page '
+            yield escape(environment.getattr((undefined(name='results') if l_0_results is missing else l_0_results), 'page'))
+            yield '</span>\n                '
+            if (undefined(name='next_url') if l_0_next_url is missing else l_0_next_url):
+                pass
+                yield '<a href="'
+                yield escape((undefined(name='next_url') if l_0_next_url is missing else l_0_next_url))
+                yield '" class="text-primary-medium hover:text-primary-dark hover:underline">Next &rarr;</a>'
+            else:
+                pass
+                yield '<span></span>'
+            yield '\n            </div>\n        '
+        yield '\n    '
+    yield '\n</div>\n'
+
+def block_scripts(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_url_for = resolve('url_for')
+    pass
+    yield "\n    <script>\n        // Prefix autocomplete from the search index; picking a suggestion goes straight to its page.\n        (function() {\n            const input = document.getElementById('searchInput'), list = document.getElementById('suggestions');\n            let timer = null, latest = 0;\n            input.addEventListener('input', function() {\n                clearTimeout(timer);\n                timer = setTimeout(async function() {\n                    const q = input.value.trim(), request = ++latest;\n                    if (!q) { list.classList.add('hidden'); return; }\n                    const response = await fetch('"
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'search_suggest', _block_vars=_block_vars))
+    yield "?q=' + encodeURIComponent(q));\n                    const hits = await response.json();\n                    if (request !== latest) return;  // a newer keystroke already answered\n                    list.innerHTML = '';\n                    hits.forEach(function(hit) {\n                        const item = document.createElement('li'), link = document.createElement('a');\n                        link.href = hit.url;\n                        link.textContent = hit.label;\n                        link.className = 'block px-3 py-2 hover:bg-primary-light/40';\n                        item.appendChild(link);\n                        list.appendChild(item);\n                    });\n                    list.classList.toggle('hidden', hits.length === 0);\n                }, 100);\n            });\n            document.addEventListener('click', function(event) {\n                if (event.target !== input) list.classList.add('hidden');\n            });\n        })();\n    </script>\n"
+
+blocks = {'title': block_title, 'content': block_content, 'scripts': block_scripts}
+debug_info = '1=12&3=17&5=27&9=57&12=59&21=61&26=75&32=77&37=91&41=93&45=95&49=97&55=99&56=103&59=107&60=110&62=113&63=117&64=119&70=126&84=129&87=133&89=139&91=141&93=147&94=151&95=153&101=157&105=161&107=164&108=173&109=175&116=187&127=197'
\ No newline at end of file
@@ -0,0 +1,227 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'weekly_results.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'weekly_results.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_year = resolve('year')
+    l_0_week_num = resolve('week_num')
+    pass
+    yield escape((undefined(name='year') if l_0_year is missing else l_0_year))
+    yield ' Season - Week '
+    yield escape((undefined(name='week_num') if l_0_week_num is missing else l_0_week_num))
+    yield ' Results'
+
+def block_head(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_super = context.super('head', block_head)
+    _block_vars = {}
+    l_0_tailwind = resolve('tailwind')
+    pass
+    yield '\n    '
+    yield escape(context.call(l_0_super, _block_vars=_block_vars))
+    yield '\n    <style>\n        .matchup-player-image {\n            width: 40px; /* Or 32px, adjust as preferred */\n            height: 40px;\n            object-fit: cover;\n            object-position: center top;\n            border-radius: 0.375rem; /* rounded-md */\n            border: 2px solid '
+    yield escape((environment.getitem(environment.getattr(environment.getattr(environment.getattr(environment.getattr(environment.getattr((undefined(name='tailwind') if l_0_tailwind is missing else l_0_tailwind), 'config'), 'theme'), 'extend'), 'colors'), 'neutral'), 300) if (undefined(name='tailwind') if l_0_tailwind is missing else l_0_tailwind) else '#cbd5e1'))
+    yield ';\n            flex-shrink: 0; /* Prevent shrinking */\n        }\n        .matchup-player-image.winner {\n             border-color: '
+    yield escape((environment.getitem(environment.getattr(environment.getattr(environment.getattr(environment.getattr(environment.getattr((undefined(name='tailwind') if l_0_tailwind is missing else l_0_tailwind), 'config'), 'theme'), 'extend'), 'colors'), 'green'), 500) if (undefined(name='tailwind') if l_0_tailwind is missing else l_0_tailwind) else '#22c55e'))
+    yield ';\n        }\n        .matchup-player-image.loser {\n            border-color: '
+    yield escape((environment.getitem(environment.getattr(environment.getattr(environment.getattr(environment.getattr(environment.getattr((undefined(name='tailwind') if l_0_tailwind is missing else l_0_tailwind), 'config'), 'theme'), 'extend'), 'colors'), 'red'), 500) if (undefined(name='tailwind') if l_0_tailwind is missing else l_0_tailwind) else '#ef4444'))
+    yield ';\n        }\n    </style>\n'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_year = resolve('year')
+    l_0_week_num = resolve('week_num')
+    l_0_matchups = resolve('matchups')
+    l_0_url_for = resolve('url_for')
+    try:
+        t_1 = environment.filters['float']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'float' found.")
+    try:
+        t_2 = environment.filters['replace']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'replace' found.")
+    try:
+        t_3 = environment.filters['round']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'round' found.")
+    try:
+        t_4 = environment.filters['string']
+    except KeyError:
+        @internalcode
+        def t_4(*unused):
+            raise TemplateRuntimeError("No filter named 'string' found.")
+    try:
+        t_5 = environment.filters['upper']
+    except KeyError:
+        @internalcode
+        def t_5(*unused):
+            raise TemplateRuntimeError("No filter named 'upper' found.")
+    try:
+        t_6 = environment.tests['none']
+    except KeyError:
+        @internalcode
+        def t_6(*unused):
+            raise TemplateRuntimeError("No test named 'none' found.")
+    pass
+    yield '\n<div class="bg-white p-6 rounded-xl shadow-xl border border-neutral-200/80 mb-8 card-hover-effect">\n    <div class="mb-6 pb-4 border-b border-neutral-300">\n        <h1 class="text-3xl font-bold font-heading text-primary-dark text-center sm:text-left">'
+    yield escape((undefined(name='year') if l_0_year is missing else l_0_year))
+    yield ' Season</h1>\n        <p class="text-xl font-semibold text-neutral-700 text-center sm:text-left">Week '
+    yield escape((undefined(name='week_num') if l_0_week_num is missing else l_0_week_num))
+    yield ' Results</p>\n    </div>\n\n    '
+    if ((undefined(name='matchups') if l_0_matchups is missing else l_0_matchups) and (environment.getattr(environment.getitem((undefined(name='matchups') if l_0_matchups is missing else l_0_matchups), 0), 'week_end') or environment.getattr(environment.getitem((undefined(name='matchups') if l_0_matchups is missing else l_0_matchups), 0), 'weeks_included'))):
+        pass
+        yield '\n        <div class="mb-6 p-3 bg-blue-50 border border-blue-200 rounded-md text-sm text-blue-700 shadow-sm">\n            <span class="font-semibold">Note:</span> Scores shown may represent combined results from multiple weeks\n            '
+        if environment.getattr(environment.getitem((undefined(name='matchups') if l_0_matchups is missing else l_0_matchups), 0), 'weeks_included'):
+            pass
+            yield '(Weeks: '
+            yield escape(environment.getattr(environment.getitem((undefined(name='matchups') if l_0_matchups is missing else l_0_matchups), 0), 'weeks_included'))
+            yield ')'
+        elif environment.getattr(environment.getitem((undefined(name='matchups') if l_0_matchups is missing else l_0_matchups), 0), 'week_end'):
+            pass
+            yield '(Weeks: '
+            yield escape(environment.getattr(environment.getitem((undefined(name='matchups') if l_0_matchups is missing else l_0_matchups), 0), 'week_start'))
+            yield '-'
+            yield escape(environment.getattr(environment.getitem((undefined(name='matchups') if l_0_matchups is missing else l_0_matchups), 0), 'week_end'))
+            yield ')'
+        yield '.\n        </div>\n    '
+    yield '\n\n    '
+    if (undefined(name='matchups') if l_0_matchups is missing else l_0_matchups):
+        pass
+        yield '\n        <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">\n            '
+        for l_1_m in (undefined(name='matchups') if l_0_matchups is missing else l_0_matchups):
+            l_1_p1_score_val = l_1_p2_score_val = l_1_p1_is_winner = l_1_p2_is_winner = l_1_is_tie = missing
+            _loop_vars = {}
+            pass
+            yield '\n                '
+            l_1_p1_score_val = t_1(environment.getattr(l_1_m, 'player1_score'), default=None)
+            _loop_vars['p1_score_val'] = l_1_p1_score_val
+            yield '\n                '
+            l_1_p2_score_val = t_1(environment.getattr(l_1_m, 'player2_score'), default=None)
+            _loop_vars['p2_score_val'] = l_1_p2_score_val
+            yield '\n\n                '
+            l_1_p1_is_winner = (((not t_6((undefined(name='p1_score_val') if l_1_p1_score_val is missing else l_1_p1_score_val))) and (not t_6((undefined(name='p2_score_val') if l_1_p2_score_val is missing else l_1_p2_score_val)))) and ((undefined(name='p1_score_val') if l_1_p1_score_val is missing else l_1_p1_score_val) > (undefined(name='p2_score_val') if l_1_p2_score_val is missing else l_1_p2_score_val)))
+            _loop_vars['p1_is_winner'] = l_1_p1_is_winner
+            yield '\n                '
+            l_1_p2_is_winner = (((not t_6((undefined(name='p1_score_val') if l_1_p1_score_val is missing else l_1_p1_score_val))) and (not t_6((undefined(name='p2_score_val') if l_1_p2_score_val is missing else l_1_p2_score_val)))) and ((undefined(name='p2_score_val') if l_1_p2_score_val is missing else l_1_p2_score_val) > (undefined(name='p1_score_val') if l_1_p1_score_val is missing else l_1_p1_score_val)))
+            _loop_vars['p2_is_winner'] = l_1_p2_is_winner
+            yield '\n                '
+            l_1_is_tie = (((not t_6((undefined(name='p1_score_val') if l_1_p1_score_val is missing else l_1_p1_score_val))) and (not t_6((undefined(name='p2_score_val') if l_1_p2_score_val is missing else l_1_p2_score_val)))) and ((undefined(name='p1_score_val') if l_1_p1_score_val is missing else l_1_p1_score_val) == (undefined(name='p2_score_val') if l_1_p2_score_val is missing else l_1_p2_score_val)))
+            _loop_vars['is_tie'] = l_1_is_tie
+            yield '\n\n                <div class="bg-neutral-50 border border-neutral-200/80 rounded-lg shadow-lg transition-all duration-300 ease-in-out hover:shadow-xl flex flex-col">\n                    <div class="bg-gradient-to-r from-neutral-100 to-neutral-200 px-4 py-3 border-b border-neutral-300 rounded-t-lg">\n                        <h3 class="text-sm font-semibold font-heading text-neutral-700 capitalize text-center">\n                            '
+            yield escape(t_2(context.eval_ctx, (environment.getattr(l_1_m, 'game_type') or 'regular'), '_', ' '))
+            yield ' Matchup\n                        </h3>\n                    </div>\n                    <div class="p-4 space-y-3 flex-grow">\n                        \n                        <div class="flex justify-between items-center gap-3">\n                            <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr(l_1_m, 'p1_id'), _loop_vars=_loop_vars))
+            yield '"\n                               class="flex items-center gap-2 text-primary-dark hover:text-primary-darker hover:underline min-w-0">\n                                <img src="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename=(('images/players/' + t_4(environment.getattr(l_1_m, 'p1_id'))) + '.png'), _loop_vars=_loop_vars))
+            yield '"\n                                     alt="'
+            yield escape(environment.getattr(l_1_m, 'p1_name'))
+            yield '"\n                                     class="matchup-player-image '
+            yield escape(('winner' if (undefined(name='p1_is_winner') if l_1_p1_is_winner is missing else l_1_p1_is_winner) else cond_expr_undefined("the inline if-expression on line 63 in 'weekly_results.html' evaluated to false and no else section was defined.")))
+            yield ' '
+            yield escape(('loser' if (undefined(name='p2_is_winner') if l_1_p2_is_winner is missing else l_1_p2_is_winner) else cond_expr_undefined("the inline if-expression on line 63 in 'weekly_results.html' evaluated to false and no else section was defined.")))
+            yield '"\n                                     onerror="this.onerror=null; this.src=\'https://placehold.co/40x40/e2e8f0/94a3b8?text='
+            yield escape((t_5(environment.getitem(environment.getattr(l_1_m, 'p1_name'), 0)) if environment.getattr(l_1_m, 'p1_name') else 'P'))
+            yield '\'; this.classList.add(\'bg-neutral-300\');">\n                                <span class="font-medium truncate '
+            yield escape(('font-bold' if (undefined(name='p1_is_winner') if l_1_p1_is_winner is missing else l_1_p1_is_winner) else cond_expr_undefined("the inline if-expression on line 65 in 'weekly_results.html' evaluated to false and no else section was defined.")))
+            yield '">'
+            yield escape(environment.getattr(l_1_m, 'p1_name'))
+            yield '</span>\n                            </a>\n                            <span class="text-xl font-bold whitespace-nowrap\n                                '
+            if (undefined(name='p1_is_winner') if l_1_p1_is_winner is missing else l_1_p1_is_winner):
+                pass
+                yield 'text-green-600\n                                '
+            elif (undefined(name='p2_is_winner') if l_1_p2_is_winner is missing else l_1_p2_is_winner):
+                pass
+                yield 'text-red-600\n                                '
+            elif (undefined(name='is_tie') if l_1_is_tie is missing else l_1_is_tie):
+                pass
+                yield 'text-neutral-600\n                                '
+            else:
+                pass
+                yield 'text-neutral-700'
+            yield '">\n                                '
+            yield escape((t_3((undefined(name='p1_score_val') if l_1_p1_score_val is missing else l_1_p1_score_val), 2) if (not t_6((undefined(name='p1_score_val') if l_1_p1_score_val is missing else l_1_p1_score_val))) else 'N/A'))
+            yield '\n                            </span>\n                        </div>\n                        \n                        <div class="flex justify-between items-center gap-3">\n                             <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr(l_1_m, 'p2_id'), _loop_vars=_loop_vars))
+            yield '"\n                                class="flex items-center gap-2 text-primary-dark hover:text-primary-darker hover:underline min-w-0">\n                                <img src="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename=(('images/players/' + t_4(environment.getattr(l_1_m, 'p2_id'))) + '.png'), _loop_vars=_loop_vars))
+            yield '"\n                                     alt="'
+            yield escape(environment.getattr(l_1_m, 'p2_name'))
+            yield '"\n                                     class="matchup-player-image '
+            yield escape(('winner' if (undefined(name='p2_is_winner') if l_1_p2_is_winner is missing else l_1_p2_is_winner) else cond_expr_undefined("the inline if-expression on line 81 in 'weekly_results.html' evaluated to false and no else section was defined.")))
+            yield ' '
+            yield escape(('loser' if (undefined(name='p1_is_winner') if l_1_p1_is_winner is missing else l_1_p1_is_winner) else cond_expr_undefined("the inline if-expression on line 81 in 'weekly_results.html' evaluated to false and no else section was defined.")))
+            yield '"\n                                     onerror="this.onerror=null; this.src=\'https://placehold.co/40x40/e2e8f0/94a3b8?text='
+            yield escape((t_5(environment.getitem(environment.getattr(l_1_m, 'p2_name'), 0)) if environment.getattr(l_1_m, 'p2_name') else 'P'))
+            yield '\'; this.classList.add(\'bg-neutral-300\');">\n                                <span class="font-medium truncate '
+            yield escape(('font-bold' if (undefined(name='p2_is_winner') if l_1_p2_is_winner is missing else l_1_p2_is_winner) else cond_expr_undefined("the inline if-expression on line 83 in 'weekly_results.html' evaluated to false and no else section was defined.")))
+            yield '">'
+            yield escape(environment.getattr(l_1_m, 'p2_name'))
+            yield '</span>\n                            </a>\n                            <span class="text-xl font-bold whitespace-nowrap\n                                '
+            if (undefined(name='p2_is_winner') if l_1_p2_is_winner is missing else l_1_p2_is_winner):
+                pass
+                yield 'text-green-600\n                                '
+            elif (undefined(name='p1_is_winner') if l_1_p1_is_winner is missing else l_1_p1_is_winner):
+                pass
+                yield 'text-red-600\n                                '
+            elif (undefined(name='is_tie') if l_1_is_tie is missing else l_1_is_tie):
+                pass
+                yield 'text-neutral-600\n                                '
+            else:
+                pass
+                yield 'text-neutral-700'
+            yield '">\n                                '
+            yield escape((t_3((undefined(name='p2_score_val') if l_1_p2_score_val is missing else l_1_p2_score_val), 2) if (not t_6((undefined(name='p2_score_val') if l_1_p2_score_val is missing else l_1_p2_score_val))) else 'N/A'))
+            yield '\n                            </span>\n                        </div>\n                    </div>\n                     \n                     '
+            if environment.getattr(l_1_m, 'notes'):
+                pass
+                yield '\n                        <div class="px-4 pb-3 pt-2 border-t border-neutral-200 mt-auto">\n                            <p class="text-xs text-neutral-500">'
+                yield escape(environment.getattr(l_1_m, 'notes'))
+                yield '</p>\n                        </div>\n                     '
+            yield '\n                </div>\n            '
+        l_1_m = l_1_p1_score_val = l_1_p2_score_val = l_1_p1_is_winner = l_1_p2_is_winner = l_1_is_tie = missing
+        yield '\n        </div>\n    '
+    else:
+        pass
+        yield '\n        <p class="text-neutral-500 mt-4 text-center">No matchup data found for this week.</p>\n    '
+    yield '\n\n     <div class="mt-10 text-center sm:text-left">\n        <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'season_detail', year=(undefined(name='year') if l_0_year is missing else l_0_year), _block_vars=_block_vars))
+    yield '" class="text-sm text-primary-medium hover:text-primary-dark hover:underline">&larr; Back to '
+    yield escape((undefined(name='year') if l_0_year is missing else l_0_year))
+    yield ' Season Overview</a>\n    </div>\n\n</div>\n'
+
+blocks = {'title': block_title, 'head': block_head, 'content': block_content}
+debug_info = '1=12&3=17&5=32&6=43&14=45&18=47&21=49&26=52&29=101&30=103&33=105&36=108&40=122&42=125&43=130&44=133&46=136&47=139&48=142&53=145&59=147&61=149&62=151&63=153&64=157&65=159&68=163&69=166&70=169&72=176&77=178&79=180&80=182&81=184&82=188&83=190&86=194&87=197&88=200&90=207&95=209&97=212&108=221'
\ No newline at end of file
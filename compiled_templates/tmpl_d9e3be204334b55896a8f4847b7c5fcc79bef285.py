@@ -0,0 +1,136 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'head_to_head_matrix.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'head_to_head_matrix.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Head-to-Head Matrix - Fantasy League'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_rows = resolve('rows')
+    l_0_players = resolve('players')
+    l_0_url_for = resolve('url_for')
+    try:
+        t_1 = environment.filters['round']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'round' found.")
+    try:
+        t_2 = environment.tests['none']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No test named 'none' found.")
+    pass
+    yield '\n<div class="bg-white p-6 rounded-xl shadow-xl border border-neutral-200/80 mb-8 card-hover-effect">\n    <h1 class="text-3xl font-bold font-heading mb-6 text-primary-dark border-b border-neutral-300 pb-3">Head-to-Head Matrix</h1>\n\n    '
+    if (undefined(name='rows') if l_0_rows is missing else l_0_rows):
+        pass
+        yield '\n        <p class="text-sm text-neutral-600 mb-4">All-time record of each row player against each column player (W-L-T, all game types). Click a cell for the full rivalry.</p>\n        <div class="overflow-x-auto shadow-md rounded-lg border border-neutral-200/80">\n            <table class="min-w-full divide-y divide-neutral-200 text-sm">\n                <thead class="bg-neutral-100">\n                    <tr>\n                        <th scope="col" class="px-3 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Player</th>\n                        '
+        for l_1_p in (undefined(name='players') if l_0_players is missing else l_0_players):
+            _loop_vars = {}
+            pass
+            yield '\n                            <th scope="col" class="px-3 py-3 text-center text-xs font-semibold text-neutral-600 uppercase tracking-wider">\n                                <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr(l_1_p, 'player_id'), _loop_vars=_loop_vars))
+            yield '" class="hover:underline">'
+            yield escape(environment.getattr(l_1_p, 'name'))
+            yield '</a>\n                            </th>\n                        '
+        l_1_p = missing
+        yield '\n                        <th scope="col" class="px-3 py-3 text-center text-xs font-semibold text-neutral-600 uppercase tracking-wider">Total</th>\n                    </tr>\n                </thead>\n                <tbody class="bg-white divide-y divide-neutral-200">\n                    '
+        for l_1_row in (undefined(name='rows') if l_0_rows is missing else l_0_rows):
+            _loop_vars = {}
+            pass
+            yield '\n                        <tr class="hover:bg-primary-light/20 transition duration-150">\n                            <th scope="row" class="px-3 py-2 whitespace-nowrap text-left font-medium text-primary-medium hover:text-primary-dark hover:underline">\n                                <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr(environment.getattr(l_1_row, 'player'), 'player_id'), _loop_vars=_loop_vars))
+            yield '">'
+            yield escape(environment.getattr(environment.getattr(l_1_row, 'player'), 'name'))
+            yield '</a>\n                            </th>\n                            '
+            for l_2_cell in environment.getattr(l_1_row, 'cells'):
+                _loop_vars = {}
+                pass
+                yield '\n                                '
+                if t_2(l_2_cell):
+                    pass
+                    yield '\n                                    <td class="px-3 py-2 text-center bg-neutral-200/60 text-neutral-400">&mdash;</td>\n                                '
+                elif (environment.getattr(l_2_cell, 'games') == 0):
+                    pass
+                    yield '\n                                    <td class="px-3 py-2 text-center text-neutral-400">&ndash;</td>\n                                '
+                else:
+                    pass
+                    yield '\n                                    <td class="px-3 py-2 whitespace-nowrap text-center '
+                    if (environment.getattr(l_2_cell, 'wins') > environment.getattr(l_2_cell, 'losses')):
+                        pass
+                        yield 'bg-green-50 text-green-700 font-semibold'
+                    elif (environment.getattr(l_2_cell, 'losses') > environment.getattr(l_2_cell, 'wins')):
+                        pass
+                        yield 'bg-red-50 text-red-700'
+                    else:
+                        pass
+                        yield 'text-neutral-700'
+                    yield '"\n                                        title="'
+                    yield escape(environment.getattr(environment.getattr(l_1_row, 'player'), 'name'))
+                    yield ' vs '
+                    yield escape(environment.getattr(l_2_cell, 'opponent_name'))
+                    yield ': '
+                    yield escape(t_1(environment.getattr(l_2_cell, 'points_for'), 2))
+                    yield ' - '
+                    yield escape(t_1(environment.getattr(l_2_cell, 'points_against'), 2))
+                    yield ' points in '
+                    yield escape(environment.getattr(l_2_cell, 'games'))
+                    yield ' games">\n                                        <a href="'
+                    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'head_to_head', player1_id=environment.getattr(environment.getattr(l_1_row, 'player'), 'player_id'), player2_id=environment.getattr(l_2_cell, 'opponent_id'), _loop_vars=_loop_vars))
+                    yield '" class="hover:underline">\n                                            '
+                    yield escape(environment.getattr(l_2_cell, 'wins'))
+                    yield '-'
+                    yield escape(environment.getattr(l_2_cell, 'losses'))
+                    if environment.getattr(l_2_cell, 'ties'):
+                        pass
+                        yield '-'
+                        yield escape(environment.getattr(l_2_cell, 'ties'))
+                    yield '\n                                        </a>\n                                    </td>\n                                '
+                yield '\n                            '
+            l_2_cell = missing
+            yield '\n                            <td class="px-3 py-2 whitespace-nowrap text-center font-semibold text-neutral-800">\n                                '
+            yield escape(environment.getattr(l_1_row, 'wins'))
+            yield '-'
+            yield escape(environment.getattr(l_1_row, 'losses'))
+            if environment.getattr(l_1_row, 'ties'):
+                pass
+                yield '-'
+                yield escape(environment.getattr(l_1_row, 'ties'))
+            yield '\n                            </td>\n                        </tr>\n                    '
+        l_1_row = missing
+        yield '\n                </tbody>\n            </table>\n        </div>\n    '
+    else:
+        pass
+        yield '\n        <p class="text-neutral-500">No matchup data available.</p>\n    '
+    yield '\n\n    <div class="mt-6">\n        <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'head_to_head', _block_vars=_block_vars))
+    yield '" class="text-sm text-primary-medium hover:text-primary-dark hover:underline">&larr; Back to Head-to-Head</a>\n    </div>\n</div>\n'
+
+blocks = {'title': block_title, 'content': block_content}
+debug_info = '1=12&3=17&5=27&9=51&16=54&18=58&25=64&28=68&30=72&31=76&33=79&36=85&37=95&38=105&39=107&45=118&57=132'
\ No newline at end of file
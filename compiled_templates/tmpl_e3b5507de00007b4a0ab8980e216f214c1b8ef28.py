@@ -0,0 +1,81 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'leagues.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'leagues.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Leagues - Fantasy League'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_leagues = resolve('leagues')
+    pass
+    yield '\n<div class="bg-white p-6 rounded-lg shadow-md">\n    <h1 class="text-3xl font-bold mb-6 text-gray-800 border-b pb-2">Leagues</h1>\n\n    '
+    if (undefined(name='leagues') if l_0_leagues is missing else l_0_leagues):
+        pass
+        yield '\n        <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">\n            '
+        for l_1_lg in (undefined(name='leagues') if l_0_leagues is missing else l_0_leagues):
+            _loop_vars = {}
+            pass
+            yield '\n                <div class="border border-gray-200 rounded-lg p-4 shadow-sm">\n                    <a href="'
+            yield escape(('/' if environment.getattr(l_1_lg, 'is_default') else markup_join(('/l/', environment.getattr(l_1_lg, 'slug'), '/', ))))
+            yield '" class="text-xl font-semibold text-indigo-600 hover:text-indigo-800 hover:underline">'
+            yield escape(environment.getattr(l_1_lg, 'slug'))
+            yield '</a>\n                    <p class="text-sm text-gray-500 mb-3">'
+            yield escape(environment.getattr(l_1_lg, 'seasons'))
+            yield ' season'
+            yield escape(('s' if (environment.getattr(l_1_lg, 'seasons') != 1) else cond_expr_undefined("the inline if-expression on line 14 in 'leagues.html' evaluated to false and no else section was defined.")))
+            yield ', '
+            yield escape(environment.getattr(l_1_lg, 'players'))
+            yield ' manager'
+            yield escape(('s' if (environment.getattr(l_1_lg, 'players') != 1) else cond_expr_undefined("the inline if-expression on line 14 in 'leagues.html' evaluated to false and no else section was defined.")))
+            yield '</p>\n                    '
+            if environment.getattr(l_1_lg, 'champions'):
+                pass
+                yield '\n                        <ul class="text-sm space-y-1">\n                            '
+                for l_2_champ in environment.getattr(l_1_lg, 'champions'):
+                    _loop_vars = {}
+                    pass
+                    yield '\n                                <li><span class="font-semibold text-gray-700">'
+                    yield escape(environment.getattr(l_2_champ, 'year'))
+                    yield ':</span> '
+                    yield escape(environment.getattr(l_2_champ, 'winner_name'))
+                    yield '</li>\n                            '
+                l_2_champ = missing
+                yield '\n                        </ul>\n                    '
+            else:
+                pass
+                yield '\n                        <p class="text-sm text-gray-500">No champions yet.</p>\n                    '
+            yield '\n                </div>\n            '
+        l_1_lg = missing
+        yield '\n        </div>\n    '
+    else:
+        pass
+        yield '\n        <p class="text-gray-500">No leagues found.</p>\n    '
+    yield '\n</div>\n'
+
+blocks = {'title': block_title, 'content': block_content}
+debug_info = '1=12&3=17&5=27&9=37&11=40&13=44&14=48&15=56&17=59&18=63'
\ No newline at end of file
@@ -0,0 +1,258 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'player_compare.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    l_0_season_extreme = missing
+    try:
+        t_1 = environment.filters['round']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'round' found.")
+    try:
+        t_2 = environment.tests['none']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No test named 'none' found.")
+    pass
+    parent_template = environment.get_template('base.html', 'player_compare.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    def macro(l_1_record, l_1_decimals):
+        t_3 = []
+        if l_1_record is missing:
+            l_1_record = undefined("parameter 'record' was not provided", name='record')
+        if l_1_decimals is missing:
+            l_1_decimals = None
+        pass
+        if (l_1_record and (not t_2(environment.getattr(l_1_record, 'value')))):
+            pass
+            t_3.extend((
+                escape((t_1(environment.getattr(l_1_record, 'value'), l_1_decimals) if (not t_2(l_1_decimals)) else environment.getattr(l_1_record, 'value'))),
+                ' <span class="text-xs text-neutral-500">(',
+                escape(environment.getattr(l_1_record, 'year')),
+                ')</span>',
+            ))
+        else:
+            pass
+            t_3.append(
+                'N/A',
+            )
+        return concat(t_3)
+    context.exported_vars.add('season_extreme')
+    context.vars['season_extreme'] = l_0_season_extreme = Macro(environment, macro, 'season_extreme', ('record', 'decimals'), False, False, False, context.eval_ctx.autoescape)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Compare Players - Fantasy League'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_url_for = resolve('url_for')
+    l_0_players = resolve('players')
+    l_0_error_message = resolve('error_message')
+    l_0_compared = resolve('compared')
+    l_0_stat_rows = resolve('stat_rows')
+    try:
+        t_4 = environment.filters['join']
+    except KeyError:
+        @internalcode
+        def t_4(*unused):
+            raise TemplateRuntimeError("No filter named 'join' found.")
+    try:
+        t_5 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_5(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    try:
+        t_6 = environment.filters['map']
+    except KeyError:
+        @internalcode
+        def t_6(*unused):
+            raise TemplateRuntimeError("No filter named 'map' found.")
+    try:
+        t_1 = environment.filters['round']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'round' found.")
+    try:
+        t_2 = environment.tests['none']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No test named 'none' found.")
+    pass
+    yield '\n<div class="bg-white p-6 rounded-xl shadow-xl border border-neutral-200/80 mb-8 card-hover-effect">\n    <h1 class="text-3xl font-bold font-heading mb-6 text-primary-dark border-b border-neutral-300 pb-3">Compare Careers</h1>\n\n    <form method="GET" action="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_compare', _block_vars=_block_vars))
+    yield '" class="mb-8 bg-neutral-50 p-4 rounded-lg border border-neutral-200/70 shadow-sm">\n        <p class="block text-sm font-medium text-neutral-700 mb-2">Select players to compare:</p>\n        <div class="flex flex-wrap gap-x-4 gap-y-2 mb-4">\n            '
+    for l_1_p in (undefined(name='players') if l_0_players is missing else l_0_players):
+        l_1_selected_ids = resolve('selected_ids')
+        _loop_vars = {}
+        pass
+        yield '\n                <label class="inline-flex items-center gap-1.5 text-sm text-neutral-700">\n                    <input type="checkbox" name="ids" value="'
+        yield escape(environment.getattr(l_1_p, 'player_id'))
+        yield '" '
+        if (environment.getattr(l_1_p, 'player_id') in (undefined(name='selected_ids') if l_1_selected_ids is missing else l_1_selected_ids)):
+            pass
+            yield 'checked'
+        yield '\n                           class="rounded border-neutral-300 text-primary focus:ring-primary-medium">\n                    '
+        yield escape(environment.getattr(l_1_p, 'name'))
+        yield '\n                </label>\n            '
+    l_1_p = l_1_selected_ids = missing
+    yield '\n        </div>\n        <button type="submit"\n                class="inline-flex justify-center py-2 px-4 border border-transparent shadow-sm text-sm font-medium rounded-md text-white bg-primary hover:bg-primary-dark focus:outline-none focus:ring-4 focus:ring-primary-medium/50 transition duration-150">\n            Compare\n        </button>\n        '
+    if (undefined(name='error_message') if l_0_error_message is missing else l_0_error_message):
+        pass
+        yield '\n            <p class="text-red-600 text-sm mt-2">'
+        yield escape((undefined(name='error_message') if l_0_error_message is missing else l_0_error_message))
+        yield '</p>\n        '
+    yield '\n    </form>\n\n    '
+    if (undefined(name='compared') if l_0_compared is missing else l_0_compared):
+        pass
+        yield '\n        '
+        l_0_stat_rows = [('Seasons', 'seasons_played', None), ('Win %', 'win_percentage', 1), ('Total PF', 'total_pf', 2), ('Total PA', 'total_pa', 2), ('Avg PF / Season', 'avg_pf_per_season', 2), ('Avg PA / Season', 'avg_pa_per_season', 2), ('Avg Finish', 'avg_rank', 2), ('Playoff Appearances', 'playoff_appearances', None)]
+        _block_vars['stat_rows'] = l_0_stat_rows
+        yield '\n        <div class="overflow-x-auto shadow-md rounded-lg border border-neutral-200/80">\n            <table class="min-w-full divide-y divide-neutral-200 text-sm">\n                <thead class="bg-neutral-100">\n                    <tr>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider"></th>\n                        '
+        for l_1_p in (undefined(name='compared') if l_0_compared is missing else l_0_compared):
+            _loop_vars = {}
+            pass
+            yield '\n                            <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">\n                                <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr(l_1_p, 'player_id'), _loop_vars=_loop_vars))
+            yield '" class="hover:underline">'
+            yield escape(environment.getattr(l_1_p, 'player_name'))
+            yield '</a>\n                            </th>\n                        '
+        l_1_p = missing
+        yield '\n                    </tr>\n                </thead>\n                <tbody class="bg-white divide-y divide-neutral-200">\n                    <tr>\n                        <th scope="row" class="px-4 py-3 text-left font-medium text-neutral-600">Record (W-L-T)</th>\n                        '
+        for l_1_p in (undefined(name='compared') if l_0_compared is missing else l_0_compared):
+            _loop_vars = {}
+            pass
+            yield '\n                            <td class="px-4 py-3 whitespace-nowrap text-neutral-800">'
+            yield escape(environment.getattr(environment.getattr(l_1_p, 'career_stats'), 'total_wins'))
+            yield '-'
+            yield escape(environment.getattr(environment.getattr(l_1_p, 'career_stats'), 'total_losses'))
+            yield '-'
+            yield escape(environment.getattr(environment.getattr(l_1_p, 'career_stats'), 'total_ties'))
+            yield '</td>\n                        '
+        l_1_p = missing
+        yield '\n                    </tr>\n                    '
+        for (l_1_label, l_1_key, l_1_decimals) in (undefined(name='stat_rows') if l_0_stat_rows is missing else l_0_stat_rows):
+            _loop_vars = {}
+            pass
+            yield '\n                        <tr>\n                            <th scope="row" class="px-4 py-3 text-left font-medium text-neutral-600">'
+            yield escape(l_1_label)
+            yield '</th>\n                            '
+            for l_2_p in (undefined(name='compared') if l_0_compared is missing else l_0_compared):
+                l_2_value = missing
+                _loop_vars = {}
+                pass
+                yield '\n                                '
+                l_2_value = environment.getitem(environment.getattr(l_2_p, 'career_stats'), l_1_key)
+                _loop_vars['value'] = l_2_value
+                yield '\n                                <td class="px-4 py-3 whitespace-nowrap text-neutral-800">\n                                    '
+                if t_2(l_1_decimals):
+                    pass
+                    yield escape((undefined(name='value') if l_2_value is missing else l_2_value))
+                elif (l_1_key in ('total_pf', 'total_pa')):
+                    pass
+                    yield escape(context.call(environment.getattr('{:,.2f}', 'format'), (undefined(name='value') if l_2_value is missing else l_2_value), _loop_vars=_loop_vars))
+                else:
+                    pass
+                    yield escape(t_1((undefined(name='value') if l_2_value is missing else l_2_value), l_1_decimals))
+                yield '\n                                </td>\n                            '
+            l_2_p = l_2_value = missing
+            yield '\n                        </tr>\n                    '
+        l_1_label = l_1_key = l_1_decimals = missing
+        yield '\n                    <tr>\n                        <th scope="row" class="px-4 py-3 text-left font-medium text-neutral-600">🏆 Championships</th>\n                        '
+        for l_1_p in (undefined(name='compared') if l_0_compared is missing else l_0_compared):
+            _loop_vars = {}
+            pass
+            yield '\n                            <td class="px-4 py-3 text-neutral-800">'
+            yield escape(t_5(environment.getattr(l_1_p, 'championship_wins')))
+            if environment.getattr(l_1_p, 'championship_wins'):
+                pass
+                yield ' <span class="text-xs text-neutral-500">('
+                yield escape(t_4(context.eval_ctx, t_6(context, environment.getattr(l_1_p, 'championship_wins'), attribute='year'), ', '))
+                yield ')</span>'
+            yield '</td>\n                        '
+        l_1_p = missing
+        yield '\n                    </tr>\n                    <tr>\n                        <th scope="row" class="px-4 py-3 text-left font-medium text-neutral-600">🥈 Runner-up</th>\n                        '
+        for l_1_p in (undefined(name='compared') if l_0_compared is missing else l_0_compared):
+            _loop_vars = {}
+            pass
+            yield '\n                            <td class="px-4 py-3 text-neutral-800">'
+            yield escape(t_5(environment.getattr(l_1_p, 'runner_up_finishes')))
+            if environment.getattr(l_1_p, 'runner_up_finishes'):
+                pass
+                yield ' <span class="text-xs text-neutral-500">('
+                yield escape(t_4(context.eval_ctx, t_6(context, environment.getattr(l_1_p, 'runner_up_finishes'), attribute='year'), ', '))
+                yield ')</span>'
+            yield '</td>\n                        '
+        l_1_p = missing
+        yield '\n                    </tr>\n                    <tr>\n                        <th scope="row" class="px-4 py-3 text-left font-medium text-neutral-600">🥉 3rd Place</th>\n                        '
+        for l_1_p in (undefined(name='compared') if l_0_compared is missing else l_0_compared):
+            _loop_vars = {}
+            pass
+            yield '\n                            <td class="px-4 py-3 text-neutral-800">'
+            yield escape(t_5(environment.getattr(l_1_p, 'third_place_finishes')))
+            if environment.getattr(l_1_p, 'third_place_finishes'):
+                pass
+                yield ' <span class="text-xs text-neutral-500">('
+                yield escape(t_4(context.eval_ctx, t_6(context, environment.getattr(l_1_p, 'third_place_finishes'), attribute='year'), ', '))
+                yield ')</span>'
+            yield '</td>\n                        '
+        l_1_p = missing
+        yield '\n                    </tr>\n                    <tr>\n                        <th scope="row" class="px-4 py-3 text-left font-medium text-neutral-600">🚽 Toilet Bowl (W-L)</th>\n                        '
+        for l_1_p in (undefined(name='compared') if l_0_compared is missing else l_0_compared):
+            _loop_vars = {}
+            pass
+            yield '\n                            <td class="px-4 py-3 whitespace-nowrap text-neutral-800">'
+            yield escape(environment.getattr(l_1_p, 'toilet_bowl_wins'))
+            yield '-'
+            yield escape(environment.getattr(l_1_p, 'toilet_bowl_losses'))
+            yield '</td>\n                        '
+        l_1_p = missing
+        yield '\n                    </tr>\n                    '
+        for (l_1_label, l_1_key, l_1_decimals) in [('Best Finish', 'best_rank', None), ('Worst Finish', 'worst_rank', None), ('Top Season PF', 'highest_pf', 2), ('Lowest Season PF', 'lowest_pf', 2), ('Top Season PPG', 'highest_ppg', 2), ('Lowest Season PPG', 'lowest_ppg', 2)]:
+            _loop_vars = {}
+            pass
+            yield '\n                        <tr>\n                            <th scope="row" class="px-4 py-3 text-left font-medium text-neutral-600">'
+            yield escape(l_1_label)
+            yield '</th>\n                            '
+            for l_2_p in (undefined(name='compared') if l_0_compared is missing else l_0_compared):
+                l_2_season_extreme = resolve('season_extreme')
+                _loop_vars = {}
+                pass
+                yield '\n                                <td class="px-4 py-3 whitespace-nowrap text-neutral-800">'
+                yield escape(context.call((undefined(name='season_extreme') if l_2_season_extreme is missing else l_2_season_extreme), environment.getitem(environment.getattr(l_2_p, 'player_records'), l_1_key), l_1_decimals, _loop_vars=_loop_vars))
+                yield '</td>\n                            '
+            l_2_p = l_2_season_extreme = missing
+            yield '\n                        </tr>\n                    '
+        l_1_label = l_1_key = l_1_decimals = missing
+        yield '\n                </tbody>\n            </table>\n        </div>\n    '
+    elif (not (undefined(name='error_message') if l_0_error_message is missing else l_0_error_message)):
+        pass
+        yield '\n        <p class="text-neutral-500">Pick two or more players above to see their careers side by side.</p>\n    '
+    yield '\n</div>\n'
+
+blocks = {'title': block_title, 'content': block_content}
+debug_info = '1=25&5=28&6=35&7=38&3=53&11=63&15=107&18=109&20=114&22=120&30=124&31=127&35=130&36=133&51=136&53=140&61=146&62=150&65=158&67=162&68=164&69=169&71=172&78=186&79=190&84=199&85=203&90=212&91=216&96=225&97=229&100=235&102=239&103=241&104=246&111=252'
\ No newline at end of file
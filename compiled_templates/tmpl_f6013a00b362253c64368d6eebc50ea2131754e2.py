@@ -0,0 +1,159 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'index.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'index.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'League Home - Full Service Fantasy League'
+
+def block_head(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_super = context.super('head', block_head)
+    _block_vars = {}
+    l_0_tailwind = resolve('tailwind')
+    pass
+    yield '\n    '
+    yield escape(context.call(l_0_super, _block_vars=_block_vars))
+    yield '\n    <style>\n        .hero-text-shadow {\n            text-shadow: 0px 2px 5px rgba(0, 0, 0, 0.7);\n        }\n        .hero-section {\n            min-height: 50vh;\n            max-height: 650px;\n            display: flex;\n            align-items: center;\n            justify-content: center;\n        }\n        .card-hover-effect {\n            transition: transform 0.3s ease-in-out, box-shadow 0.3s ease-in-out;\n        }\n        .card-hover-effect:hover {\n            transform: translateY(-5px);\n            box-shadow: 0 10px 20px rgba(0,0,0,0.1), 0 6px 6px rgba(0,0,0,0.08);\n        }\n        .champion-card, .shame-card { /* Shared base style */\n            position: relative;\n            overflow: hidden;\n        }\n        .champion-image, .shame-image { /* Shared base style */\n            width: 100%;\n            max-height: 240px;\n            object-fit: contain; /* Keep this for Hall of Champions/Shame for full image */\n            object-position: center center;\n            transition: transform 0.3s ease-in-out;\n        }\n        .champion-image {\n            background-color: #334155; /* neutral-700, for letterbox area */\n        }\n        .shame-image {\n            background-color: #4b5563; /* gray-600 or a darker neutral for shame */\n        }\n        .champion-card:hover .champion-image, .shame-card:hover .shame-image {\n            transform: scale(1.05);\n        }\n        .champion-overlay, .shame-overlay { /* Shared base style */\n            position: absolute;\n            bottom: 0;\n            left: 0;\n            right: 0;\n            background: linear-gradient(to top, rgba(0,0,0,0.85) 0%, rgba(0,0,0,0.6) 60%, transparent 100%);\n            padding: 0.75rem; /* p-3 */\n            color: white;\n        }\n        .champion-crown, .shame-indicator { /* Shared base style */\n            position: absolute;\n            top: 8px;\n            left: 8px;\n            font-size: 1.875rem; /* text-3xl */\n            text-shadow: 0 1px 3px rgba(0,0,0,0.6);\n        }\n        .champion-crown {\n            color: #f59e0b; /* amber-DEFAULT */\n        }\n        .shame-indicator {\n            color: #7f1d1d; /* A dark red, or choose another "shameful" color/icon */\n            /* If using an emoji like 💩, color might not apply directly, but shadow does */\n        }\n        .current-champion-image {\n            width: 100px;\n            height: 100px;\n            object-fit: cover; /* Changed back to \'cover\' for cropped circle */\n            object-position: center top; /* Prioritize face */\n            border-radius: 50%; /* Circular image */\n            border: 3px solid '
+    yield escape((environment.getattr(environment.getattr(environment.getattr(environment.getattr(environment.getattr(environment.getattr((undefined(name='tailwind') if l_0_tailwind is missing else l_0_tailwind), 'config'), 'theme'), 'extend'), 'colors'), 'amber'), 'DEFAULT') if (undefined(name='tailwind') if l_0_tailwind is missing else l_0_tailwind) else '#f59e0b'))
+    yield ";\n            box-shadow: 0 4px 8px rgba(0,0,0,0.15);\n            /* background-color: #e2e8f0; Removed, not needed for 'cover' */\n        }\n    </style>\n"
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_url_for = resolve('url_for')
+    l_0_latest_champion = resolve('latest_champion')
+    l_0_all_champions = resolve('all_champions')
+    l_0_all_toilet_losers = resolve('all_toilet_losers')
+    l_0_players = resolve('players')
+    try:
+        t_1 = environment.filters['string']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'string' found.")
+    try:
+        t_2 = environment.filters['upper']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'upper' found.")
+    pass
+    yield '\n\n<div class="hero-section relative rounded-xl shadow-2xl overflow-hidden mb-12 bg-neutral-800">\n    <div class="absolute inset-0 bg-cover bg-center transition-transform duration-500 ease-in-out hover:scale-105"\n         style="background-image: url(\''
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='images/hero-background.jpg', _block_vars=_block_vars))
+    yield '\');">\n    </div>\n    <div class="absolute inset-0 bg-gradient-to-t from-neutral-900/80 via-neutral-900/60 to-transparent/30"></div>\n\n    <div class="relative z-10 h-full flex flex-col justify-center items-center text-center p-6 md:p-12">\n        <h1 class="text-4xl sm:text-5xl lg:text-6xl font-bold font-heading text-white hero-text-shadow mb-4 leading-tight">\n            Welcome to the <span class="text-primary-light">Full Service</span> Fantasy Hub!\n        </h1>\n        <p class="text-lg sm:text-xl text-neutral-200 hero-text-shadow max-w-3xl mb-8">\n            Your ultimate destination for league history, player stats, intense rivalries, and the eternal quest for the championship trophy.\n        </p>\n        <div>\n            <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'seasons_list', _block_vars=_block_vars))
+    yield '"\n               class="bg-primary hover:bg-primary-dark focus:bg-primary-dark active:bg-primary-darker text-white font-semibold py-3 px-8 rounded-lg shadow-md hover:shadow-lg transition duration-300 ease-in-out transform hover:scale-105 text-lg focus:outline-none focus:ring-4 focus:ring-primary-medium/50">\n                Explore Seasons &rarr;\n            </a>\n        </div>\n    </div>\n</div>\n\n\n<div class="bg-white p-6 sm:p-8 rounded-xl shadow-xl border border-neutral-200/80 mb-10 text-center card-hover-effect">\n    <h2 class="text-3xl font-bold font-heading text-primary-dark mb-4">League Overview</h2>\n    '
+    if (undefined(name='latest_champion') if l_0_latest_champion is missing else l_0_latest_champion):
+        pass
+        yield '\n        <div class="flex flex-col items-center mb-4">\n            <img src="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename=(('images/players/' + t_1(environment.getattr((undefined(name='latest_champion') if l_0_latest_champion is missing else l_0_latest_champion), 'winner_id'))) + '.png'), _block_vars=_block_vars))
+        yield '"\n                 alt="'
+        yield escape(environment.getattr((undefined(name='latest_champion') if l_0_latest_champion is missing else l_0_latest_champion), 'winner_name'))
+        yield '"\n                 class="current-champion-image mb-3"\n                 onerror="this.onerror=null; this.src=\'https://placehold.co/100x100/e2e8f0/94a3b8?text='
+        yield escape((t_2(environment.getitem(environment.getattr((undefined(name='latest_champion') if l_0_latest_champion is missing else l_0_latest_champion), 'winner_name'), 0)) if environment.getattr((undefined(name='latest_champion') if l_0_latest_champion is missing else l_0_latest_champion), 'winner_name') else 'P'))
+        yield '&font=lexend\'; this.classList.add(\'bg-neutral-300\');">\n            <p class="text-xl font-semibold text-amber-600">\n                Current Reigning Champion ('
+        yield escape(environment.getattr((undefined(name='latest_champion') if l_0_latest_champion is missing else l_0_latest_champion), 'year'))
+        yield '):\n                <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr((undefined(name='latest_champion') if l_0_latest_champion is missing else l_0_latest_champion), 'winner_id'), _block_vars=_block_vars))
+        yield '" class="hover:underline decoration-amber-600/70 decoration-2 underline-offset-2 font-bold">\n                     '
+        yield escape(environment.getattr((undefined(name='latest_champion') if l_0_latest_champion is missing else l_0_latest_champion), 'winner_name'))
+        yield '\n                </a>\n                 <span class="inline-block ml-1 animate-pulse">👑</span>\n            </p>\n        </div>\n    '
+    else:
+        pass
+        yield '\n        <p class="text-xl text-neutral-600 mb-4">The battle for the next championship is on!</p>\n    '
+    yield '\n    <p class="text-neutral-700 text-base">Dive into player profiles, season recaps, and the all-time record book.</p>\n</div>\n\n\n'
+    if (undefined(name='all_champions') if l_0_all_champions is missing else l_0_all_champions):
+        pass
+        yield '\n<div class="bg-white p-6 sm:p-8 rounded-xl shadow-xl border border-neutral-200/80 mb-10 card-hover-effect">\n    <h2 class="text-3xl font-bold font-heading text-primary-dark mb-6 text-center border-b border-neutral-300 pb-4">Hall of Champions</h2>\n    <div class="grid grid-cols-1 sm:grid-cols-2 md:grid-cols-3 lg:grid-cols-4 gap-6">\n        '
+        for l_1_champion in (undefined(name='all_champions') if l_0_all_champions is missing else l_0_all_champions):
+            _loop_vars = {}
+            pass
+            yield '\n            <div class="champion-card bg-neutral-800 rounded-lg shadow-lg card-hover-effect">\n                <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr(l_1_champion, 'winner_id'), _loop_vars=_loop_vars))
+            yield '" class="block">\n                    <img src="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename=(('images/players/' + t_1(environment.getattr(l_1_champion, 'winner_id'))) + '.png'), _loop_vars=_loop_vars))
+            yield '"\n                         alt="Champion: '
+            yield escape(environment.getattr(l_1_champion, 'winner_name'))
+            yield '"\n                         class="champion-image rounded-t-lg"\n                         onerror="this.onerror=null; this.src=\'https://placehold.co/300x240/334155/e2e8f0?text='
+            yield escape((t_2(environment.getitem(environment.getattr(l_1_champion, 'winner_name'), 0)) if environment.getattr(l_1_champion, 'winner_name') else 'C'))
+            yield '&font=lexend\'; this.classList.add(\'bg-neutral-700\');">\n                    <div class="champion-overlay">\n                        <h3 class="text-lg font-semibold font-heading truncate">'
+            yield escape(environment.getattr(l_1_champion, 'winner_name'))
+            yield '</h3>\n                        <p class="text-sm text-amber-300">'
+            yield escape(environment.getattr(l_1_champion, 'year'))
+            yield ' Champion</p>\n                    </div>\n                    <span class="champion-crown" title="'
+            yield escape(environment.getattr(l_1_champion, 'year'))
+            yield ' Champion">🏆</span>\n                </a>\n            </div>\n        '
+        l_1_champion = missing
+        yield '\n    </div>\n</div>\n'
+    yield '\n\n\n'
+    if (undefined(name='all_toilet_losers') if l_0_all_toilet_losers is missing else l_0_all_toilet_losers):
+        pass
+        yield '\n<div class="bg-white p-6 sm:p-8 rounded-xl shadow-xl border border-neutral-200/80 mb-10 card-hover-effect">\n    <h2 class="text-3xl font-bold font-heading text-rose-700 mb-6 text-center border-b border-neutral-300 pb-4">Hall of Shame</h2>\n    <div class="grid grid-cols-1 sm:grid-cols-2 md:grid-cols-3 lg:grid-cols-4 gap-6">\n        '
+        for l_1_loser in (undefined(name='all_toilet_losers') if l_0_all_toilet_losers is missing else l_0_all_toilet_losers):
+            _loop_vars = {}
+            pass
+            yield '\n            <div class="shame-card bg-neutral-700 rounded-lg shadow-lg card-hover-effect"> \n                <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr(l_1_loser, 'loser_id'), _loop_vars=_loop_vars))
+            yield '" class="block">\n                    <img src="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename=(('images/players/' + t_1(environment.getattr(l_1_loser, 'loser_id'))) + '.png'), _loop_vars=_loop_vars))
+            yield '"\n                         alt="Toilet Bowl Loser: '
+            yield escape(environment.getattr(l_1_loser, 'loser_name'))
+            yield '"\n                         class="shame-image rounded-t-lg"\n                         onerror="this.onerror=null; this.src=\'https://placehold.co/300x240/4b5563/e2e8f0?text='
+            yield escape((t_2(environment.getitem(environment.getattr(l_1_loser, 'loser_name'), 0)) if environment.getattr(l_1_loser, 'loser_name') else 'S'))
+            yield '&font=lexend\'; this.classList.add(\'bg-neutral-600\');">\n                    <div class="shame-overlay">\n                        <h3 class="text-lg font-semibold font-heading truncate">'
+            yield escape(environment.getattr(l_1_loser, 'loser_name'))
+            yield '</h3>\n                        <p class="text-sm text-rose-300">'
+            yield escape(environment.getattr(l_1_loser, 'year'))
+            yield ' Toilet Bowl Loser</p>\n                    </div>\n                    <span class="shame-indicator" title="'
+            yield escape(environment.getattr(l_1_loser, 'year'))
+            yield ' Toilet Bowl Loser">💩</span> \n                </a>\n            </div>\n        '
+        l_1_loser = missing
+        yield '\n    </div>\n</div>\n'
+    yield '\n\n\n<div class="bg-white p-6 sm:p-8 rounded-xl shadow-xl border border-neutral-200/80 card-hover-effect">\n    <h2 class="text-2xl font-semibold font-heading mb-6 text-neutral-800 border-b border-neutral-300 pb-3">League Members</h2>\n    '
+    if (undefined(name='players') if l_0_players is missing else l_0_players):
+        pass
+        yield '\n        <ul class="grid grid-cols-2 sm:grid-cols-3 md:grid-cols-4 lg:grid-cols-5 gap-4">\n            '
+        for l_1_player in (undefined(name='players') if l_0_players is missing else l_0_players):
+            _loop_vars = {}
+            pass
+            yield '\n                <li class="bg-neutral-50 hover:bg-primary-light/30 border border-transparent hover:border-primary-medium/50 p-3 rounded-lg shadow-sm hover:shadow-md transition duration-200 text-center transform hover:scale-105">\n                    <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'player_detail', player_id=environment.getattr(l_1_player, 'player_id'), _loop_vars=_loop_vars))
+            yield '" class="font-medium text-primary-medium hover:text-primary-dark block py-2">\n                        '
+            yield escape(environment.getattr(l_1_player, 'name'))
+            yield '\n                    </a>\n                </li>\n            '
+        l_1_player = missing
+        yield '\n        </ul>\n    '
+    else:
+        pass
+        yield '\n        <p class="text-neutral-500">No players found in the database.</p>\n    '
+    yield '\n</div>\n'
+
+blocks = {'title': block_title, 'head': block_head, 'content': block_content}
+debug_info = '1=12&3=17&5=27&6=38&74=40&81=43&85=69&97=71&108=73&110=76&111=78&113=80&115=82&116=84&117=86&129=92&133=95&135=99&136=101&137=103&139=105&141=107&142=109&144=111&153=116&157=119&159=123&160=125&161=127&163=129&165=131&166=133&168=135&179=140&181=143&183=147&184=149'
\ No newline at end of file
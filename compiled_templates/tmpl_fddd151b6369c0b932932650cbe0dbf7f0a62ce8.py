@@ -0,0 +1,119 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'base.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    l_0_league = resolve('league')
+    l_0_frozen = resolve('frozen')
+    l_0_has_leagues = resolve('has_leagues')
+    l_0_current_year = resolve('current_year')
+    pass
+    yield '<!doctype html>\n<html lang="en">\n<head>\n    <meta charset="utf-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <script src="https://cdn.tailwindcss.com"></script>\n    <link rel="preconnect" href="https://fonts.googleapis.com">\n    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&family=Lexend:wght@400;500;600;700&display=swap" rel="stylesheet">\n    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.min.js"></script>\n    <link rel="icon" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='images/favicon.png'))
+    yield '" type="image/png">\n\n    <script>\n        tailwind.config = {\n          theme: {\n            extend: {\n              fontFamily: {\n                sans: [\'Inter\', \'ui-sans-serif\', \'system-ui\', \'-apple-system\', \'BlinkMacSystemFont\', \'"Segoe UI"\', \'Roboto\', \'"Helvetica Neue"\', \'Arial\', \'"Noto Sans"\', \'sans-serif\', \'"Apple Color Emoji"\', \'"Segoe UI Emoji"\', \'"Segoe UI Symbol"\', \'"Noto Color Emoji"\'],\n                heading: [\'Lexend\', \'ui-sans-serif\', \'system-ui\', \'-apple-system\', \'BlinkMacSystemFont\', \'"Segoe UI"\', \'Roboto\', \'"Helvetica Neue"\', \'Arial\', \'"Noto Sans"\', \'sans-serif\']\n              },\n              colors: {\n                primary: { light: \'#ccfbf1\', DEFAULT: \'#14b8a6\', medium: \'#0d9488\', dark: \'#0f766e\', darker: \'#134e4a\' },\n                amber: { light: \'#fef3c7\', DEFAULT: \'#f59e0b\', dark: \'#b45309\' },\n                neutral: {\n                    50: \'#f8fafc\', 100: \'#f1f5f9\', 200: \'#e2e8f0\', 300: \'#cbd5e1\',\n                    400: \'#94a3b8\', 500: \'#64748b\', 600: \'#475569\', 700: \'#334155\',\n                    800: \'#1e293b\', 900: \'#0f172a\'\n                }\n              },\n              animation: {\n                \'modal-enter\': \'modal-enter 0.3s ease-out forwards\',\n                \'slide-down\': \'slide-down 0.3s ease-out forwards\',\n              },\n              keyframes: {\n                \'modal-enter\': {\n                  \'0%\': { opacity: \'0\', transform: \'scale(0.95) translateY(-10px)\' },\n                  \'100%\': { opacity: \'1\', transform: \'scale(1) translateY(0)\' },\n                },\n                \'slide-down\': {\n                  \'0%\': { opacity: \'0\', transform: \'translateY(-10px)\' },\n                  \'100%\': { opacity: \'1\', transform: \'translateY(0)\' },\n                }\n              }\n            }\n          }\n        }\n      </script>\n    <title>'
+    yield from context.blocks['title'][0](context)
+    yield '</title>\n    <style>\n        body { font-family: tailwind.config.theme.extend.fontFamily.sans; }\n        h1, h2, h3, h4, h5, h6 { font-family: tailwind.config.theme.extend.fontFamily.heading; }\n        .modal { display: none; position: fixed; z-index: 1000; left: 0; top: 0; width: 100%; height: 100%; overflow: auto; background-color: rgba(15, 23, 42, 0.85); align-items: center; justify-content: center; padding: 1rem; }\n        .modal-content-wrapper { animation: modal-enter 0.3s ease-out forwards; background-color: #fff; border-radius: 0.5rem; box-shadow: 0 20px 25px -5px rgba(0,0,0,0.1), 0 10px 10px -5px rgba(0,0,0,0.04); overflow: hidden; display: flex; justify-content: center; align-items: center; }\n        .modal-content { display: block; width: auto; max-width: 90vw; max-height: 90vh; border-radius: 0.375rem; }\n        .modal-close { position: absolute; top: 20px; right: 25px; color: #e2e8f0; font-size: 2.25rem; font-weight: bold; transition: color 0.3s ease; z-index: 1001; }\n        .modal-close:hover, .modal-close:focus { color: #cbd5e1; text-decoration: none; cursor: pointer; }\n        .overflow-x-auto::-webkit-scrollbar { height: 8px; }\n        .overflow-x-auto::-webkit-scrollbar-track { background: #f1f5f9; border-radius: 10px; }\n        .overflow-x-auto::-webkit-scrollbar-thumb { background: #94a3b8; border-radius: 10px; }\n        .overflow-x-auto::-webkit-scrollbar-thumb:hover { background: #64748b; }\n\n        /* Mobile Menu Styles */\n        .mobile-menu {\n            animation: slide-down 0.3s ease-out forwards;\n        }\n        /* Scrolled Header Styles */\n        nav.scrolled {\n            padding-top: 0.5rem; /* py-2 */\n            padding-bottom: 0.5rem; /* py-2 */\n            background-color: rgba(15, 118, 110, 0.95); /* primary-dark with slight transparency */\n            backdrop-filter: blur(5px);\n            box-shadow: 0 4px 6px -1px rgba(0,0,0,0.1), 0 2px 4px -1px rgba(0,0,0,0.06); /* shadow-md */\n        }\n        nav.scrolled .site-title-text {\n             /* Optionally hide or shrink text part of logo on scroll for mobile */\n            /* display: none; */ /* Example: hides text, leaves icon */\n        }\n        /* Ensure hamburger is always visible when it should be */\n        .hamburger-button {\n             z-index: 100; /* Keep hamburger above other nav content if it overlaps */\n        }\n\n    </style>\n    '
+    yield from context.blocks['head'][0](context)
+    yield '\n</head>\n<body class="bg-neutral-100 text-neutral-800 font-sans antialiased">\n\n    <nav id="mainNav" class="bg-gradient-to-r from-primary-medium to-primary-dark text-white shadow-lg sticky top-0 z-50 border-b border-primary-darker/30 transition-all duration-300 ease-in-out">\n        <div class="container mx-auto px-4 sm:px-6 lg:px-8 py-3">\n            <div class="flex items-center justify-between">\n                \n                <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'index'))
+    yield '" class="flex items-center text-xl md:text-2xl font-bold hover:text-primary-light transition duration-200">\n                    <img src="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='images/favicon.png'))
+    yield '" alt="FSFL Logo" class="inline-block h-7 w-7 mr-2 -mt-1">\n                    <span class="font-heading site-title-text">Full Service Fantasy Hub</span>\n                    '
+    if (undefined(name='league') if l_0_league is missing else l_0_league):
+        pass
+        yield '<span class="ml-2 text-sm font-medium text-primary-light">'
+        yield escape((undefined(name='league') if l_0_league is missing else l_0_league))
+        yield '</span>'
+    yield '\n                </a>\n\n                \n                <div class="sm:hidden">\n                    <button id="hamburgerButton" type="button" class="hamburger-button text-neutral-200 hover:text-white focus:outline-none focus:ring-2 focus:ring-inset focus:ring-white p-1 rounded-md" aria-controls="mobileNavLinks" aria-expanded="false">\n                        <span class="sr-only">Open main menu</span>\n                        \n                        <svg class="block h-7 w-7" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24" stroke="currentColor" aria-hidden="true">\n                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M4 6h16M4 12h16M4 18h16" />\n                        </svg>\n                    </button>\n                </div>\n\n                \n                <div id="desktopNavLinks" class="hidden sm:flex sm:flex-row sm:flex-wrap items-center gap-x-2 gap-y-2 text-sm font-medium">\n                    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'index'))
+    yield '" class="px-3 py-2 rounded-md hover:bg-primary-darker/70 focus:bg-primary-darker/70 active:bg-primary-darker transition duration-150">Home</a>\n                    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'seasons_list'))
+    yield '" class="px-3 py-2 rounded-md hover:bg-primary-darker/70 focus:bg-primary-darker/70 active:bg-primary-darker transition duration-150">Seasons</a>\n                    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'standings'))
+    yield '" class="px-3 py-2 rounded-md hover:bg-primary-darker/70 focus:bg-primary-darker/70 active:bg-primary-darker transition duration-150">Standings</a>\n                    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'head_to_head'))
+    yield '" class="px-3 py-2 rounded-md hover:bg-primary-darker/70 focus:bg-primary-darker/70 active:bg-primary-darker transition duration-150">Head-to-Head</a>\n                    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'record_book'))
+    yield '" class="px-3 py-2 rounded-md hover:bg-primary-darker/70 focus:bg-primary-darker/70 active:bg-primary-darker transition duration-150">Record Book</a>\n                    '
+    if (not (undefined(name='frozen') if l_0_frozen is missing else l_0_frozen)):
+        pass
+        yield '<a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'search_page'))
+        yield '" class="px-3 py-2 rounded-md hover:bg-primary-darker/70 focus:bg-primary-darker/70 active:bg-primary-darker transition duration-150">Search</a>'
+    yield '\n                    '
+    if (undefined(name='has_leagues') if l_0_has_leagues is missing else l_0_has_leagues):
+        pass
+        yield '<a href="/leagues" class="px-3 py-2 rounded-md hover:bg-primary-darker/70 focus:bg-primary-darker/70 active:bg-primary-darker transition duration-150">Leagues</a>'
+    yield '\n                </div>\n            </div>\n\n            \n            <div id="mobileNavLinks" class="hidden sm:hidden mt-3 space-y-1 mobile-menu">\n                <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'index'))
+    yield '" class="block px-3 py-2 rounded-md text-base font-medium hover:bg-primary-darker/70 focus:bg-primary-darker/70 active:bg-primary-darker transition duration-150">Home</a>\n                <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'seasons_list'))
+    yield '" class="block px-3 py-2 rounded-md text-base font-medium hover:bg-primary-darker/70 focus:bg-primary-darker/70 active:bg-primary-darker transition duration-150">Seasons</a>\n                <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'standings'))
+    yield '" class="block px-3 py-2 rounded-md text-base font-medium hover:bg-primary-darker/70 focus:bg-primary-darker/70 active:bg-primary-darker transition duration-150">Standings</a>\n                <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'head_to_head'))
+    yield '" class="block px-3 py-2 rounded-md text-base font-medium hover:bg-primary-darker/70 focus:bg-primary-darker/70 active:bg-primary-darker transition duration-150">Head-to-Head</a>\n                <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'record_book'))
+    yield '" class="block px-3 py-2 rounded-md text-base font-medium hover:bg-primary-darker/70 focus:bg-primary-darker/70 active:bg-primary-darker transition duration-150">Record Book</a>\n                '
+    if (not (undefined(name='frozen') if l_0_frozen is missing else l_0_frozen)):
+        pass
+        yield '<a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'search_page'))
+        yield '" class="block px-3 py-2 rounded-md text-base font-medium hover:bg-primary-darker/70 focus:bg-primary-darker/70 active:bg-primary-darker transition duration-150">Search</a>'
+    yield '\n                '
+    if (undefined(name='has_leagues') if l_0_has_leagues is missing else l_0_has_leagues):
+        pass
+        yield '<a href="/leagues" class="block px-3 py-2 rounded-md text-base font-medium hover:bg-primary-darker/70 focus:bg-primary-darker/70 active:bg-primary-darker transition duration-150">Leagues</a>'
+    yield '\n            </div>\n        </div>\n    </nav>\n\n    <main class="container mx-auto px-4 sm:px-6 lg:px-8 py-6 sm:py-8">\n        '
+    yield from context.blocks['content'][0](context)
+    yield '\n    </main>\n\n    <div id="imageModal" class="modal">\n        <span class="modal-close" onclick="closeModal()">&times;</span>\n        <div class="modal-content-wrapper">\n            <img class="modal-content" id="modalImage" alt="Enlarged league image">\n        </div>\n    </div>\n\n    <footer class="bg-neutral-900 text-neutral-400 text-center py-6 mt-16 border-t border-neutral-800">\n        <div class="container mx-auto px-4 text-sm">\n            &copy; '
+    yield escape((undefined(name='current_year') if l_0_current_year is missing else l_0_current_year))
+    yield ' Full Service Fantasy - <span class="font-heading">Powered by AI</span>\n        </div>\n    </footer>\n\n    <script>\n        // Modal JS (existing)\n        var modal = document.getElementById("imageModal");\n        var modalImg = document.getElementById("modalImage");\n        var modalContentWrapper = modal.querySelector(".modal-content-wrapper");\n        function openModal(imgElement) {\n            if (modal && modalImg) {\n                modal.style.display = "flex";\n                modalImg.src = imgElement.src;\n                modalImg.alt = imgElement.alt;\n                modalContentWrapper.classList.add(\'animate-modal-enter\');\n            }\n        }\n        function closeModal() {\n            if (modal) {\n                modalContentWrapper.classList.remove(\'animate-modal-enter\');\n                modal.style.display = "none";\n            }\n        }\n        window.onclick = function(event) {\n            if (event.target == modal) { closeModal(); }\n        }\n        document.addEventListener(\'keydown\', function(event) {\n            if (event.key === "Escape" && modal.style.display === "flex") { closeModal(); }\n        });\n\n        // Mobile Menu Toggle & Scroll Behavior\n        const hamburgerButton = document.getElementById(\'hamburgerButton\');\n        const mobileNavLinks = document.getElementById(\'mobileNavLinks\');\n        const mainNav = document.getElementById(\'mainNav\');\n\n        if (hamburgerButton && mobileNavLinks) {\n            hamburgerButton.addEventListener(\'click\', function() {\n                const expanded = this.getAttribute(\'aria-expanded\') === \'true\' || false;\n                this.setAttribute(\'aria-expanded\', !expanded);\n                mobileNavLinks.classList.toggle(\'hidden\');\n                // Optional: Change hamburger icon to X\n                // this.innerHTML = expanded ? \'<svg class="block h-7 w-7" ...>M4 6h16M4 12h16M4 18h16</svg>\' : \'<svg class="block h-7 w-7" ...>M6 18L18 6M6 6l12 12</svg>\';\n            });\n        }\n\n        let lastScrollTop = 0;\n        window.addEventListener(\'scroll\', function() {\n            let scrollTop = window.pageYOffset || document.documentElement.scrollTop;\n            if (scrollTop > 50) { // Add \'scrolled\' class after scrolling 50px\n                mainNav.classList.add(\'scrolled\');\n            } else {\n                mainNav.classList.remove(\'scrolled\');\n            }\n            // Optional: Hide/show header based on scroll direction (more complex)\n            // if (scrollTop > lastScrollTop && scrollTop > 100) { // Scrolling Down\n            //     mainNav.style.top = \'-100px\'; // Adjust to header height\n            // } else { // Scrolling Up\n            //     mainNav.style.top = \'0\';\n            // }\n            // lastScrollTop = scrollTop <= 0 ? 0 : scrollTop; // For Mobile or negative scrolling\n        }, false);\n\n    </script>\n    '
+    yield from context.blocks['scripts'][0](context)
+    yield '\n</body>\n</html>'
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Full Service Fantasy League'
+
+def block_head(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n        '
+
+def block_scripts(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+
+blocks = {'title': block_title, 'head': block_head, 'content': block_content, 'scripts': block_scripts}
+debug_info = '11=17&48=19&84=21&92=23&93=25&95=27&111=33&112=35&113=37&114=39&115=41&116=43&117=49&123=53&124=55&125=57&126=59&127=61&128=63&129=69&135=73&148=75&211=77&48=80&84=90&135=99&211=109'
\ No newline at end of file
@@ -0,0 +1,118 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'standings.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'standings.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'All-Time Standings - Fantasy League'
+
+def block_head(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_super = context.super('head', block_head)
+    _block_vars = {}
+    l_0_tailwind = resolve('tailwind')
+    pass
+    yield '\n    '
+    yield escape(context.call(l_0_super, _block_vars=_block_vars))
+    yield '\n    <style>\n        .table-player-image {\n            width: 32px; /* Small image for table rows */\n            height: 32px;\n            object-fit: cover;\n            object-position: center top;\n            border-radius: 0.25rem; /* rounded-sm */\n            border: 1px solid '
+    yield escape((environment.getitem(environment.getattr(environment.getattr(environment.getattr(environment.getattr(environment.getattr((undefined(name='tailwind') if l_0_tailwind is missing else l_0_tailwind), 'config'), 'theme'), 'extend'), 'colors'), 'neutral'), 300) if (undefined(name='tailwind') if l_0_tailwind is missing else l_0_tailwind) else '#cbd5e1'))
+    yield ';\n            box-shadow: 0 1px 2px 0 rgba(0,0,0,0.05);\n            margin-right: 0.75rem; /* mr-3 */\n            flex-shrink: 0;\n        }\n    </style>\n'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_standings_data = resolve('standings_data')
+    try:
+        t_1 = environment.filters['default']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'default' found.")
+    try:
+        t_2 = environment.filters['round']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'round' found.")
+    try:
+        t_3 = environment.filters['string']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'string' found.")
+    try:
+        t_4 = environment.filters['upper']
+    except KeyError:
+        @internalcode
+        def t_4(*unused):
+            raise TemplateRuntimeError("No filter named 'upper' found.")
+    pass
+    yield '\n<div class="bg-white p-6 rounded-xl shadow-xl border border-neutral-200/80 mb-8 card-hover-effect">\n    <h1 class="text-3xl font-bold font-heading mb-6 text-primary-dark border-b border-neutral-300 pb-3">All-Time Regular Season Standings</h1>\n\n    '
+    if (undefined(name='standings_data') if l_0_standings_data is missing else l_0_standings_data):
+        pass
+        yield '\n        <p class="text-sm text-neutral-600 mb-4">Ranked by career regular season win percentage.</p>\n        <div class="overflow-x-auto shadow-md rounded-lg border border-neutral-200/80">\n            <table class="min-w-full divide-y divide-neutral-200">\n                <thead class="bg-neutral-100">\n                    <tr>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Rank</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Player</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Record (W-L-T)</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Win %</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Total PF</th>\n                        <th scope="col" class="px-4 py-3 text-left text-xs font-semibold text-neutral-600 uppercase tracking-wider">Total PA</th>\n                    </tr>\n                </thead>\n                <tbody class="bg-white divide-y divide-neutral-200">\n                    '
+        l_1_loop = missing
+        for l_1_player_stats, l_1_loop in LoopContext((undefined(name='standings_data') if l_0_standings_data is missing else l_0_standings_data), undefined):
+            l_1_url_for = resolve('url_for')
+            _loop_vars = {}
+            pass
+            yield '\n                        <tr class="hover:bg-primary-light/20 transition duration-150">\n                            <td class="px-4 py-3 whitespace-nowrap text-sm font-medium text-neutral-700">'
+            yield escape(environment.getattr(l_1_loop, 'index'))
+            yield '</td>\n                            <td class="px-4 py-3 whitespace-nowrap text-sm font-medium text-primary-medium">\n                                <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_1_url_for is missing else l_1_url_for), 'player_detail', player_id=environment.getattr(l_1_player_stats, 'player_id'), _loop_vars=_loop_vars))
+            yield '" class="flex items-center hover:text-primary-dark hover:underline">\n                                    <img src="'
+            yield escape(context.call((undefined(name='url_for') if l_1_url_for is missing else l_1_url_for), 'static', filename=(('images/players/' + t_3(environment.getattr(l_1_player_stats, 'player_id'))) + '.png'), _loop_vars=_loop_vars))
+            yield '"\n                                         alt="'
+            yield escape(environment.getattr(l_1_player_stats, 'name'))
+            yield '"\n                                         class="table-player-image"\n                                         onerror="this.onerror=null; this.src=\'https://placehold.co/32x32/e2e8f0/94a3b8?text='
+            yield escape((t_4(environment.getitem(environment.getattr(l_1_player_stats, 'name'), 0)) if environment.getattr(l_1_player_stats, 'name') else 'P'))
+            yield '\'; this.classList.add(\'bg-neutral-300\');">\n                                    <span>'
+            yield escape(environment.getattr(l_1_player_stats, 'name'))
+            yield '</span>\n                                </a>\n                            </td>\n                            <td class="px-4 py-3 whitespace-nowrap text-sm text-neutral-600">\n                                '
+            yield escape(t_1(environment.getattr(l_1_player_stats, 'total_wins'), 0, True))
+            yield '-'
+            yield escape(t_1(environment.getattr(l_1_player_stats, 'total_losses'), 0, True))
+            yield '-'
+            yield escape(t_1(environment.getattr(l_1_player_stats, 'total_ties'), 0, True))
+            yield '\n                            </td>\n                             <td class="px-4 py-3 whitespace-nowrap text-sm text-neutral-600">\n                                '
+            yield escape(t_2(t_1(environment.getattr(l_1_player_stats, 'win_percentage'), 0.0, True), 1))
+            yield '%\n                            </td>\n                            <td class="px-4 py-3 whitespace-nowrap text-sm text-green-700">\n                                '
+            yield escape(context.call(environment.getattr('{:,.2f}', 'format'), t_1(environment.getattr(l_1_player_stats, 'total_pf'), 0.0, True), _loop_vars=_loop_vars))
+            yield '\n                            </td>\n                             <td class="px-4 py-3 whitespace-nowrap text-sm text-red-700">\n                                '
+            yield escape(context.call(environment.getattr('{:,.2f}', 'format'), t_1(environment.getattr(l_1_player_stats, 'total_pa'), 0.0, True), _loop_vars=_loop_vars))
+            yield '\n                            </td>\n                        </tr>\n                    '
+        l_1_loop = l_1_player_stats = l_1_url_for = missing
+        yield '\n                </tbody>\n            </table>\n        </div>\n    '
+    else:
+        pass
+        yield '\n        <p class="text-neutral-500 mt-4">Could not calculate all-time standings.</p>\n    '
+    yield '\n</div>\n'
+
+blocks = {'title': block_title, 'head': block_head, 'content': block_content}
+debug_info = '1=12&3=17&5=27&6=38&14=40&22=43&26=77&41=81&43=86&45=88&46=90&47=92&49=94&50=96&54=98&57=104&60=106&63=108'
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""In-process caches for data derived from the SQLite file.
+
+Every page is a pure function of the .db file, so anything expensive we build
+from it can live for as long as the file is unchanged. Entries are keyed on a
+fingerprint of the file (size, mtime, content hash) and rebuilt when it moves.
+"""
+import hashlib
+import os
+import threading
+
+_HASH_CHUNK = 1 << 20
+
+_fingerprints = {}  # path -> (size, mtime_ns, sha1 hexdigest)
+_fingerprint_lock = threading.Lock()
+
+
+def db_fingerprint(path):
+    # A stat() per call is cheap; the file is only re-hashed when size/mtime change.
+    st = os.stat(path)
+    cached = _fingerprints.get(path)
+    if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+        return cached
+    with _fingerprint_lock:
+        cached = _fingerprints.get(path)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+                digest.update(chunk)
+        fingerprint = (st.st_size, st.st_mtime_ns, digest.hexdigest())
+        _fingerprints[path] = fingerprint
+        return fingerprint
+
+
+def file_signature(path):
+    """(size, mtime_ns) of a file, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _close(value):
+    close = getattr(value, 'close', None)
+    if close is not None:
+        close()
+
+
+class FingerprintCache:
+    """Maps (db path, key) to a value built from that db, valid until the file changes.
+
+    A value that also reads other files (a sidecar index next to the DB) lists
+    them in depends_on and is rebuilt when one of them is rewritten, too.
+    Values with a close() method are closed when they are replaced, evicted or
+    cleared.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        # One lock per (path, key), so a slow build only holds up requests for the same value;
+        # builders may read other cached values.
+        self._build_locks = {}
+
+    def get_or_build(self, path, key, builder, depends_on=()):
+        stamp = (db_fingerprint(path),) + tuple(file_signature(p) for p in depends_on)
+        entry = self._entries.get((path, key))
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        with self._lock:
+            build_lock = self._build_locks.setdefault((path, key), threading.Lock())
+        with build_lock:
+            # Another thread may have rebuilt it while we waited.
+            entry = self._entries.get((path, key))
+            if entry is not None and entry[0] == stamp:
+                return entry[1]
+            value = builder()
+            self._entries[(path, key)] = (stamp, value)
+            if entry is not None:
+                _close(entry[1])
+            return value
+
+    def evict(self, path):
+        """Drops every entry built from `path`."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == path]:
+                _close(self._entries.pop(key)[1])
+            for key in [k for k in self._build_locks if k[0] == path]:
+                del self._build_locks[key]
+            _fingerprints.pop(path, None)
+
+    def clear(self):
+        with self._lock:
+            entries, self._entries = self._entries, {}
+        for _, value in entries.values():
+            _close(value)
+
+
+# Shared by every engine that derives data from the league DB.
+derived_cache = FingerprintCache()
@@ -0,0 +1,270 @@
+"""Indexes for the league DB and a query-plan regression check.
+
+    python db_indexes.py migrate [--db PATH]   # add missing indexes, rebuild changed ones (idempotent)
+    python db_indexes.py check [--db PATH]     # EXPLAIN every query the app runs, fail on a full SCAN
+
+The app opens the DB read-only, so `migrate` is run against the .db file before
+it is deployed. Each index holds only the columns the routes seek and filter
+on; the tables are a few thousand rows, so a rowid lookup per match costs less
+than storing every selected column a second time. When it rebuilds an index,
+`migrate` VACUUMs so the dropped pages leave the file.
+
+`check` reads the SQL passed to fetch_record, fetch_all_records and execute in
+every module that queries the league DB while serving (plus ingest.py). SQL
+built at runtime is checked through the module's plan_samples(), which returns
+the statements each builder can produce; a dynamic query with no samples is
+reported as not analyzed and fails the check, as does any SCAN (through an
+index or not) outside the bulk readers listed in BULK_READERS.
+"""
+import argparse
+import ast
+import importlib.util
+import os
+import re
+import sqlite3
+import sys
+
+APP_ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB = os.path.join(APP_ROOT_DIR, 'REAL_Fantasy_Football_DB.db')
+DEFAULT_SOURCES = [os.path.join(APP_ROOT_DIR, name) for name in (
+    'app.py', 'api.py', 'search.py', 'career_profiles.py', 'records_engine.py', 'h2h_matrix.py',
+    'playoff_odds.py', 'season_timeline.py', 'game_log.py', 'leagues.py', 'ingest.py')]
+
+# (name, table, columns) - one per access pattern used by the routes: the columns
+# their WHERE clauses and joins seek on, nothing they only select.
+INDEXES = [
+    ('idx_players_name', 'players', 'name'),
+    ('idx_seasons_year', 'seasons', 'year'),
+    ('idx_wm_season_week', 'weekly_matchups', 'season_id, week_start'),
+    ('idx_wm_p1_p2', 'weekly_matchups', 'player1_id, player2_id'),
+    ('idx_wm_p2_p1', 'weekly_matchups', 'player2_id, player1_id'),
+    ('idx_wm_type', 'weekly_matchups', 'game_type'),
+    ('idx_sr_season_rank', 'season_results', 'season_id, rank'),
+    ('idx_sr_player_season', 'season_results', 'player_id, season_id'),
+    ('idx_ch_season', 'championships', 'season_id'),
+    ('idx_ch_winner', 'championships', 'winner_id'),
+    ('idx_ch_runner_up', 'championships', 'runner_up_id'),
+]
+# Indexes an earlier INDEXES had under another name; `migrate` drops them.
+RETIRED_INDEXES = ('idx_wm_type_season',)
+
+# Tables that some pages list in full by design (e.g. every player in the standings).
+ROSTER_TABLES = {'players'}
+
+# Functions that read whole tables on purpose. Most build data that is cached
+# per DB fingerprint or run offline (CLIs, rebuilds), so the scan runs once per
+# version of the file rather than per request. The app.py views list every
+# season (one row per year) by design. SearchIndex.search walks idx_games_year_week
+# in ORDER BY order and stops at its LIMIT.
+BULK_READERS = {
+    'app.py': {'league_summary', 'seasons_list', 'search_page', 'api_seasons'},
+    'records_engine.py': {'load_league'},
+    'career_profiles.py': {'build_profiles'},
+    'h2h_matrix.py': {'build_matrix'},
+    'game_log.py': {'GameLog.from_db'},
+    'playoff_odds.py': {'simulate_league'},
+    'search.py': {'populate', 'SearchIndex.open', 'update_sidecar', 'SearchIndex.search'},
+    'leagues.py': {'summarize'},
+    'ingest.py': {'_Resolver.__init__', 'drift'},
+}
+
+# Modules that also query a sidecar DB of their own: module -> (connection names used for it, schema attribute).
+SIDECAR_SCHEMAS = {'search.py': ({'index', 'conn', 'self._conn'}, 'SCHEMA')}
+
+QUERY_FUNCTIONS = {'fetch_record', 'fetch_all_records', 'execute'}
+# Transaction control has no plan to check.
+_NO_PLAN = re.compile(r'\s*(BEGIN|COMMIT|ROLLBACK|PRAGMA)\b', re.IGNORECASE)
+
+
+def _columns(spec):
+    return [c.strip() for c in spec.split(',')]
+
+
+def migrate(db_path):
+    """Creates missing indexes and rebuilds any whose columns differ from INDEXES; returns their names."""
+    conn = sqlite3.connect(db_path)
+    try:
+        existing = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        created, dropped = [], False
+        with conn:
+            for name in RETIRED_INDEXES:
+                if name in existing:
+                    conn.execute(f"DROP INDEX {name}")
+                    dropped = True
+            for name, table, columns in INDEXES:
+                if name in existing:
+                    if [r[2] for r in conn.execute(f"PRAGMA index_info({name})")] == _columns(columns):
+                        continue
+                    conn.execute(f"DROP INDEX {name}")
+                    dropped = True
+                conn.execute(f"CREATE INDEX {name} ON {table} ({columns})")
+                created.append(name)
+            if created:
+                conn.execute("ANALYZE")
+        if dropped:
+            conn.execute("VACUUM")
+        return created
+    finally:
+        conn.close()
+
+
+class _QueryFinder(ast.NodeVisitor):
+    """Collects (line, function, receiver, sql) for query helper calls; sql is None when it can't be read statically."""
+
+    def __init__(self, constants):
+        self.constants = constants
+        self.scope = []
+        self.params = []
+        self.queries = []
+
+    def _function(self, node):
+        self.scope.append(node.name)
+        self.params.append({a.arg for a in node.args.args + node.args.kwonlyargs})
+        self.generic_visit(node)
+        self.scope.pop()
+        self.params.pop()
+
+    visit_FunctionDef = visit_AsyncFunctionDef = _function
+
+    def visit_ClassDef(self, node):
+        self.scope.append(node.name)
+        self.generic_visit(node)
+        self.scope.pop()
+
+    def visit_Call(self, node):
+        func = node.func
+        name = func.id if isinstance(func, ast.Name) else getattr(func, 'attr', None)
+        if name in QUERY_FUNCTIONS and node.args:
+            sql = node.args[0]
+            # A helper handing its own argument on (fetch_record's `query`): its callers are checked instead.
+            if not (isinstance(sql, ast.Name) and self.params and sql.id in self.params[-1]):
+                receiver = ast.unparse(func.value) if isinstance(func, ast.Attribute) else ''
+                for choice in (sql.body, sql.orelse) if isinstance(sql, ast.IfExp) else (sql,):
+                    self.queries.append((node.lineno, '.'.join(self.scope) or '<module>', receiver, self._resolve(choice)))
+        self.generic_visit(node)
+
+    def _resolve(self, node):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return node.value
+        if isinstance(node, ast.Name):
+            return self.constants.get(node.id)
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+            left, right = self._resolve(node.left), self._resolve(node.right)
+            return None if left is None or right is None else left + right
+        if isinstance(node, ast.JoinedStr):
+            parts = [self._resolve(v.value if isinstance(v, ast.FormattedValue) else v) for v in node.values]
+            return None if None in parts else ''.join(parts)
+        return None
+
+
+def extract_queries(source_path):
+    """Returns (line, function, receiver, sql) for every query helper call; sql is None if it is built at runtime."""
+    with open(source_path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), source_path)
+    constants = {}
+    for node in tree.body:  # module-level string constants, which f-strings and + may use
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            value = _QueryFinder(constants)._resolve(node.value)
+            if value is not None:
+                constants[node.targets[0].id] = value
+    finder = _QueryFinder(constants)
+    finder.visit(tree)
+    return sorted(finder.queries, key=lambda q: q[0])
+
+
+def _module(source_path):
+    spec = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(source_path))[0], source_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _table_aliases(sql):
+    aliases = {}
+    for table, alias in re.findall(r'\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?', sql, re.IGNORECASE):
+        aliases[table] = table
+        if alias and alias.upper() not in ('WHERE', 'JOIN', 'ON', 'LEFT', 'INNER', 'GROUP', 'ORDER', 'LIMIT', 'UNION'):
+            aliases[alias] = table
+    return aliases
+
+
+def full_scans(conn, sql):
+    """Plan steps that read a whole table or index, ignoring roster tables.
+
+    A SCAN through an index (covering or not) still visits every row; only an
+    FTS5 MATCH (a virtual table plan whose index string has an M) is a lookup.
+    """
+    aliases = _table_aliases(sql)
+    plan = conn.execute('EXPLAIN QUERY PLAN ' + sql, [None] * sql.count('?')).fetchall()
+    bad = []
+    for row in plan:
+        detail = row[3]
+        m = re.match(r'SCAN (\w+)', detail)
+        if m is None or aliases.get(m.group(1), m.group(1)) in ROSTER_TABLES:
+            continue
+        if re.search(r'VIRTUAL TABLE INDEX \d+:\w*M', detail):
+            continue
+        bad.append(detail)
+    return bad
+
+
+def check(db_path, sources):
+    """Prints every query that scans a table or couldn't be analyzed; returns (scans, not analyzed)."""
+    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    failures = unanalyzed = 0
+    try:
+        for source in sources:
+            base = os.path.basename(source)
+            queries = extract_queries(source)
+            module = None
+            if base in SIDECAR_SCHEMAS or any(sql is None for _, _, _, sql in queries):
+                module = _module(source)
+            sidecar = None
+            if base in SIDECAR_SCHEMAS:
+                sidecar = sqlite3.connect(':memory:')
+                sidecar.executescript(getattr(module, SIDECAR_SCHEMAS[base][1]))
+            samples = module.plan_samples() if hasattr(module, 'plan_samples') else {}
+            for line, function, receiver, sql in queries:
+                if sql is None:
+                    if not samples.get(function):
+                        unanalyzed += 1
+                        print(f"{base}:{line}: not analyzed: {function}() builds this query at runtime and {base} has no plan_samples() for it")
+                        continue
+                    statements = samples[function]
+                else:
+                    statements = [sql]
+                target = sidecar if sidecar is not None and receiver in SIDECAR_SCHEMAS[base][0] else conn
+                for statement in statements:
+                    if _NO_PLAN.match(statement):
+                        continue
+                    bad = full_scans(target, statement)
+                    if bad and function not in BULK_READERS.get(base, ()):
+                        failures += 1
+                        print(f"{base}:{line}: full scan in {function}() ({'; '.join(bad)})")
+                        print(f"    {' '.join(statement.split())[:160]}")
+            if sidecar is not None:
+                sidecar.close()
+    finally:
+        conn.close()
+    return failures, unanalyzed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('command', choices=['migrate', 'check'])
+    parser.add_argument('--db', default=DEFAULT_DB)
+    parser.add_argument('sources', nargs='*', default=DEFAULT_SOURCES, help="Python files to scan for queries (check only)")
+    args = parser.parse_args(argv)
+    if args.command == 'migrate':
+        created = migrate(args.db)
+        print(f"Created or rebuilt {len(created)} index(es): {', '.join(created)}" if created else "All indexes already present.")
+        return 0
+    failures, unanalyzed = check(args.db, args.sources)
+    if unanalyzed:
+        print(f"{unanalyzed} query(ies) could not be analyzed.")
+    print(f"{failures} query(ies) fall back to a full table scan." if failures else "All analyzed queries use an index.")
+    return 1 if failures or unanalyzed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""Per-process pool of read-only SQLite connections.
+
+Opening a connection (plus the logging around it) used to happen on every
+request. The pool opens connections once per worker with `immutable=1`, so
+SQLite skips file locking and change detection, and keeps them around so each
+connection's prepared-statement cache is reused across requests.
+
+With in_memory=True the file is copied once into a shared-cache in-memory
+database with the sqlite backup API, and every connection reads from that
+copy. Serverless cold starts then pay for one sequential read of the file
+instead of page faults on the first queries. The copy is refreshed when the
+file's fingerprint changes.
+
+PoolLRU keeps one pool per league file and closes the least recently used
+pool once more than max_pools are open (see leagues.py).
+"""
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from db_cache import db_fingerprint
+
+MMAP_SIZE = 256 * 1024 * 1024
+CACHE_SIZE_KIB = 16 * 1024
+STATEMENT_CACHE_SIZE = 256
+
+
+class ConnectionPool:
+    def __init__(self, path, max_idle=4, in_memory=False):
+        self.path = path
+        self.max_idle = max_idle
+        self.in_memory = in_memory
+        self._idle = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._fingerprint = None
+        self._snapshot = None  # (uri, keeper connection) of the in-memory copy
+        self._closed = False
+
+    def _load_snapshot(self, fingerprint):
+        # The shared in-memory DB lives as long as one connection to it is open.
+        uri = f'file:ffl-{fingerprint[2][:16]}-{os.getpid()}?mode=memory&cache=shared'
+        keeper = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        source = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True)
+        try:
+            source.backup(keeper)
+        finally:
+            source.close()
+        old, self._snapshot = self._snapshot, (uri, keeper)
+        if old is not None:
+            old[1].close()
+
+    def _connect_memory(self):
+        conn = sqlite3.connect(self._snapshot[0], uri=True, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA query_only = 1')
+        return conn
+
+    def _connect(self):
+        uri = f'file:{self.path}?mode=ro&immutable=1'
+        try:
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+        except sqlite3.OperationalError as e:
+            # Same fallback get_db() always had for local development setups.
+            print(f"!!! SQLITE ERROR CONNECTING (read-only attempt with URI): {e} for DB at {self.path}")
+            conn = sqlite3.connect(self.path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f'PRAGMA mmap_size = {MMAP_SIZE}')
+        conn.execute(f'PRAGMA cache_size = -{CACHE_SIZE_KIB}')
+        conn.execute('PRAGMA query_only = 1')
+        return conn
+
+    def _discard_idle(self):
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def acquire(self):
+        # immutable=1 means SQLite will not notice a replaced file, so drop idle
+        # connections when the fingerprint moves. Forked workers must not reuse
+        # the parent's handles either.
+        try:
+            fingerprint = db_fingerprint(self.path)
+        except FileNotFoundError:
+            print(f"!!! CRITICAL: DATABASE FILE NOT FOUND AT: {self.path} !!!")
+            raise
+        with self._lock:
+            if self._closed:
+                # Evicted while a request still held it: serve from the file, keep nothing.
+                return self._connect()
+            if self._pid != os.getpid():
+                # Handles inherited from the parent, including its in-memory copy, are left alone.
+                self._idle, self._snapshot, self._pid = [], None, os.getpid()
+            if fingerprint != self._fingerprint or (self.in_memory and self._snapshot is None):
+                if self._fingerprint is None:
+                    print(f"Opening read-only connection pool for DB: {self.path}{' (in memory)' if self.in_memory else ''}")
+                self._discard_idle()
+                if self.in_memory:
+                    self._load_snapshot(fingerprint)
+                self._fingerprint = fingerprint
+            if self._idle:
+                return self._idle.pop()
+            if self.in_memory:
+                # Opened under the lock so the copy can't be swapped out in between.
+                return self._connect_memory()
+        return self._connect()
+
+    def release(self, conn):
+        with self._lock:
+            if not self._closed and len(self._idle) < self.max_idle and self._pid == os.getpid():
+                try:
+                    current = db_fingerprint(self.path) == self._fingerprint
+                except OSError:
+                    current = False  # the file is gone (e.g. mid-swap), so this handle can't be trusted for reuse
+                if current:
+                    self._idle.append(conn)
+                    return
+        conn.close()
+
+    def warm(self):
+        """Opens the first connection (and loads the in-memory copy) now instead of in the first request."""
+        self.release(self.acquire())
+
+    def close_all(self):
+        """Closes idle connections now; ones still checked out are closed when released."""
+        with self._lock:
+            self._closed = True
+            self._discard_idle()
+            if self._snapshot is not None:
+                self._snapshot[1].close()
+                self._snapshot = None
+
+
+class PoolLRU:
+    """One ConnectionPool per DB path, at most max_pools of them, least recently used closed first."""
+
+    def __init__(self, max_pools=16, on_evict=None, **pool_options):
+        self.max_pools = max_pools
+        self.on_evict = on_evict  # called with the evicted path, e.g. to drop its derived caches
+        self.pool_options = pool_options
+        self._pools = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        with self._lock:
+            pool = self._pools.get(path)
+            if pool is not None:
+                self._pools.move_to_end(path)
+                return pool
+            pool = self._pools[path] = ConnectionPool(path, **self.pool_options)
+            evicted = []
+            while len(self._pools) > self.max_pools:
+                evicted.append(self._pools.popitem(last=False)[1])
+        for old in evicted:
+            print(f"Closing connection pool for DB: {old.path} (least recently used)")
+            old.close_all()
+            if self.on_evict is not None:
+                self.on_evict(old.path)
+        return pool
+
+    def __len__(self):
+        return len(self._pools)
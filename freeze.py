@@ -0,0 +1,178 @@
+"""Pre-renders every page of the site to static HTML ("freeze").
+
+    python freeze.py [--out frozen] [--full]
+
+Every page is a pure function of the read-only DB, so all valid URLs are
+enumerated from it (seasons, weeks, players, head-to-head pairs, the
+league-wide pages and the JSON the timeline pages fetch) and rendered through
+the normal Flask views. The output
+directory is a self-contained static site (HTML, /static assets, 404.html and
+a vercel.json for @vercel/static) that can be deployed without Python.
+
+The build is incremental. Each page is listed in a manifest with the data
+groups it reads (e.g. one season's matchups, one player's results), and each
+group is stored with a hash of its rows. On the next run only pages whose
+groups changed are rendered again, so loading one new week re-renders that
+week, its season, the players and pairings involved and the league-wide
+pages. A change to templates or code triggers a full rebuild.
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import sys
+from collections import defaultdict
+
+from build_info import code_version
+
+APP_ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUT = os.path.join(APP_ROOT_DIR, 'frozen')
+MANIFEST_NAME = '.freeze-manifest.json'
+STATIC_VERCEL_CONFIG = {'version': 2, 'builds': [{'src': '**', 'use': '@vercel/static'}]}
+
+
+def data_groups(conn):
+    """Hashes the DB rows behind each dependency group, one pass per table."""
+    groups = defaultdict(hashlib.sha1)
+
+    def add(keys, row):
+        data = repr(tuple(row)).encode()
+        for key in keys:
+            groups[key].update(data)
+
+    for row in conn.execute("SELECT * FROM players ORDER BY player_id"):
+        add(('players', f'player:{row[0]}'), row)
+    for row in conn.execute("SELECT * FROM seasons ORDER BY season_id"):
+        add(('seasons', f'season:{row[0]}'), row)
+    for row in conn.execute("SELECT result_id, player_id, season_id, * FROM season_results ORDER BY result_id"):
+        add(('season_results', f'season:{row[2]}', f'player:{row[1]}'), row)
+    for row in conn.execute("SELECT championship_id, season_id, winner_id, runner_up_id, * FROM championships ORDER BY championship_id"):
+        add(('championships', f'season:{row[1]}', f'player:{row[2]}', f'player:{row[3]}'), row)
+    for row in conn.execute("SELECT matchup_id, season_id, week_start, player1_id, player2_id, game_type, * FROM weekly_matchups ORDER BY matchup_id"):
+        _, sid, week, p1, p2, game_type = row[:6]
+        keys = ['weekly_matchups', f'season:{sid}', f'week:{sid}:{week}', f'player:{p1}', f'player:{p2}', f'pair:{min(p1, p2)}:{max(p1, p2)}']
+        if game_type == 'toilet_bowl':
+            keys.append('toilet_bowls')
+        add(keys, row)
+    return {key: digest.hexdigest() for key, digest in groups.items()}
+
+
+def enumerate_pages(conn):
+    """Every valid URL mapped to the data groups it depends on."""
+    league = ['players', 'seasons', 'season_results', 'championships', 'weekly_matchups']
+    pages = {
+        '/': ['players', 'seasons', 'championships', 'toilet_bowls'],
+        '/seasons': ['seasons'],
+        '/standings': ['players', 'season_results'],
+        '/record-book': league,
+        '/head-to-head': ['players'],
+        '/head-to-head/matrix': ['players', 'weekly_matchups'],
+    }
+    seasons = conn.execute("SELECT season_id, year FROM seasons").fetchall()
+    years = dict(seasons)
+    for sid, year in seasons:
+        pages[f'/seasons/{year}'] = ['players', f'season:{sid}']
+        pages[f'/seasons/{year}/timeline'] = ['players', f'season:{sid}']
+        pages[f'/seasons/{year}/timeline.json'] = ['players', f'season:{sid}']  # fetched by the timeline page
+    for sid, week in conn.execute("SELECT DISTINCT season_id, week_start FROM weekly_matchups"):
+        if sid in years:
+            pages[f'/seasons/{years[sid]}/week/{week}'] = ['players', 'seasons', f'week:{sid}:{week}']
+    player_ids = [r[0] for r in conn.execute("SELECT player_id FROM players")]
+    for pid in player_ids:
+        pages[f'/players/{pid}'] = ['seasons', f'player:{pid}']
+    for a in player_ids:
+        for b in player_ids:
+            if a != b:
+                pages[f'/head-to-head/{a}/{b}'] = ['players', 'seasons', f'pair:{min(a, b)}:{max(a, b)}']
+    return pages
+
+
+def output_path(out_dir, url):
+    """<url>/index.html for a page; a URL with a file extension (timeline.json) is written to its own path."""
+    parts = url.strip('/').split('/') if url != '/' else []
+    if parts and os.path.splitext(parts[-1])[1]:
+        return os.path.join(out_dir, *parts)
+    return os.path.join(out_dir, *parts, 'index.html')
+
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def freeze(out_dir=DEFAULT_OUT, full=False):
+    from app import app, DATABASE  # imported here so `python freeze.py --help` stays cheap
+
+    conn = sqlite3.connect(f'file:{DATABASE}?mode=ro', uri=True)
+    try:
+        groups = data_groups(conn)
+        pages = enumerate_pages(conn)
+    finally:
+        conn.close()
+
+    previous = load_manifest(out_dir)
+    version = code_version()
+    if full or previous.get('code_version') != version:
+        previous = {}
+    old_groups, old_pages = previous.get('groups', {}), previous.get('pages', {})
+
+    stale = [url for url, deps in pages.items()
+             if old_pages.get(url) != deps or any(groups.get(k) != old_groups.get(k) for k in deps)
+             or not os.path.exists(output_path(out_dir, url))]
+    removed = [url for url in old_pages if url not in pages]
+
+    os.makedirs(out_dir, exist_ok=True)
+    app.config['FROZEN'] = True  # drops links to the dynamic-only pages (search) from the nav
+    try:
+        client = app.test_client()
+        failed = []
+        for url in stale:
+            response = client.get(url)
+            if response.status_code != 200:
+                failed.append((url, response.status_code))
+                continue
+            path = output_path(out_dir, url)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(response.get_data())
+        for url in removed:
+            path = output_path(out_dir, url)
+            if os.path.exists(path):
+                os.remove(path)
+
+        if not previous or not os.path.exists(os.path.join(out_dir, '404.html')):
+            with open(os.path.join(out_dir, '404.html'), 'wb') as f:
+                f.write(client.get('/__frozen_not_found__').get_data())
+            with open(os.path.join(out_dir, 'vercel.json'), 'w', encoding='utf-8') as f:
+                json.dump(STATIC_VERCEL_CONFIG, f, indent=2)
+    finally:
+        app.config['FROZEN'] = False
+    shutil.copytree(os.path.join(APP_ROOT_DIR, 'static'), os.path.join(out_dir, 'static'), dirs_exist_ok=True)
+
+    rendered = {url: pages[url] for url in pages if url not in dict(failed)}
+    with open(os.path.join(out_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump({'code_version': version, 'groups': groups, 'pages': rendered}, f, indent=1, sort_keys=True)
+    return {'total': len(pages), 'rendered': len(stale) - len(failed), 'unchanged': len(pages) - len(stale),
+            'removed': len(removed), 'failed': failed}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-render the site to static HTML.")
+    parser.add_argument('--out', default=DEFAULT_OUT, help="Output directory (default: ./frozen)")
+    parser.add_argument('--full', action='store_true', help="Ignore the manifest and render every page.")
+    args = parser.parse_args(argv)
+    summary = freeze(args.out, args.full)
+    print(f"Frozen {summary['total']} pages to {args.out}: {summary['rendered']} rendered, "
+          f"{summary['unchanged']} unchanged, {summary['removed']} removed.")
+    for url, status in summary['failed']:
+        print(f"!!! {url} returned {status}, not written")
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""A columnar log of every game from each player's side, and the streaks in it.
+
+weekly_matchups is read once into NumPy columns with one row per player-game
+(two rows per matchup): player, opponent, year, week, matchup_id, score,
+opponent score, game type. Rows are sorted by player, then year, week and
+matchup_id, so each player's games are one contiguous slice
+(starts[k]:starts[k + 1]) in the order they were played.
+
+Streaks are run lengths over that order. A streak kind is a boolean column
+(won, lost, scored at least `min_score`) over the streak games: regular-season,
+single-week games, as the record book has always counted them. A tie breaks
+both a winning and a losing streak, and playoff games are skipped rather than
+ending a streak. runs() finds every maximal run that doesn't cross a player
+(or, within a season, a year) boundary with a cumsum and a bincount, so there
+is no Python loop per game. From the runs come the all-time leaders, the record
+book's single-season records and each player's active streaks: the runs that
+end at their latest game.
+
+The log and the runs it has computed are cached per DB file in db_cache
+(app.get_game_log), so the record book, player pages and API share one build.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+STREAK_KINDS = ('win', 'loss', 'score')
+SCORE_STREAK_MIN = 100.0
+LEADERS = 5
+
+# Row indices into the log of each run's first and last game, and its length in games.
+Runs = namedtuple('Runs', 'first last length')
+
+
+def streak_label(kind, min_score=SCORE_STREAK_MIN):
+    return {'win': 'Winning streak', 'loss': 'Losing streak'}.get(kind) or f'{min_score:g}+ point games'
+
+
+def streak_details(start_year, start_week, end_year, end_week, length):
+    if start_year != end_year:
+        return f"{start_year} Wk {start_week} - {end_year} Wk {end_week}"
+    return f"{start_year} Wk {start_week}-{end_week}" if length > 1 else f"{start_year} Wk {start_week}"
+
+
+class GameLog:
+    def __init__(self, player_ids, names, game_types, columns):
+        self.player_ids = player_ids  # sorted player_id per player index
+        self.names = names            # name per player index
+        self.game_types = game_types  # game_type per code in the game_type column
+        for name, values in columns.items():
+            setattr(self, name, values)
+        n = len(player_ids)
+        self.index = {int(pid): k for k, pid in enumerate(player_ids)}
+        self.starts = np.searchsorted(self.player, np.arange(n + 1))
+        self.streak_games = (self.game_type == self.type_code('regular')) & self.single_week
+        # Each player's first and last streak game (-1 if none); active streaks end at the last.
+        rows = np.flatnonzero(self.streak_games)
+        played = np.unique(self.player[rows])
+        self.first_streak_row, self.last_streak_row = np.full(n, -1), np.full(n, -1)
+        self.first_streak_row[played] = rows[np.searchsorted(self.player[rows], played)]
+        self.last_streak_row[played] = rows[np.searchsorted(self.player[rows], played, side='right') - 1]
+        self.latest_year = int(self.year[rows].max()) if len(rows) else None
+        self._runs = {}
+        self._by_player = {}
+
+    @classmethod
+    def from_db(cls, conn):
+        games = conn.execute("SELECT wm.matchup_id, s.year, wm.week_start, wm.week_end IS NULL AND COALESCE(wm.weeks_included, '') = '', wm.game_type, wm.player1_id, wm.player2_id, wm.player1_score, wm.player2_score FROM weekly_matchups wm JOIN seasons s ON wm.season_id = s.season_id").fetchall()
+        names = dict(conn.execute("SELECT player_id, name FROM players"))
+        game_types = tuple(sorted({g[4] or '' for g in games}))
+        code = {t: c for c, t in enumerate(game_types)}
+
+        def column(values, dtype):
+            return np.array(values, dtype=dtype)
+
+        game = column([g[0] for g in games], np.int64)
+        year = column([g[1] for g in games], np.int32)
+        week = column([g[2] or 0 for g in games], np.int32)
+        single = column([bool(g[3]) for g in games], bool)
+        gtype = column([code[g[4] or ''] for g in games], np.int8)
+        p1 = column([-1 if g[5] is None else g[5] for g in games], np.int64)
+        p2 = column([-1 if g[6] is None else g[6] for g in games], np.int64)
+        s1 = column([np.nan if g[7] is None else g[7] for g in games], float)
+        s2 = column([np.nan if g[8] is None else g[8] for g in games], float)
+
+        # Both sides of every game, then drop the sides without a player.
+        pid, opp_id = np.concatenate([p1, p2]), np.concatenate([p2, p1])
+        side = np.repeat(np.array([0, 1], dtype=np.int8), len(games))
+        columns = {'matchup_id': np.tile(game, 2), 'year': np.tile(year, 2), 'week': np.tile(week, 2),
+                   'single_week': np.tile(single, 2), 'game_type': np.tile(gtype, 2), 'side': side,
+                   'score': np.concatenate([s1, s2]), 'opp_score': np.concatenate([s2, s1])}
+        keep = pid >= 0
+        pid, opp_id = pid[keep], opp_id[keep]
+        columns = {name: values[keep] for name, values in columns.items()}
+
+        player_ids = np.unique(pid)
+        columns['player'] = np.searchsorted(player_ids, pid).astype(np.int32)
+        columns['opponent_id'] = opp_id
+        order = np.lexsort((columns['side'], columns['matchup_id'], columns['week'], columns['year'], columns['player']))
+        columns = {name: values[order] for name, values in columns.items()}
+        return cls(player_ids, [names.get(int(p), f"Player ID {p}") for p in player_ids], game_types, columns)
+
+    def __len__(self):
+        return len(self.player)
+
+    def type_code(self, game_type):
+        return self.game_types.index(game_type) if game_type in self.game_types else -1
+
+    def hits(self, kind, min_score=SCORE_STREAK_MIN):
+        if kind == 'win':
+            return self.score > self.opp_score
+        if kind == 'loss':
+            return self.score < self.opp_score
+        if kind == 'score':
+            return self.score >= min_score
+        raise ValueError(f"Unknown streak kind '{kind}'")
+
+    def runs(self, kind, within_season=False, min_score=SCORE_STREAK_MIN):
+        """Runs of every maximal streak of `kind` over the streak games, by player then date."""
+        key = (kind, within_season, min_score if kind == 'score' else None)
+        if key in self._runs:
+            return self._runs[key]
+        rows = np.flatnonzero(self.streak_games)
+        hit = self.hits(kind, min_score)[rows]
+        boundary = np.ones(len(rows), dtype=bool)
+        player = self.player[rows]
+        boundary[1:] = player[1:] != player[:-1]
+        if within_season:
+            year = self.year[rows]
+            boundary[1:] |= year[1:] != year[:-1]
+        after_hit = np.zeros(len(rows), dtype=bool)
+        after_hit[1:] = hit[:-1]
+        start = hit & (boundary | ~after_hit)
+        first = np.flatnonzero(start)
+        length = np.bincount(np.cumsum(start)[hit] - 1, minlength=len(first))
+        runs = Runs(rows[first], rows[first + length - 1], length)
+        if kind != 'score' or min_score == SCORE_STREAK_MIN:  # other cutoffs come from API queries; don't keep them all
+            self._runs[key] = runs
+        return runs
+
+    def streak(self, runs, i):
+        """One run as the dict the templates and API show."""
+        first, last, length = int(runs.first[i]), int(runs.last[i]), int(runs.length[i])
+        k = int(self.player[first])
+        start_year, start_week, end_year, end_week = int(self.year[first]), int(self.week[first]), int(self.year[last]), int(self.week[last])
+        return {'player_id': int(self.player_ids[k]), 'player_name': self.names[k], 'streak': length,
+                'start_year': start_year, 'start_week': start_week, 'end_year': end_year, 'end_week': end_week,
+                'details': streak_details(start_year, start_week, end_year, end_week, length),
+                'active': bool(last == self.last_streak_row[k] and end_year == self.latest_year)}
+
+    def leaders(self, kind, within_season=False, min_score=SCORE_STREAK_MIN, limit=LEADERS):
+        """The `limit` longest streaks of `kind`, longest first, then earliest."""
+        runs = self.runs(kind, within_season, min_score)
+        first = runs.first
+        order = np.lexsort((self.matchup_id[first], self.week[first], self.year[first], -runs.length))
+        return [self.streak(runs, i) for i in order[:limit]]
+
+    def all_time_leaders(self, min_score=SCORE_STREAK_MIN):
+        """[{kind, label, leaders}] for every streak kind, across seasons."""
+        return [{'kind': kind, 'label': streak_label(kind, min_score), 'leaders': self.leaders(kind, min_score=min_score)}
+                for kind in STREAK_KINDS]
+
+    def season_record(self, kind):
+        """The record book's single-season record for `kind`.
+
+        The longest in-season streak; a tie goes to the player whose first
+        streak game came first, then to their earlier streak, as the record
+        book's old per-game loop picked it.
+        """
+        runs = self.runs(kind, within_season=True)
+        if not len(runs.length):
+            return {'player_name': 'N/A', 'streak': 0, 'details': ''}
+        tied = np.flatnonzero(runs.length == runs.length.max())
+        players = np.unique(self.player[runs.first[tied]])
+        debut = self.first_streak_row[players]
+        debut_order = np.lexsort((self.side[debut], self.matchup_id[debut], self.week[debut], self.year[debut]))
+        rank = dict(zip(players.tolist(), np.argsort(debut_order).tolist()))
+        best = min(tied, key=lambda i: (rank[int(self.player[runs.first[i]])], int(runs.first[i])))
+        streak = self.streak(runs, best)
+        return {'player_name': streak['player_name'], 'streak': streak['streak'], 'details': streak['details']}
+
+    def _player_runs(self, kind, min_score):
+        """{player index: (index of the player's longest run, index of their run ending at their last game or None)}."""
+        key = (kind, min_score if kind == 'score' else None)
+        if key not in self._by_player:
+            runs = self.runs(kind, min_score=min_score)
+            player = self.player[runs.first]
+            # Longest per player, earliest on a tie: sort by player, length desc, start and keep each player's first.
+            order = np.lexsort((runs.first, -runs.length, player))
+            keep = np.ones(len(order), dtype=bool)
+            keep[1:] = player[order][1:] != player[order][:-1]
+            longest = dict(zip(player[order][keep].tolist(), order[keep].tolist()))
+            ending = np.flatnonzero(runs.last == self.last_streak_row[player])
+            current = dict(zip(player[ending].tolist(), ending.tolist()))
+            self._by_player[key] = {k: (i, current.get(k)) for k, i in longest.items()}
+        return self._by_player[key]
+
+    def player_streaks(self, player_id, min_score=SCORE_STREAK_MIN):
+        """[{kind, label, longest, current}] for one player, across seasons.
+
+        longest is their longest streak of that kind and current the one their
+        latest streak game is part of (streak dicts, or None); current['active']
+        is False once the player has left the league.
+        """
+        k = self.index.get(player_id)
+        result = []
+        for kind in STREAK_KINDS:
+            longest = current = None
+            found = self._player_runs(kind, min_score).get(k) if k is not None else None
+            if found is not None:
+                runs = self.runs(kind, min_score=min_score)
+                longest = self.streak(runs, found[0])
+                current = self.streak(runs, found[1]) if found[1] is not None else None
+            result.append({'kind': kind, 'label': streak_label(kind, min_score), 'longest': longest, 'current': current})
+        return result
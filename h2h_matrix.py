@@ -0,0 +1,133 @@
+"""All-pairs head-to-head rivalry matrix.
+
+Every matchup is loaded once and folded into N x N NumPy arrays (wins, losses,
+ties, points, score/margin/combined extremes and the game behind each extreme)
+with bincount/lexsort instead of a Python loop per pair. /head-to-head is a
+lookup into the matrix and /head-to-head/matrix renders the whole grid.
+"""
+import numpy as np
+
+GAME_COLUMNS = ('matchup_id', 'year', 'week_start', 'week_end', 'weeks_included', 'p1_name', 'p2_name', 'player1_id', 'player2_id', 'player1_score', 'player2_score', 'game_type')
+
+
+def _best_per_cell(cells, values, game_ids, mask, n_cells, largest):
+    """Per cell, the extreme value and the earliest-listed (most recent) game holding it."""
+    best_val = np.full(n_cells, np.nan)
+    best_game = np.full(n_cells, -1, dtype=np.int64)
+    sel = np.flatnonzero(mask)
+    if sel.size == 0:
+        return best_val, best_game
+    cells, values, game_ids = cells[sel], values[sel], game_ids[sel]
+    order = np.lexsort((game_ids, -values if largest else values, cells))
+    cells = cells[order]
+    first = np.ones(cells.size, dtype=bool)
+    first[1:] = cells[1:] != cells[:-1]
+    best_val[cells[first]] = values[order][first]
+    best_game[cells[first]] = game_ids[order][first]
+    return best_val, best_game
+
+
+class RivalryMatrix:
+    def __init__(self, players, games):
+        self.players = players  # [{'player_id', 'name'}] ordered by name
+        self.games = games      # matchup dicts, most recent first
+        self.index = {p['player_id']: k for k, p in enumerate(players)}
+        n = self.n = len(players)
+        n_cells = n * n
+        g = len(games)
+
+        a = np.fromiter((self.index[m['player1_id']] for m in games), dtype=np.int64, count=g)
+        b = np.fromiter((self.index[m['player2_id']] for m in games), dtype=np.int64, count=g)
+        sa = np.fromiter((np.nan if m['player1_score'] is None else m['player1_score'] for m in games), dtype=float, count=g)
+        sb = np.fromiter((np.nan if m['player2_score'] is None else m['player2_score'] for m in games), dtype=float, count=g)
+
+        # Each game contributes one row per side: (row player, column player, own score, opponent score).
+        cells = np.concatenate((a * n + b, b * n + a))
+        own, opp = np.concatenate((sa, sb)), np.concatenate((sb, sa))
+        game_ids = np.concatenate((np.arange(g), np.arange(g)))
+        scored = ~np.isnan(own) & ~np.isnan(opp)
+        sc, so, sown = cells[scored], opp[scored], own[scored]
+
+        def grid(weights=None, which=None):
+            return np.bincount(which if which is not None else sc, weights=weights, minlength=n_cells).reshape(n, n)
+
+        self.games_played = np.bincount(cells, minlength=n_cells).reshape(n, n)
+        self.wins = grid(which=sc[sown > so]).astype(np.int64)
+        self.losses = grid(which=sc[sown < so]).astype(np.int64)
+        self.ties = grid(which=sc[sown == so]).astype(np.int64)
+        self.points_for = grid(weights=sown)
+        self.points_against = self.points_for.T
+
+        combined, margin = own + opp, own - opp
+        self.max_score = _best_per_cell(cells, own, game_ids, scored, n_cells, True)
+        self.min_score = _best_per_cell(cells, own, game_ids, scored, n_cells, False)
+        self.max_mov = _best_per_cell(cells, margin, game_ids, scored & (margin > 0), n_cells, True)
+        self.max_combined = _best_per_cell(cells, combined, game_ids, scored, n_cells, True)
+        self.min_combined = _best_per_cell(cells, combined, game_ids, scored, n_cells, False)
+
+        # Matchup history per unordered pair, kept in listing order (CSR layout).
+        pair_keys = np.minimum(a, b) * n + np.maximum(a, b)
+        self._history_order = np.argsort(pair_keys, kind='stable')
+        self._history_keys = pair_keys[self._history_order]
+
+    def player(self, player_id):
+        k = self.index.get(player_id)
+        return None if k is None else self.players[k]
+
+    def history(self, i, j):
+        key = min(i, j) * self.n + max(i, j)
+        lo, hi = np.searchsorted(self._history_keys, [key, key + 1])
+        return [self.games[g] for g in self._history_order[lo:hi]]
+
+    def _game_details(self, game_id):
+        m = self.games[game_id]
+        return f"(Week {m['week_start']}, {m['year']})"
+
+    def _extreme(self, extreme, cell, floor=None):
+        # floor mirrors the old loop, which started maxima at 0.0 with no details.
+        values, game_ids = extreme
+        value, game_id = values.flat[cell], game_ids.flat[cell]
+        if game_id < 0 or (floor is not None and value <= floor):
+            return floor, ''
+        return float(value), self._game_details(game_id)
+
+    def pair(self, p1_id, p2_id):
+        """h2h_stats, rivalry_stats and the matchup history for one pairing."""
+        i, j = self.index[p1_id], self.index[p2_id]
+        ij, ji = i * self.n + j, j * self.n + i
+        h2h_stats = {'p1_wins': int(self.wins[i, j]), 'p2_wins': int(self.wins[j, i]), 'ties': int(self.ties[i, j]),
+                     'p1_total_score': float(self.points_for[i, j]), 'p2_total_score': float(self.points_for[j, i]),
+                     'total_matchups': int(self.games_played[i, j])}
+        rivalry_stats = {}
+        for prefix, cell in (('p1', ij), ('p2', ji)):
+            rivalry_stats[f'{prefix}_max_score'], rivalry_stats[f'{prefix}_max_score_details'] = self._extreme(self.max_score, cell, floor=0.0)
+            rivalry_stats[f'{prefix}_min_score'], rivalry_stats[f'{prefix}_min_score_details'] = self._extreme(self.min_score, cell)
+            rivalry_stats[f'{prefix}_max_mov'], rivalry_stats[f'{prefix}_max_mov_details'] = self._extreme(self.max_mov, cell, floor=0.0)
+        rivalry_stats['max_combined'], rivalry_stats['max_combined_details'] = self._extreme(self.max_combined, ij, floor=0.0)
+        rivalry_stats['min_combined'], rivalry_stats['min_combined_details'] = self._extreme(self.min_combined, ij)
+        return h2h_stats, rivalry_stats, self.history(i, j)
+
+    def grid_rows(self):
+        """One row per player with a cell per opponent (None on the diagonal)."""
+        rows = []
+        for i, p in enumerate(self.players):
+            cells = []
+            for j, opp in enumerate(self.players):
+                if i == j:
+                    cells.append(None)
+                    continue
+                games = int(self.games_played[i, j])
+                cells.append({'opponent_id': opp['player_id'], 'opponent_name': opp['name'], 'games': games,
+                              'wins': int(self.wins[i, j]), 'losses': int(self.losses[i, j]), 'ties': int(self.ties[i, j]),
+                              'points_for': float(self.points_for[i, j]), 'points_against': float(self.points_against[i, j]),
+                              'win_percentage': (self.wins[i, j] + 0.5 * self.ties[i, j]) / games * 100 if games else None})
+            total_games = int(self.games_played[i].sum())
+            rows.append({'player': p, 'cells': cells, 'wins': int(self.wins[i].sum()), 'losses': int(self.losses[i].sum()),
+                         'ties': int(self.ties[i].sum()), 'games': total_games})
+        return rows
+
+
+def build_matrix(conn):
+    players = [{'player_id': r[0], 'name': r[1]} for r in conn.execute("SELECT player_id, name FROM players ORDER BY name")]
+    rows = conn.execute("SELECT wm.matchup_id, s.year, wm.week_start, wm.week_end, wm.weeks_included, p1.name as p1_name, p2.name as p2_name, wm.player1_id, wm.player2_id, wm.player1_score, wm.player2_score, wm.game_type FROM weekly_matchups wm JOIN seasons s ON wm.season_id = s.season_id JOIN players p1 ON wm.player1_id = p1.player_id JOIN players p2 ON wm.player2_id = p2.player_id ORDER BY s.year DESC, wm.week_start DESC, wm.matchup_id ASC").fetchall()
+    return RivalryMatrix(players, [dict(zip(GAME_COLUMNS, r)) for r in rows])
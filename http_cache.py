@@ -0,0 +1,156 @@
+"""Conditional GET and compression for the HTML pages.
+
+A page's content only depends on the league's DB file (plus the other files
+its endpoint reads: the search index, the leagues directory behind the Leagues
+link), the deployed code/templates and
+the URL (including the /l/<league> prefix), so its ETag is a hash of exactly those. `If-None-Match` (or, failing
+that, `If-Modified-Since` against the DB and code mtimes) is answered with a 304 in
+before_request, before any query runs. Requests with arguments in the path or
+query string (/players/<id>, /head-to-head?player1_id=...) are answered after
+the view instead, and only when it returned a 200, so a URL for something that
+doesn't exist never gets a 304.
+Only 200 responses are marked cacheable; views report failures with an error
+status. Cacheable responses get Cache-Control
+with s-maxage so Vercel's edge can serve repeat traffic, and HTML bodies are
+compressed with brotli (if installed) or gzip.
+
+    CACHE_MAX_AGE    browser max-age in seconds (default 300)
+    CACHE_S_MAXAGE   shared/edge s-maxage in seconds (default 86400)
+"""
+import datetime
+import gzip
+import hashlib
+import os
+
+from flask import g, request
+from werkzeug.http import http_date, parse_date
+
+import build_info
+from db_cache import db_fingerprint, file_signature
+
+try:
+    import brotli
+except ImportError:  # optional; gzip is always available
+    brotli = None
+
+CACHE_MAX_AGE = int(os.environ.get('CACHE_MAX_AGE', 300))
+CACHE_S_MAXAGE = int(os.environ.get('CACHE_S_MAXAGE', 86400))
+MIN_COMPRESS_BYTES = 512
+COMPRESSIBLE_TYPES = ('text/html', 'text/plain', 'text/csv', 'application/json', 'application/x-ndjson')
+# league_list reads every league file, so one DB's fingerprint can't version it.
+UNCACHED_ENDPOINTS = {'static', 'metrics_endpoint', 'league_list'}
+
+# Written by the build (build_info.py), so a cold start reads one small file instead of every source.
+_BUILD = build_info.load()
+CODE_VERSION = _BUILD['code_version']
+# Code deploys change pages without touching the DB, so Last-Modified covers both.
+CODE_MTIME = _BUILD['code_mtime']
+_ENCODING_SUFFIX = {'br': '-br', 'gzip': '-gz'}
+
+
+def _etag_for(db_path, sidecars=()):
+    fingerprint = db_fingerprint(db_path)
+    signatures = [file_signature(path) for path in sidecars]
+    # current_year is injected into every page, so it is part of the version too.
+    key = f"{fingerprint[2]}|{signatures}|{CODE_VERSION}|{datetime.date.today().year}|{request.script_root}{request.full_path}"
+    mtimes = [fingerprint[1] / 1e9, CODE_MTIME] + [sig[1] / 1e9 for sig in signatures if sig is not None]
+    return hashlib.sha1(key.encode()).hexdigest()[:32], int(max(mtimes))
+
+
+def _matching_tag(if_none_match, etag):
+    """The client's tag that matches this content, or None.
+
+    Compressed variants carry a suffix; any representation of the same content matches.
+    """
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*':
+            return etag
+        tag = (candidate[2:] if candidate.startswith('W/') else candidate).strip('"')
+        base = tag
+        for suffix in _ENCODING_SUFFIX.values():
+            if base.endswith(suffix):
+                base = base[:-len(suffix)]
+        if base == etag:
+            return tag
+    return None
+
+
+def _cache_headers(response, etag, last_modified):
+    response.headers['ETag'] = f'"{etag}"'
+    response.headers['Last-Modified'] = http_date(last_modified)
+    response.headers['Cache-Control'] = f'public, max-age={CACHE_MAX_AGE}, s-maxage={CACHE_S_MAXAGE}'
+    response.vary.add('Accept-Encoding')
+
+
+def _preferred_encoding():
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        return 'br'
+    if accepted['gzip']:
+        return 'gzip'
+    return None
+
+
+def _compress(response):
+    if (response.direct_passthrough or response.is_streamed or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_TYPES or response.status_code < 200 or response.status_code >= 300):
+        return None
+    encoding = _preferred_encoding()
+    if encoding is None:
+        return None
+    body = response.get_data()
+    if len(body) < MIN_COMPRESS_BYTES:
+        return None
+    response.set_data(brotli.compress(body, quality=5) if encoding == 'br' else gzip.compress(body, compresslevel=6, mtime=0))
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return encoding
+
+
+def _request_matches(etag, last_modified):
+    """The tag to answer a 304 with if the request's validators match this content, else None."""
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match is not None:
+        return _matching_tag(if_none_match, etag)
+    since = parse_date(request.headers.get('If-Modified-Since'))
+    return etag if since is not None and since.timestamp() >= last_modified else None
+
+
+def _has_arguments():
+    return bool(request.view_args or request.args)
+
+
+def _not_modified(app, tag, last_modified):
+    response = app.response_class(status=304)
+    _cache_headers(response, tag, last_modified)
+    return response
+
+
+def init_app(app, db_path_for_request, sidecars_for_request=lambda: ()):
+    @app.before_request
+    def _conditional_get():
+        if request.method not in ('GET', 'HEAD') or request.endpoint in UNCACHED_ENDPOINTS or request.endpoint is None:
+            return None
+        etag, last_modified = _etag_for(db_path_for_request(), sidecars_for_request())
+        g.http_cache = (etag, last_modified)
+        if _has_arguments():
+            return None  # /players/<id> etc.: only the view knows whether it exists, so wait for a 200
+        matched = _request_matches(etag, last_modified)
+        return _not_modified(app, matched, last_modified) if matched is not None else None
+
+    @app.after_request
+    def _cache_and_compress(response):
+        cache = g.get('http_cache')
+        if cache is not None and response.status_code == 200:
+            if _has_arguments():
+                matched = _request_matches(*cache)
+                if matched is not None:
+                    response.close()
+                    return _not_modified(app, matched, cache[1])
+            _cache_headers(response, *cache)
+        encoding = _compress(response)
+        if encoding and cache is not None and 'ETag' in response.headers:
+            # Strong ETags must differ per representation.
+            response.headers['ETag'] = f'"{cache[0]}{_ENCODING_SUFFIX[encoding]}"'
+        return response
@@ -0,0 +1,338 @@
+"""Loads batches of weekly matchups and keeps the derived tables in step.
+
+    python ingest.py load week15.csv [more.json ...] [--db PATH] [--dry-run]
+    python ingest.py check [--db PATH]
+
+`load` inserts every matchup of the batch into weekly_matchups in a single
+transaction and applies the same rows as deltas to season_results (W/L/T,
+PF/PA, per-game averages, record string), made_playoffs and championships.
+Only the seasons touched by the batch are re-ranked, so adding a week costs a
+handful of statements no matter how much history the league has. A batch with
+any bad row (unknown player or season, duplicate game, tied final) is rejected
+as a whole.
+
+CSV files need a header row; JSON files hold a list of objects (or
+{"matchups": [...]}). Columns/keys:
+
+    season (year) or season_id, week or week_start, week_end, weeks_included,
+    player1 / player2 (id or name) or player1_id / player2_id,
+    player1_score, player2_score, game_type (default 'regular'), notes
+
+Multi-week playoff games give either week_end or weeks_included ("14,15"); the
+other is filled in. `check` recomputes season_results from the raw scores and
+prints every row that has drifted.
+
+The app reads the DB through immutable connections, but db_pool and db_cache
+notice the file change and reload, so a running server picks up a load on the
+next request. If the DB has a search sidecar (search.py) the new games are added
+to it; one that was already out of date is rebuilt instead. If it has a playoff
+odds sidecar (playoff_odds.py) the seasons the batch touched are re-simulated.
+"""
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+from collections import defaultdict
+
+import playoff_odds
+import search
+from db_cache import db_fingerprint
+
+APP_ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB = os.path.join(APP_ROOT_DIR, 'REAL_Fantasy_Football_DB.db')
+
+GAME_TYPES = ('regular', 'semifinal', 'championship', '3rd_place', 'toilet_bowl')
+PLAYOFF_GAMES = ('semifinal', 'championship')
+NOTE_LABELS = {'regular': 'Week {week}', 'semifinal': 'Semifinal', 'championship': 'Championship Game',
+               '3rd_place': '3rd Place Game', 'toilet_bowl': 'Toilet Bowl'}
+# Where the winner of each placement game finishes as (group, place); the loser is
+# one place lower. Group 0 sits above the rest of the league, group 2 below it.
+PLACEMENT_GAMES = {'championship': (0, 1), '3rd_place': (0, 3), 'toilet_bowl': (2, 1)}
+
+
+class IngestError(ValueError):
+    pass
+
+
+def read_batch(path):
+    """Raw matchup dicts from a .csv or .json file."""
+    if path.lower().endswith('.json'):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        rows = data.get('matchups') if isinstance(data, dict) else data
+        if not isinstance(rows, list):
+            raise IngestError(f"{path}: expected a list of matchups")
+        return rows
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        return list(csv.DictReader(f))
+
+
+def _blank(value):
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _int(value, what):
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        raise IngestError(f"{what} must be a whole number, got {value!r}")
+
+
+def _weeks(raw):
+    """Normalized (week_start, week_end, weeks_included) for single- and multi-week games."""
+    week_start = raw.get('week_start', raw.get('week'))
+    if _blank(week_start) and _blank(raw.get('weeks_included')):
+        raise IngestError("week is required")
+    included = [] if _blank(raw.get('weeks_included')) else [_int(w, 'weeks_included') for w in str(raw['weeks_included']).split(',')]
+    week_start = min(included) if _blank(week_start) else _int(week_start, 'week')
+    week_end = None if _blank(raw.get('week_end')) else _int(raw['week_end'], 'week_end')
+    if included:
+        if week_start != min(included) or (week_end is not None and week_end != max(included)):
+            raise IngestError(f"weeks_included {raw['weeks_included']!r} does not match week {week_start}-{week_end}")
+        week_end = max(included)
+    elif week_end is not None:
+        included = list(range(week_start, week_end + 1))
+    if week_end is not None and week_end < week_start:
+        raise IngestError(f"week_end {week_end} is before week {week_start}")
+    if week_end is None or week_end == week_start:
+        return week_start, None, None
+    return week_start, week_end, ','.join(str(w) for w in included)
+
+
+class _Resolver:
+    def __init__(self, conn):
+        self.players = dict(conn.execute("SELECT player_id, name FROM players"))
+        self.player_by_name = {name.lower(): pid for pid, name in self.players.items()}
+        # Kept apart: one season's id can equal another season's year.
+        self.season_by_id, self.season_by_year = {}, {}
+        for season_id, year in conn.execute("SELECT season_id, year FROM seasons"):
+            self.season_by_id[season_id] = season_id
+            self.season_by_year.setdefault(year, season_id)
+
+    def player(self, raw, slot):
+        value = raw.get(f'{slot}_id', raw.get(slot))
+        if _blank(value):
+            raise IngestError(f"{slot} is required")
+        text = str(value).strip()
+        pid = int(text) if text.isdigit() else self.player_by_name.get(text.lower())
+        if pid not in self.players:
+            raise IngestError(f"unknown {slot} {value!r}")
+        return pid
+
+    def season(self, raw):
+        """season_id from the row's season_id, or else from its season (a year)."""
+        if not _blank(raw.get('season_id')):
+            value, seasons, what = raw['season_id'], self.season_by_id, 'season_id'
+        elif not _blank(raw.get('season')):
+            value, seasons, what = raw['season'], self.season_by_year, 'season'
+        else:
+            raise IngestError("season is required")
+        season_id = seasons.get(_int(value, what))
+        if season_id is None:
+            raise IngestError(f"unknown {what} {value!r}; add it to the seasons table first")
+        return season_id
+
+
+def normalize(raw, resolver):
+    """One input row as a weekly_matchups tuple (without matchup_id)."""
+    season_id = resolver.season(raw)
+    week_start, week_end, weeks_included = _weeks(raw)
+    p1, p2 = resolver.player(raw, 'player1'), resolver.player(raw, 'player2')
+    if p1 == p2:
+        raise IngestError("a player cannot play themselves")
+    try:
+        s1, s2 = float(raw['player1_score']), float(raw['player2_score'])
+    except (KeyError, TypeError, ValueError):
+        raise IngestError("player1_score and player2_score must be numbers")
+    game_type = 'regular' if _blank(raw.get('game_type')) else str(raw['game_type']).strip()
+    if game_type not in GAME_TYPES:
+        raise IngestError(f"game_type must be one of {', '.join(GAME_TYPES)}, got {game_type!r}")
+    if game_type in PLACEMENT_GAMES and s1 == s2:
+        raise IngestError(f"{game_type} game cannot end in a tie")
+    notes = raw.get('notes')
+    if _blank(notes):
+        label = NOTE_LABELS[game_type].format(week=week_start)
+        notes = f"{label}: {resolver.players[p1]} vs {resolver.players[p2]}"
+        if week_end is not None:
+            notes += f" (Combined Weeks {week_start}-{week_end})"
+    return (season_id, week_start, week_end, weeks_included, p1, p2, s1, s2, game_type, notes)
+
+
+def regular_deltas(matchups):
+    """(season_id, player_id) -> [wins, losses, ties, points_for, points_against] for regular games."""
+    deltas = defaultdict(lambda: [0, 0, 0, 0.0, 0.0])
+    for season_id, _, _, _, p1, p2, s1, s2, game_type, _ in matchups:
+        if game_type != 'regular':
+            continue
+        for me, score, opp_score in ((p1, s1, s2), (p2, s2, s1)):
+            d = deltas[(season_id, me)]
+            d[0 if score > opp_score else 1 if score < opp_score else 2] += 1
+            d[3] += score
+            d[4] += opp_score
+    return deltas
+
+
+def season_row(wins, losses, ties, pf, pa):
+    """season_results values (record, W, L, T, PF, PA, PPG, PA/G) for regular-season totals."""
+    games = wins + losses + ties
+    pf, pa = round(pf, 2), round(pa, 2)
+    return (f"{wins}-{losses}-{ties}", wins, losses, ties, pf, pa,
+            round(pf / games, 1) if games else 0.0, round(pa / games, 1) if games else 0.0)
+
+
+def _apply_deltas(conn, deltas):
+    for (season_id, player_id), (w, l, t, pf, pa) in deltas.items():
+        row = conn.execute("SELECT result_id, wins, losses, ties, points_for, points_against FROM season_results WHERE player_id = ? AND season_id = ?",
+                           (player_id, season_id)).fetchone()
+        if row is None:
+            # Ranked properly by rerank() below.
+            conn.execute("INSERT INTO season_results (player_id, season_id, rank, regular_season_record, wins, losses, ties, points_for, points_against, points_per_game, points_against_per_game, made_playoffs) VALUES (?, ?, 0, ?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                         (player_id, season_id) + season_row(w, l, t, pf, pa))
+            continue
+        result_id, *current = row
+        current = [v or 0 for v in current]
+        conn.execute("UPDATE season_results SET regular_season_record = ?, wins = ?, losses = ?, ties = ?, points_for = ?, points_against = ?, points_per_game = ?, points_against_per_game = ? WHERE result_id = ?",
+                     season_row(current[0] + w, current[1] + l, current[2] + t, current[3] + pf, current[4] + pa) + (result_id,))
+
+
+def _apply_playoffs(conn, matchups):
+    for season_id, _, _, _, p1, p2, s1, s2, game_type, _ in matchups:
+        if game_type in PLAYOFF_GAMES:
+            conn.execute("UPDATE season_results SET made_playoffs = 1 WHERE season_id = ? AND player_id IN (?, ?)", (season_id, p1, p2))
+        if game_type == 'championship':
+            winner, runner_up = (p1, p2) if s1 > s2 else (p2, p1)
+            conn.execute("DELETE FROM championships WHERE season_id = ?", (season_id,))
+            conn.execute("INSERT INTO championships (season_id, winner_id, runner_up_id) VALUES (?, ?, ?)", (season_id, winner, runner_up))
+
+
+def rerank(conn, season_id):
+    """Final ranks for one season: placement games first, then playoff teams, record and points.
+
+    Reproduces the ranks recorded for every completed season; for a season in
+    progress it is the current standings.
+    """
+    rows = conn.execute("SELECT result_id, player_id, wins, ties, points_for, made_playoffs FROM season_results WHERE season_id = ?", (season_id,)).fetchall()
+    placed = {}
+    for p1, p2, s1, s2, game_type in conn.execute("SELECT player1_id, player2_id, player1_score, player2_score, game_type FROM weekly_matchups WHERE game_type IN ('championship', '3rd_place', 'toilet_bowl') AND season_id = ?", (season_id,)):
+        if s1 == s2:
+            continue
+        winner, loser = (p1, p2) if s1 > s2 else (p2, p1)
+        group, place = PLACEMENT_GAMES[game_type]
+        placed[winner], placed[loser] = (group, place), (group, place + 1)
+
+    def standing(row):
+        _, player_id, wins, ties, points_for, made_playoffs = row
+        return placed.get(player_id, (1, 0)) + (-(made_playoffs or 0), -((wins or 0) + 0.5 * (ties or 0)), -(points_for or 0.0))
+
+    for rank, row in enumerate(sorted(rows, key=standing), start=1):
+        conn.execute("UPDATE season_results SET rank = ? WHERE result_id = ?", (rank, row[0]))
+
+
+def _check_duplicates(conn, matchups):
+    seen = set()
+    for n, m in enumerate(matchups, start=1):
+        season_id, week_start, p1, p2 = m[0], m[1], m[4], m[5]
+        key = (season_id, week_start, min(p1, p2), max(p1, p2))
+        if key in seen or conn.execute("SELECT 1 FROM weekly_matchups WHERE season_id = ? AND week_start = ? AND ((player1_id = ? AND player2_id = ?) OR (player1_id = ? AND player2_id = ?))",
+                                       (season_id, week_start, p1, p2, p2, p1)).fetchone():
+            raise IngestError(f"matchup {n}: season {season_id} week {week_start} {p1} vs {p2} is already loaded")
+        seen.add(key)
+
+
+def load(db_path, raw_rows, dry_run=False):
+    """Inserts a batch and updates the derived tables; all or nothing. Returns a summary dict."""
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            resolver = _Resolver(conn)
+            matchups = []
+            for n, raw in enumerate(raw_rows, start=1):
+                try:
+                    matchups.append(normalize(raw, resolver))
+                except IngestError as e:
+                    raise IngestError(f"matchup {n}: {e}")
+            _check_duplicates(conn, matchups)
+            # New rows get ids above the current maximum, which is how the search sidecar finds them.
+            last_matchup_id = conn.execute("SELECT MAX(matchup_id) FROM weekly_matchups").fetchone()[0] or 0
+            conn.executemany("INSERT INTO weekly_matchups (season_id, week_start, week_end, weeks_included, player1_id, player2_id, player1_score, player2_score, game_type, notes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                             matchups)
+            deltas = regular_deltas(matchups)
+            _apply_deltas(conn, deltas)
+            _apply_playoffs(conn, matchups)
+            seasons = sorted({m[0] for m in matchups})
+            for season_id in seasons:
+                rerank(conn, season_id)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("ROLLBACK" if dry_run else "COMMIT")
+        return {'matchups': len(matchups), 'season_results': len(deltas), 'seasons': seasons,
+                'last_matchup_id': last_matchup_id}
+    finally:
+        conn.close()
+
+
+def drift(conn):
+    """season_results rows whose regular-season numbers disagree with weekly_matchups."""
+    rows = conn.execute("SELECT season_id, week_start, week_end, weeks_included, player1_id, player2_id, player1_score, player2_score, game_type, notes FROM weekly_matchups WHERE game_type = 'regular'").fetchall()
+    expected = regular_deltas(rows)
+    problems = []
+    for season_id, player_id, record, w, l, t, pf, pa in conn.execute("SELECT season_id, player_id, regular_season_record, wins, losses, ties, points_for, points_against FROM season_results ORDER BY season_id, player_id"):
+        want = season_row(*expected.pop((season_id, player_id), [0, 0, 0, 0.0, 0.0]))
+        have = (record, w, l, t, pf, pa)
+        if have[:4] != want[:4] or abs((pf or 0) - want[4]) > 0.005 or abs((pa or 0) - want[5]) > 0.005:
+            problems.append((season_id, player_id, have, want[:6]))
+    for (season_id, player_id), d in sorted(expected.items()):
+        problems.append((season_id, player_id, None, season_row(*d)[:6]))
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('command', choices=['load', 'check'])
+    parser.add_argument('files', nargs='*', help="CSV/JSON batches to load (load only)")
+    parser.add_argument('--db', default=DEFAULT_DB)
+    parser.add_argument('--dry-run', action='store_true', help="Validate and apply, then roll back.")
+    args = parser.parse_args(argv)
+    if args.command == 'check':
+        conn = sqlite3.connect(f'file:{args.db}?mode=ro', uri=True)
+        try:
+            problems = drift(conn)
+        finally:
+            conn.close()
+        for season_id, player_id, have, want in problems:
+            print(f"season {season_id} player {player_id}: season_results {have} != weekly_matchups {want}")
+        print(f"{len(problems)} season_results row(s) out of step with the scores." if problems else "season_results matches weekly_matchups.")
+        return 1 if problems else 0
+    if not args.files:
+        parser.error("load needs at least one CSV/JSON file")
+    search_sidecar = not args.dry_run and os.path.exists(search.sidecar_path(args.db))
+    odds_sidecar = not args.dry_run and os.path.exists(playoff_odds.sidecar_path(args.db))
+    try:
+        raw_rows = [row for path in args.files for row in read_batch(path)]
+        previous_sha1 = db_fingerprint(args.db)[2] if search_sidecar or odds_sidecar else None
+        summary = load(args.db, raw_rows, args.dry_run)
+    except (IngestError, OSError, ValueError) as e:
+        print(f"!!! Nothing loaded: {e}")
+        return 1
+    print(f"{'Checked' if args.dry_run else 'Loaded'} {summary['matchups']} matchup(s); "
+          f"{summary['season_results']} season_results row(s) updated; re-ranked season(s) {', '.join(map(str, summary['seasons'])) or '-'}.")
+    if search_sidecar:
+        added = search.update_sidecar(args.db, summary['last_matchup_id'], previous_sha1)
+        if added is None:
+            print(f"The search index was out of date; rebuilt it: {search.build_sidecar(args.db)} game(s).")
+        else:
+            print(f"Added {added} game(s) to the search index.")
+    if odds_sidecar:
+        if playoff_odds.update_sidecar(args.db, summary['seasons'], previous_sha1) is None:
+            print("The playoff odds sidecar was out of date; run `python playoff_odds.py --sidecar` to refresh it.")
+        else:
+            print(f"Re-simulated the playoff odds for season(s) {', '.join(map(str, summary['seasons']))}.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
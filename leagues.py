@@ -0,0 +1,153 @@
+"""Multi-league hosting: one SQLite file per league behind a /l/<league> prefix.
+
+Every page exists for every league. LeaguePrefix is WSGI middleware that moves
+`/l/<league>` from PATH_INFO to SCRIPT_NAME, so the routes stay as they are and
+url_for() keeps links inside the league. A league slug resolves to
+FFL_LEAGUES_DIR/<slug>.db. Unprefixed URLs (and /l/<FFL_DEFAULT_LEAGUE>) serve
+the default league, app.DATABASE.
+
+Connections are pooled per league file in db_pool.PoolLRU, and derived data is
+cached per file in db_cache, so each league gets its own standings and records
+and an evicted league gives both back.
+
+The cross-league index (/leagues) lists every league's champions from a summary
+per league file. A summary is rebuilt only when that file's size or mtime
+changes, so a request stats the files but doesn't open them. The summaries are
+also saved to FFL_LEAGUES_DIR/.league-index.json when the directory is
+writable, so a fresh process doesn't open every league either.
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+
+LEAGUE_SLUG = re.compile(r'^[a-z0-9][a-z0-9_-]{0,63}$')
+ENVIRON_KEY = 'ffl.league'
+INDEX_FILE = '.league-index.json'
+
+
+class LeaguePrefix:
+    """WSGI middleware: /l/<league>/rest -> SCRIPT_NAME += /l/<league>, PATH_INFO = /rest."""
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        parts = environ.get('PATH_INFO', '').split('/', 3)  # ['', 'l', slug, rest]
+        if len(parts) >= 3 and parts[0] == '' and parts[1] == 'l' and parts[2]:
+            environ[ENVIRON_KEY] = parts[2]
+            environ['SCRIPT_NAME'] = environ.get('SCRIPT_NAME', '') + f'/l/{parts[2]}'
+            environ['PATH_INFO'] = '/' + (parts[3] if len(parts) > 3 else '')
+        return self.wsgi_app(environ, start_response)
+
+
+class LeagueRegistry:
+    def __init__(self, default_path, leagues_dir, default_slug='main'):
+        self.default_path = default_path
+        self.leagues_dir = leagues_dir
+        self.default_slug = default_slug
+        self._listing = None  # (leagues_dir mtime_ns, all())
+
+    def path_for(self, slug):
+        """DB file for a league slug, or None if there is no such league."""
+        if slug is None or slug == self.default_slug:
+            return self.default_path
+        if not LEAGUE_SLUG.match(slug):
+            return None
+        path = os.path.join(self.leagues_dir, slug + '.db')
+        return path if os.path.isfile(path) else None
+
+    def all(self):
+        """[(slug, path)] for the default league and every league file, in slug order after the default.
+
+        Every page asks (for the league switcher), so the directory is only
+        scanned again when its mtime changes, i.e. a league file was added,
+        removed or renamed.
+        """
+        try:
+            mtime = os.stat(self.leagues_dir).st_mtime_ns
+        except FileNotFoundError:
+            return [(self.default_slug, self.default_path)]
+        listing = self._listing
+        if listing is None or listing[0] != mtime:
+            listing = self._listing = (mtime, self._scan())
+        return list(listing[1])
+
+    def _scan(self):
+        leagues = [(self.default_slug, self.default_path)]
+        try:
+            entries = sorted(os.scandir(self.leagues_dir), key=lambda e: e.name)
+        except FileNotFoundError:
+            return leagues
+        for entry in entries:
+            slug = entry.name[:-3]
+            if entry.name.endswith('.db') and entry.is_file() and LEAGUE_SLUG.match(slug) and slug != self.default_slug:
+                leagues.append((slug, entry.path))
+        return leagues
+
+
+def summarize(path):
+    """What the cross-league index shows for one league file."""
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        champions = [{'year': year, 'winner_name': name} for year, name in conn.execute(
+            "SELECT s.year, p.name FROM championships c JOIN seasons s ON c.season_id = s.season_id JOIN players p ON c.winner_id = p.player_id ORDER BY s.year DESC")]
+        seasons = conn.execute("SELECT COUNT(*) FROM seasons").fetchone()[0]
+        players = conn.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+    finally:
+        conn.close()
+    return {'champions': champions, 'seasons': seasons, 'players': players}
+
+
+class LeagueIndex:
+    def __init__(self, registry):
+        self.registry = registry
+        self._entries = None  # slug -> {'path', 'sig': [size, mtime_ns], 'summary'}
+        self._lock = threading.Lock()
+
+    def _index_path(self):
+        return os.path.join(self.registry.leagues_dir, INDEX_FILE)
+
+    def _load(self):
+        try:
+            with open(self._index_path(), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        try:
+            tmp = self._index_path() + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp, self._index_path())
+        except OSError:
+            pass  # read-only deploys just keep the index in memory
+
+    def summaries(self):
+        """[{slug, is_default, champions, seasons, players}] for every league."""
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            leagues = self.registry.all()
+            changed = False
+            result = []
+            for slug, path in leagues:
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue  # removed since the registry listed it; it drops out of the next listing
+                sig = [st.st_size, st.st_mtime_ns]
+                entry = self._entries.get(slug)
+                if entry is None or entry['path'] != path or entry['sig'] != sig:
+                    entry = self._entries[slug] = {'path': path, 'sig': sig, 'summary': summarize(path)}
+                    changed = True
+                result.append(dict(entry['summary'], slug=slug, is_default=slug == self.registry.default_slug))
+            current = {slug for slug, _ in leagues}
+            for slug in [s for s in self._entries if s not in current]:
+                del self._entries[slug]
+                changed = True
+            if changed and os.path.isdir(self.registry.leagues_dir):
+                self._save()
+            return result
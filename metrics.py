@@ -0,0 +1,250 @@
+"""Per-request profiling: SQL count/time, template render time and wall time.
+
+Queries are timed through InstrumentedConnection (which get_db() hands out),
+template time through Flask's render signals and wall time through
+before/after_request. A streamed response is recorded when it closes, so the
+queries its body runs (the export) are counted too. Totals are kept per
+endpoint in this process and exposed in Prometheus text format on /metrics.
+Under gunicorn each worker reports its own numbers. Queries slower than SLOW_QUERY_MS are printed with their params.
+SERVER_TIMING=1 adds a Server-Timing response header.
+
+Cold starts are tracked with two gauges: how long app.py took to import and
+the time from the start of that import to the end of the first response.
+The second is also logged once, so it shows up in serverless logs.
+"""
+import os
+import threading
+import time
+
+from flask import before_render_template, g, has_app_context, request, template_rendered
+
+SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', 50))
+SERVER_TIMING = os.environ.get('SERVER_TIMING', '').lower() in ('1', 'true', 'yes')
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Counter:
+    def __init__(self, name, help_text, labels):
+        self.name, self.help_text, self.labels = name, help_text, labels
+        self.values = {}
+
+    def inc(self, label_values, amount=1):
+        self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    def expose(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for label_values, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{_labels(self.labels, label_values)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help_text, labels, buckets=BUCKETS):
+        self.name, self.help_text, self.labels, self.buckets = name, help_text, labels, buckets
+        self.values = {}  # label values -> [bucket counts..., sum, count]
+
+    def observe(self, label_values, value):
+        series = self.values.setdefault(label_values, [0] * len(self.buckets) + [0.0, 0])
+        for k, upper in enumerate(self.buckets):
+            if value <= upper:
+                series[k] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def expose(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for label_values, series in sorted(self.values.items()):
+            for upper, count in zip(self.buckets, series):
+                lines.append(f"{self.name}_bucket{_labels(self.labels + ('le',), label_values + (repr(upper),))} {count}")
+            lines.append(f"{self.name}_bucket{_labels(self.labels + ('le',), label_values + ('+Inf',))} {series[-1]}")
+            lines.append(f"{self.name}_sum{_labels(self.labels, label_values)} {series[-2]}")
+            lines.append(f"{self.name}_count{_labels(self.labels, label_values)} {series[-1]}")
+        return lines
+
+
+class Gauge:
+    def __init__(self, name, help_text):
+        self.name, self.help_text = name, help_text
+        self.value = None
+
+    def set(self, value):
+        self.value = value
+
+    def expose(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} gauge"]
+        if self.value is not None:
+            lines.append(f"{self.name} {self.value}")
+        return lines
+
+
+def _labels(names, values):
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"') for v in values)
+    return '{' + ','.join(f'{n}="{v}"' for n, v in zip(names, escaped)) + '}'
+
+
+_lock = threading.Lock()
+REQUESTS = Counter('ffl_http_requests_total', 'HTTP requests served.', ('endpoint', 'status'))
+REQUEST_SECONDS = Histogram('ffl_http_request_duration_seconds', 'Wall time per request.', ('endpoint',))
+SQL_QUERIES = Counter('ffl_sql_queries_total', 'SQL statements executed.', ('endpoint',))
+SQL_SECONDS = Histogram('ffl_sql_duration_seconds', 'Total SQL time per request.', ('endpoint',))
+TEMPLATE_SECONDS = Histogram('ffl_template_render_seconds', 'Template render time per request.', ('endpoint',))
+SLOW_QUERIES = Counter('ffl_sql_slow_queries_total', 'SQL statements slower than the slow-query threshold.', ('endpoint',))
+STARTUP_SECONDS = Gauge('ffl_startup_seconds', 'Time to import app.py in this process.')
+COLD_START_TTFB = Gauge('ffl_cold_start_ttfb_seconds', 'From the start of the app.py import to the end of the first response.')
+ALL_METRICS = (REQUESTS, REQUEST_SECONDS, SQL_QUERIES, SQL_SECONDS, TEMPLATE_SECONDS, SLOW_QUERIES, STARTUP_SECONDS, COLD_START_TTFB)
+_import_started = None
+
+
+class RequestStats:
+    __slots__ = ('started', 'queries', 'sql_seconds', 'template_seconds', '_render_started')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = []  # [sql, params, seconds]
+        self.sql_seconds = 0.0
+        self.template_seconds = 0.0
+        self._render_started = None
+
+
+def _current_stats():
+    return g.get('request_stats') if has_app_context() else None
+
+
+class _TimedCursor:
+    """Adds fetch time to the query that produced the cursor."""
+    __slots__ = ('_cursor', '_entry', '_stats')
+
+    def __init__(self, cursor, entry, stats):
+        self._cursor, self._entry, self._stats = cursor, entry, stats
+
+    def _timed(self, fetch, *args):
+        started = time.perf_counter()
+        try:
+            return fetch(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            self._entry[2] += elapsed
+            self._stats.sql_seconds += elapsed
+
+    def fetchone(self):
+        return self._timed(self._cursor.fetchone)
+
+    def fetchall(self):
+        return self._timed(self._cursor.fetchall)
+
+    def fetchmany(self, size=None):
+        return self._timed(self._cursor.fetchmany, self._cursor.arraysize if size is None else size)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        # Row by row, like the sqlite3 cursor, so iterating a large result doesn't load it all at once.
+        row = self._timed(self._cursor.fetchone)
+        if row is None:
+            raise StopIteration
+        return row
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class InstrumentedConnection:
+    """Wraps a pooled sqlite3 connection; execute() is timed into the current request's stats."""
+    __slots__ = ('raw',)
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def execute(self, sql, params=()):
+        stats = _current_stats()
+        if stats is None:
+            return self.raw.execute(sql, params)
+        started = time.perf_counter()
+        cursor = self.raw.execute(sql, params)
+        elapsed = time.perf_counter() - started
+        entry = [sql, params, elapsed]
+        stats.queries.append(entry)
+        stats.sql_seconds += elapsed
+        return _TimedCursor(cursor, entry, stats)
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
+
+
+def _before_request():
+    g.request_stats = RequestStats()
+
+
+def _before_render(sender, template, context, **extra):
+    stats = _current_stats()
+    if stats is not None:
+        stats._render_started = time.perf_counter()
+
+
+def _after_render(sender, template, context, **extra):
+    stats = _current_stats()
+    if stats is not None and stats._render_started is not None:
+        stats.template_seconds += time.perf_counter() - stats._render_started
+        stats._render_started = None
+
+
+def _record(stats, endpoint, status):
+    wall = time.perf_counter() - stats.started
+    slow = [q for q in stats.queries if q[2] * 1000 >= SLOW_QUERY_MS]
+    for sql, params, seconds in slow:
+        print(f"SLOW QUERY ({seconds * 1000:.1f} ms) in {endpoint}: {' '.join(sql.split())} params={params!r}")
+    with _lock:
+        REQUESTS.inc((endpoint, str(status)))
+        REQUEST_SECONDS.observe((endpoint,), wall)
+        SQL_QUERIES.inc((endpoint,), len(stats.queries))
+        SQL_SECONDS.observe((endpoint,), stats.sql_seconds)
+        TEMPLATE_SECONDS.observe((endpoint,), stats.template_seconds)
+        if slow:
+            SLOW_QUERIES.inc((endpoint,), len(slow))
+
+
+def _after_request(response):
+    stats = _current_stats()
+    if stats is None:
+        return response
+    endpoint = request.endpoint or 'unmatched'
+    if response.is_streamed:
+        # A streamed body (the export) runs its queries after this hook, so the request is recorded when it closes.
+        status = response.status_code
+        response.call_on_close(lambda: _record(stats, endpoint, status))
+    else:
+        _record(stats, endpoint, response.status_code)
+    wall = time.perf_counter() - stats.started
+    if COLD_START_TTFB.value is None and _import_started is not None:
+        ttfb = time.perf_counter() - _import_started
+        COLD_START_TTFB.set(ttfb)
+        print(f"Cold start: import {STARTUP_SECONDS.value * 1000:.0f} ms, first response ({endpoint}) {ttfb * 1000:.0f} ms after import began")
+    if SERVER_TIMING:
+        response.headers['Server-Timing'] = (
+            f'sql;dur={stats.sql_seconds * 1000:.2f};desc="{len(stats.queries)} queries", '
+            f'tmpl;dur={stats.template_seconds * 1000:.2f}, total;dur={wall * 1000:.2f}')
+    return response
+
+
+def render_prometheus():
+    with _lock:
+        lines = []
+        for metric in ALL_METRICS:
+            lines.extend(metric.expose())
+    return '\n'.join(lines) + '\n'
+
+
+def record_startup(import_started):
+    """Called at the end of app.py with the perf_counter() taken at its first line."""
+    global _import_started
+    _import_started = import_started
+    STARTUP_SECONDS.set(time.perf_counter() - import_started)
+
+
+def init_app(app):
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    before_render_template.connect(_before_render, app)
+    template_rendered.connect(_after_render, app)
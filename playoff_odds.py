@@ -0,0 +1,272 @@
+"""Monte Carlo playoff odds and schedule luck for each season.
+
+    python playoff_odds.py [--sims 100000] [--workers N] [--model bootstrap|normal] [--json PATH] [--sidecar]
+
+A season is replayed n_sims times on its real regular-season schedule. Each
+team's weekly score is drawn from its own scores that season ("bootstrap") or
+from a normal fit to them ("normal"). The top playoff_spots teams by wins,
+then points for, play a seeded bracket (1 v 4, 2 v 3, ...); when playoff_spots
+isn't a power of two the top seeds get first-round byes (six teams: 3 v 6 and
+4 v 5, then 1 and 2 play the winners). Combined-week
+playoff rounds score the sum of two draws. Every simulation runs at once as
+NumPy arrays, in chunks so memory stays flat, and the seed is fixed per season
+so the numbers on a page don't change between renders.
+
+Luck is measured against the all-play record: each week a team's actual score
+is compared with every other team's, which is the average over all possible
+schedules. luck = actual wins - all-play expected wins.
+
+The CLI runs the whole history across a process pool. With --sidecar it saves
+the results next to the DB (REAL_Fantasy_Football_DB.odds.json), stamped with
+the DB's fingerprint; season pages only read that file, built before deploying
+like the search sidecar, and ingest.py re-simulates the seasons a load touches.
+A league without a current sidecar is simulated per request with REQUEST_SIMS
+draws, which is quick but noisier.
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+from db_cache import db_fingerprint
+
+APP_ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB = os.path.join(APP_ROOT_DIR, 'REAL_Fantasy_Football_DB.db')
+DEFAULT_SIMS = int(os.environ.get('PLAYOFF_SIMS', 100_000))
+REQUEST_SIMS = int(os.environ.get('PLAYOFF_REQUEST_SIMS', 2_000))
+SIDECAR_SUFFIX = '.odds.json'
+CHUNK = 20_000
+MODELS = ('bootstrap', 'normal')
+
+# Everything a simulation needs, as plain arrays so it pickles cheaply to workers.
+SeasonInput = namedtuple('SeasonInput', 'season_id players playoff_spots round_weeks game_week game_home game_away scores counts actual')
+
+
+def load_season(conn, season_id):
+    """SeasonInput for one season, or None if it has no regular-season games."""
+    season = conn.execute("SELECT playoff_format FROM seasons WHERE season_id = ?", (season_id,)).fetchone()
+    games = conn.execute("SELECT week_start, player1_id, player2_id, player1_score, player2_score FROM weekly_matchups WHERE season_id = ? AND game_type = 'regular' ORDER BY week_start, matchup_id", (season_id,)).fetchall()
+    if season is None or not games:
+        return None
+    spots = conn.execute("SELECT COUNT(*) FROM season_results WHERE season_id = ? AND made_playoffs = 1", (season_id,)).fetchone()[0]
+    playoff_weeks = [w for (w,) in conn.execute("SELECT weeks_included FROM weekly_matchups WHERE game_type IN ('semifinal', 'championship') AND season_id = ?", (season_id,)) if w]
+    if playoff_weeks:
+        round_weeks = max(len(w.split(',')) for w in playoff_weeks)
+    else:
+        round_weeks = 2 if season[0] == 'combined' else 1
+
+    players = sorted({g[1] for g in games} | {g[2] for g in games})
+    team = {pid: t for t, pid in enumerate(players)}
+    weeks = sorted({g[0] for g in games})
+    week = {w: k for k, w in enumerate(weeks)}
+    actual = np.full((len(players), len(weeks)), np.nan)
+    for w, p1, p2, s1, s2 in games:
+        actual[team[p1], week[w]], actual[team[p2], week[w]] = s1, s2
+    counts = (~np.isnan(actual)).sum(axis=1)
+    scores = np.zeros((len(players), counts.max()), np.float32)
+    for t in range(len(players)):
+        played = actual[t][~np.isnan(actual[t])]
+        scores[t, :len(played)] = played
+    return SeasonInput(season_id, tuple(players), min(spots or 4, len(players)), round_weeks,
+                       np.array([week[g[0]] for g in games]), np.array([team[g[1]] for g in games]),
+                       np.array([team[g[2]] for g in games]), scores, counts, actual)
+
+
+def _draw(rng, season, model, teams, n=None):
+    """One float32 score per element of `teams` (team indexes), or per (sim, team) if n is given."""
+    shape = teams.shape if n is None else (n,) + teams.shape
+    if model == 'normal':
+        mu, sigma = _normal_fit(season)
+        return mu[teams] + sigma[teams] * rng.standard_normal(shape, dtype=np.float32)
+    counts = season.counts[teams]
+    picks = (rng.random(shape, dtype=np.float32) * counts).astype(np.int32)
+    np.minimum(picks, counts - 1, out=picks)  # float32 rounding can land on counts itself
+    return np.take(season.scores, teams * season.scores.shape[1] + picks)
+
+
+def _normal_fit(season):
+    played = np.where(np.arange(season.scores.shape[1]) < season.counts[:, None], season.scores, np.nan)
+    return np.nanmean(played, axis=1).astype(np.float32), np.nan_to_num(np.nanstd(played, axis=1)).astype(np.float32)
+
+
+def all_play_weekly(actual):
+    """(wins, losses, ties) per (team, week) of a team x week score matrix (NaN = no game) against every other team's score that week."""
+    a = actual[:, None, :]
+    b = actual[None, :, :]
+    both = ~np.isnan(a) & ~np.isnan(b)
+    return (((a > b) & both).sum(axis=1), ((a < b) & both).sum(axis=1),
+            ((a == b) & both).sum(axis=1) - ~np.isnan(actual))
+
+
+def all_play(season):
+    """(wins, losses, ties) per team against every other team's score each week."""
+    return tuple(x.sum(axis=1) for x in all_play_weekly(season.actual))
+
+
+def _half_wins(home_score, away_score, home, away):
+    """Wins x2 (a tie counts 1) per team from per-game scores, via one-hot game->team matrices."""
+    home_half = np.sign(home_score - away_score) + 1  # 2 win, 1 tie, 0 loss
+    return home_half @ home + (2 - home_half) @ away
+
+
+def simulate_season(season, n_sims=DEFAULT_SIMS, model='bootstrap'):
+    """Per-player odds and luck for one SeasonInput; a list ordered like season.players."""
+    if model not in MODELS:
+        raise ValueError(f"model must be one of {MODELS}")
+    rng = np.random.default_rng((season.season_id, n_sims))
+    n_teams = len(season.players)
+    bracket = 1 << (season.playoff_spots - 1).bit_length()  # smallest power of two that holds every playoff team
+    home = np.eye(n_teams, dtype=np.float32)[season.game_home]
+    away = np.eye(n_teams, dtype=np.float32)[season.game_away]
+    win_total, playoffs, titles = np.zeros(n_teams), np.zeros(n_teams, np.int64), np.zeros(n_teams, np.int64)
+
+    for start in range(0, n_sims, CHUNK):
+        n = min(CHUNK, n_sims - start)
+        # A team plays once a week, so drawing per game side is drawing per team-week.
+        a = _draw(rng, season, model, season.game_home, n)
+        b = _draw(rng, season, model, season.game_away, n)
+        half_wins = _half_wins(a, b, home, away)
+        points_for = a @ home + b @ away
+        win_total += half_wins.sum(axis=0) / 2
+
+        seeds = np.argsort(-(half_wins.astype(np.float64) * 1e6 + points_for), axis=1, kind='stable')
+        playoffs += np.bincount(seeds[:, :season.playoff_spots].ravel(), minlength=n_teams)
+        # Empty slots (-1) fill the bracket up to a power of two; they meet the top seeds, which get a bye.
+        alive = np.full((n, bracket), -1, dtype=seeds.dtype)
+        alive[:, :season.playoff_spots] = seeds[:, :season.playoff_spots]
+        while alive.shape[1] > 1:
+            k = alive.shape[1]
+            high, low = alive[:, :k // 2], alive[:, k - 1:k // 2 - 1:-1]
+            high_score = sum(_draw(rng, season, model, high) for _ in range(season.round_weeks))
+            low_score = sum(_draw(rng, season, model, np.maximum(low, 0)) for _ in range(season.round_weeks))
+            alive = np.where((low < 0) | (high_score >= low_score), high, low)  # the higher seed wins a tie
+        titles += np.bincount(alive[:, 0], minlength=n_teams)
+
+    ap_wins, ap_losses, ap_ties = all_play(season)
+    opponents = ap_wins + ap_losses + ap_ties
+    actual = _half_wins(season.actual[season.game_home, season.game_week], season.actual[season.game_away, season.game_week], home, away) / 2
+    results = []
+    for t, player_id in enumerate(season.players):
+        actual_wins = float(actual[t])
+        expected = float((ap_wins[t] + 0.5 * ap_ties[t]) / opponents[t] * season.counts[t]) if opponents[t] else 0.0
+        results.append({'player_id': player_id, 'games': int(season.counts[t]),
+                        'sim_wins': float(win_total[t] / n_sims),
+                        'playoff_pct': float(playoffs[t] / n_sims * 100), 'title_pct': float(titles[t] / n_sims * 100),
+                        'all_play_wins': int(ap_wins[t]), 'all_play_losses': int(ap_losses[t]), 'all_play_ties': int(ap_ties[t]),
+                        'actual_wins': actual_wins, 'expected_wins': expected, 'luck': actual_wins - expected})
+    return results
+
+
+def season_odds(conn, season_id, n_sims=DEFAULT_SIMS, model='bootstrap'):
+    """player_id -> odds/luck dict for one season ({} if it has no games)."""
+    season = load_season(conn, season_id)
+    return {} if season is None else {r['player_id']: r for r in simulate_season(season, n_sims, model)}
+
+
+def _simulate(season, n_sims, model):
+    return season.season_id, simulate_season(season, n_sims, model)
+
+
+def simulate_league(db_path, n_sims=DEFAULT_SIMS, model='bootstrap', workers=None):
+    """season_id -> results for every season, one season per worker process."""
+    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    try:
+        seasons = [load_season(conn, sid) for (sid,) in conn.execute("SELECT season_id FROM seasons ORDER BY year").fetchall()]
+    finally:
+        conn.close()
+    seasons = [s for s in seasons if s is not None]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(pool.map(_simulate, seasons, repeat(n_sims), repeat(model)))
+
+
+def sidecar_path(db_path):
+    return os.path.splitext(db_path)[0] + SIDECAR_SUFFIX
+
+
+def write_sidecar(db_path, league, n_sims, model, out=None):
+    """Saves simulate_league() results for db_path to its sidecar (or `out`)."""
+    out = out or sidecar_path(db_path)
+    data = {'source_sha1': db_fingerprint(db_path)[2], 'sims': n_sims, 'model': model,
+            'seasons': {str(k): v for k, v in league.items()}}
+    with open(out + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(out + '.tmp', out)
+
+
+def _read(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def read_sidecar(db_path):
+    """season_id -> {player_id: odds} from db_path's sidecar, or None if it is missing or was built from another version of the DB."""
+    data = _read(sidecar_path(db_path))
+    if data is None or data.get('source_sha1') != db_fingerprint(db_path)[2]:
+        return None
+    return {int(sid): {r['player_id']: r for r in results} for sid, results in data['seasons'].items()}
+
+
+def update_sidecar(db_path, season_ids, previous_sha1):
+    """Re-simulates season_ids into db_path's sidecar after a load; returns how many, or None if it can't.
+
+    previous_sha1 is the DB's fingerprint before the load. The other seasons'
+    games didn't change and their seeds are fixed, so their odds stay as they
+    are. A sidecar built from another version of the DB is left alone and the
+    caller rebuilds it.
+    """
+    data = _read(sidecar_path(db_path))
+    if data is None or data.get('source_sha1') != previous_sha1:
+        return None
+    league = {int(sid): results for sid, results in data['seasons'].items()}
+    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    try:
+        for season_id in season_ids:
+            season = load_season(conn, season_id)
+            league.pop(season_id, None)
+            if season is not None:
+                league[season_id] = simulate_season(season, data['sims'], data['model'])
+    finally:
+        conn.close()
+    write_sidecar(db_path, league, data['sims'], data['model'])
+    return len(season_ids)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db', default=DEFAULT_DB)
+    parser.add_argument('--sims', type=int, default=DEFAULT_SIMS)
+    parser.add_argument('--model', choices=MODELS, default='bootstrap')
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument('--json', help="Also write the results to this file.")
+    parser.add_argument('--sidecar', action='store_true', help="Also write the results next to the DB, where season pages read them.")
+    args = parser.parse_args(argv)
+    started = time.perf_counter()
+    league = simulate_league(args.db, args.sims, args.model, args.workers)
+    elapsed = time.perf_counter() - started
+    for season_id, results in league.items():
+        print(f"{season_id}:")
+        for r in sorted(results, key=lambda r: -r['title_pct']):
+            print(f"  player {r['player_id']:>3}  playoffs {r['playoff_pct']:5.1f}%  title {r['title_pct']:5.1f}%  "
+                  f"wins {r['actual_wins']:4.1f} vs {r['expected_wins']:4.1f} all-play (luck {r['luck']:+.1f})")
+    print(f"{len(league)} season(s) x {args.sims} simulations in {elapsed:.2f}s")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({str(k): v for k, v in league.items()}, f, indent=1)
+    if args.sidecar:
+        write_sidecar(args.db, league, args.sims, args.model)
+        print(f"Wrote {sidecar_path(args.db)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
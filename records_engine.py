@@ -0,0 +1,187 @@
+"""Builds the /record-book `records` dict in one pass over the league data.
+
+The old view ran ~25 queries (several UNION ALL scans of weekly_matchups joined
+three ways) plus a nested streak loop on every hit. Here each table is read
+once, every record is folded in a single walk over the rows, and the result
+is cached in db_cache until the .db file changes. Streaks come from the
+columnar game log (game_log.py) rather than from that walk.
+"""
+from collections import defaultdict
+
+DEFAULT_SINGLE_GAME = {'score': 0.0, 'player_name': 'N/A', 'opponent_name': 'N/A', 'week': 'N/A', 'year': 'N/A', 'game_type': 'N/A'}
+DEFAULT_MARGIN = {'margin': 0.0, 'p1_name': 'N/A', 'p2_name': 'N/A', 'player1_score': 0.0, 'player2_score': 0.0, 'year': 'N/A', 'week_start': 'N/A', 'game_type': 'N/A'}
+DEFAULT_COMBINED = {'combined_score': 0.0, 'p1_name': 'N/A', 'p2_name': 'N/A', 'player1_score': 0.0, 'player2_score': 0.0, 'year': 'N/A', 'week_start': 'N/A', 'game_type': 'N/A'}
+DEFAULT_SEASON = {'value': 0.0, 'player_name': 'N/A', 'year': 'N/A'}
+DEFAULT_SEASON_RECORD = {'wins': 0, 'losses': 0, 'ties': 0, 'player_name': 'N/A', 'year': 'N/A', 'regular_season_record': '0-0-0'}
+
+
+class _Best:
+    """Keeps the first row with the highest (or lowest) value seen so far."""
+    __slots__ = ('is_min', 'value', 'row')
+
+    def __init__(self, is_min=False):
+        self.is_min, self.value, self.row = is_min, None, None
+
+    def offer(self, value, make_row):
+        if self.value is None or (value < self.value if self.is_min else value > self.value):
+            self.value, self.row = value, make_row()
+
+    def result(self, default, value_key):
+        if self.row is not None:
+            return self.row
+        # Same sentinels the template checks for: inf for "lowest", 0.0 otherwise.
+        row = default.copy()
+        row[value_key] = float('inf') if self.is_min else 0.0
+        return row
+
+
+def is_single_week(m):
+    return m['week_end'] is None and not m['weeks_included']
+
+
+def _leaders(counts, names, is_float=False):
+    # Everyone tied for the top count, in player_id order.
+    if not counts:
+        return []
+    top = max(counts.values())
+    if top == 0 and not is_float:
+        return []
+    return [{'count': float(c) if is_float else int(c), 'player_name': names[pid], 'player_id': pid}
+            for pid, c in sorted(counts.items()) if c == top]
+
+
+def load_league(conn):
+    """Reads every table the record book needs, one query per table."""
+    players = {r[0]: r[1] for r in conn.execute("SELECT player_id, name FROM players")}
+    season_years = {r[0]: r[1] for r in conn.execute("SELECT season_id, year FROM seasons")}
+    results = conn.execute("SELECT player_id, season_id, regular_season_record, wins, losses, ties, points_for, points_against, points_per_game, made_playoffs FROM season_results ORDER BY result_id").fetchall()
+    championships = conn.execute("SELECT season_id, winner_id, runner_up_id FROM championships ORDER BY championship_id").fetchall()
+    matchups = conn.execute("SELECT matchup_id, season_id, week_start, week_end, weeks_included, player1_id, player2_id, player1_score, player2_score, game_type FROM weekly_matchups").fetchall()
+    return players, season_years, results, championships, matchups
+
+
+def build_records(conn, log):
+    """The records dict; `log` is the league's game_log.GameLog, which supplies the streaks."""
+    players, season_years, results, championships, matchups = load_league(conn)
+    cols = ('matchup_id', 'season_id', 'week_start', 'week_end', 'weeks_included', 'player1_id', 'player2_id', 'player1_score', 'player2_score', 'game_type')
+    games = [dict(zip(cols, m)) for m in matchups if m[1] in season_years]
+    # Chronological order doubles as the tie-break: the earliest game wins.
+    games.sort(key=lambda m: (season_years[m['season_id']], m['week_start'], m['matchup_id']))
+
+    high_reg, high_playoff, low = _Best(), _Best(), _Best(is_min=True)
+    largest_mov, smallest_mov, closest_playoff = _Best(), _Best(is_min=True), _Best(is_min=True)
+    largest_playoff_mov, low_combined = _Best(), _Best(is_min=True)
+    toilet_wins, toilet_losses, toilet_apps = defaultdict(int), defaultdict(int), defaultdict(int)
+
+    for m in games:
+        p1, p2, s1, s2, gt = m['player1_id'], m['player2_id'], m['player1_score'], m['player2_score'], m['game_type']
+        year, week = season_years[m['season_id']], m['week_start']
+
+        if gt == 'toilet_bowl':
+            if p1 in players: toilet_apps[p1] += 1
+            if p2 in players: toilet_apps[p2] += 1
+            if s1 is not None and s2 is not None and s1 != s2:
+                winner, loser = (p1, p2) if s1 > s2 else (p2, p1)
+                if winner in players: toilet_wins[winner] += 1
+                if loser in players: toilet_losses[loser] += 1
+
+        if p1 not in players or p2 not in players:
+            continue
+        n1, n2 = players[p1], players[p2]
+
+        if gt == 'regular':
+            if s1 is not None:
+                high_reg.offer(s1, lambda: {'score': float(s1), 'player_name': n1, 'opponent_name': n2, 'week': week, 'year': year, 'game_type': gt})
+            if s2 is not None:
+                high_reg.offer(s2, lambda: {'score': float(s2), 'player_name': n2, 'opponent_name': n1, 'week': week, 'year': year, 'game_type': gt})
+
+        if not is_single_week(m):
+            continue
+        is_playoff = gt is not None and gt != 'regular'
+        for own, opp, own_name, opp_name in ((s1, s2, n1, n2), (s2, s1, n2, n1)):
+            if own is None:
+                continue
+            row = lambda: {'score': float(own), 'player_name': own_name, 'opponent_name': opp_name, 'week': week, 'year': year, 'game_type': gt}
+            low.offer(own, row)
+            if is_playoff:
+                high_playoff.offer(own, row)
+
+        if s1 is None or s2 is None:
+            continue
+        s1f, s2f = float(s1), float(s2)
+        margin, combined = abs(s1f - s2f), s1f + s2f
+        game = lambda key, value: {key: value, 'p1_name': n1, 'p2_name': n2, 'player1_score': s1f, 'player2_score': s2f, 'year': year, 'week_start': week, 'game_type': gt}
+        largest_mov.offer(margin, lambda: game('margin', margin))
+        low_combined.offer(combined, lambda: game('combined_score', combined))
+        if margin > 0:
+            smallest_mov.offer(margin, lambda: game('margin', margin))
+        if is_playoff:
+            largest_playoff_mov.offer(margin, lambda: game('margin', margin))
+            if margin > 0:
+                closest_playoff.offer(margin, lambda: game('margin', margin))
+
+    records = {
+        'high_score_reg': high_reg.result(DEFAULT_SINGLE_GAME, 'score'),
+        'high_score_playoff': high_playoff.result(DEFAULT_SINGLE_GAME, 'score'),
+        'low_score': low.result(DEFAULT_SINGLE_GAME, 'score'),
+        'largest_mov': largest_mov.result(DEFAULT_MARGIN, 'margin'),
+        'smallest_mov': smallest_mov.result(DEFAULT_MARGIN, 'margin'),
+        'closest_playoff_game': closest_playoff.result(DEFAULT_MARGIN, 'margin'),
+        'low_combined_score': low_combined.result(DEFAULT_COMBINED, 'combined_score'),
+        'largest_playoff_mov': largest_playoff_mov.result(DEFAULT_MARGIN, 'margin'),
+    }
+
+    # --- Season-level records and career leaders from season_results ---
+    high_pf, low_pf, most_pa = _Best(), _Best(is_min=True), _Best()
+    high_ppg, low_ppg = _Best(), _Best(is_min=True)
+    best_rec = worst_rec = None
+    career_pf, ppg_sum, ppg_n, playoffs = defaultdict(float), defaultdict(float), defaultdict(int), defaultdict(int)
+    for pid, sid, rec, w, l, t, pf, pa, ppg, made_playoffs in results:
+        if pid not in players:
+            continue
+        name = players[pid]
+        if pf is not None: career_pf[pid] += pf
+        if ppg is not None: ppg_sum[pid] += ppg; ppg_n[pid] += 1
+        if made_playoffs == 1: playoffs[pid] += 1
+        if sid not in season_years:
+            continue
+        year = season_years[sid]
+        season_row = lambda v: (lambda: {'value': float(v), 'player_name': name, 'year': year})
+        if pf is not None: high_pf.offer(pf, season_row(pf)); low_pf.offer(pf, season_row(pf))
+        if pa is not None: most_pa.offer(pa, season_row(pa))
+        if ppg is not None: high_ppg.offer(ppg, season_row(ppg)); low_ppg.offer(ppg, season_row(ppg))
+        if w is not None and l is not None:
+            row = {'wins': w, 'losses': l, 'ties': t, 'player_name': name, 'year': year, 'regular_season_record': rec}
+            # SQLite sorts NULL ties first ascending and last descending.
+            best_key = (-w, l, -1 if t is None else t)
+            worst_key = (-l, w, float('inf') if t is None else -t)
+            if best_rec is None or best_key < best_rec[0]: best_rec = (best_key, row)
+            if worst_rec is None or worst_key < worst_rec[0]: worst_rec = (worst_key, row)
+
+    records['high_pf_season'] = high_pf.result(DEFAULT_SEASON, 'value')
+    records['lowest_pf_season'] = low_pf.result(DEFAULT_SEASON, 'value')
+    records['most_pa_season'] = most_pa.result(DEFAULT_SEASON, 'value')
+    records['high_ppg_season'] = high_ppg.result(DEFAULT_SEASON, 'value')
+    records['lowest_ppg_season'] = low_ppg.result(DEFAULT_SEASON, 'value')
+    records['best_season_rec'] = best_rec[1] if best_rec else DEFAULT_SEASON_RECORD.copy()
+    records['worst_season_rec'] = worst_rec[1] if worst_rec else DEFAULT_SEASON_RECORD.copy()
+
+    titles, title_games = defaultdict(int), defaultdict(int)
+    for sid, winner, runner_up in championships:
+        if winner in players: titles[winner] += 1; title_games[winner] += 1
+        if runner_up in players: title_games[runner_up] += 1
+
+    records['most_career_pf'] = _leaders(career_pf, players, True)
+    records['highest_career_ppg'] = _leaders({pid: ppg_sum[pid] / n for pid, n in ppg_n.items()}, players, True)
+    records['most_championships'] = _leaders(titles, players)
+    records['most_playoffs'] = _leaders(playoffs, players)
+    records['most_champ_appearances'] = _leaders(title_games, players)
+    records['most_toilet_wins'] = _leaders(toilet_wins, players)
+    records['most_toilet_losses'] = _leaders(toilet_losses, players)
+    records['most_toilet_appearances'] = _leaders(toilet_apps, players)
+
+    # --- Streaks come from the game log's run-length engine ---
+    records['longest_win_streak'] = log.season_record('win')
+    records['longest_loss_streak'] = log.season_record('loss')
+    records['all_time_streaks'] = log.all_time_leaders()
+    return records
@@ -0,0 +1,324 @@
+"""Full-text and structured search over players, seasons and games.
+
+    python search.py build [--db PATH]         # write the sidecar index next to the DB
+    python search.py query TEXT [--db PATH]    # print what /search finds for TEXT
+
+The league DB is opened read-only, so the index is a sidecar SQLite file next
+to it (REAL_Fantasy_Football_DB.search.db for REAL_Fantasy_Football_DB.db),
+built before deploying like `db_indexes.py migrate`. ingest.py adds the games
+of each load to it (update_sidecar). It holds:
+
+    game_text   FTS5 over every game (rowid = matchup_id): its notes, game type
+                ("championship", "toilet bowl", ...), year, week and both names
+    suggest     FTS5 with prefix indexes over player names, seasons (with their
+                notes and playoff format) and game types, for autocomplete and
+                the player/season hits on the search page
+    games       one row per game with the high and low score and the margin,
+                indexed for the structured filters (year, week, game type,
+                score and margin ranges)
+
+The sidecar records the fingerprint of the DB it was built from. If it is
+missing or out of date (a league without one, a DB changed some other way) the
+app builds the same tables in memory and logs that it did. The app's cached
+index and the search pages' ETags also follow the sidecar file, so rebuilding
+it is picked up without a DB change, and the index it replaces is closed.
+"""
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+
+from db_cache import db_fingerprint
+
+APP_ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB = os.path.join(APP_ROOT_DIR, 'REAL_Fantasy_Football_DB.db')
+SIDECAR_SUFFIX = '.search.db'
+INDEX_VERSION = '1'
+PER_PAGE = 25
+SUGGEST_LIMIT = 8
+GAME_TYPE_LABELS = {'regular': 'Regular season', 'semifinal': 'Semifinal', 'championship': 'Championship',
+                    '3rd_place': '3rd place', 'toilet_bowl': 'Toilet bowl'}
+# Filter name -> type; every filter is optional.
+FILTERS = {'year': int, 'week': int, 'game_type': str, 'min_score': float, 'max_score': float,
+           'min_margin': float, 'max_margin': float}
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE VIRTUAL TABLE game_text USING fts5(body, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3');
+CREATE VIRTUAL TABLE suggest USING fts5(kind UNINDEXED, ref UNINDEXED, label, body, tokenize = 'unicode61 remove_diacritics 2', prefix = '1 2 3');
+CREATE TABLE games (
+    matchup_id INTEGER PRIMARY KEY,
+    year INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    game_type TEXT NOT NULL,
+    player1_id INTEGER NOT NULL,
+    p1_name TEXT NOT NULL,
+    player1_score REAL NOT NULL,
+    player2_id INTEGER NOT NULL,
+    p2_name TEXT NOT NULL,
+    player2_score REAL NOT NULL,
+    high_score REAL NOT NULL,
+    low_score REAL NOT NULL,
+    margin REAL NOT NULL,
+    notes TEXT
+);
+CREATE INDEX idx_games_year_week ON games (year, week);
+CREATE INDEX idx_games_type_year ON games (game_type, year);
+CREATE INDEX idx_games_high ON games (high_score);
+CREATE INDEX idx_games_low ON games (low_score);
+CREATE INDEX idx_games_margin ON games (margin);
+"""
+
+
+def sidecar_path(db_path):
+    return os.path.splitext(db_path)[0] + SIDECAR_SUFFIX
+
+
+def fts_query(text):
+    """A safe FTS5 query for free text: every word must match, as a prefix."""
+    return ' '.join(f'"{word}"*' for word in re.findall(r'\w+', text.lower()))
+
+
+def parse_filters(args):
+    """(filters, errors) from a mapping of query arguments; blank or invalid values are left out."""
+    filters, errors = {}, []
+    for name, kind in FILTERS.items():
+        value = (args.get(name) or '').strip()
+        if not value:
+            continue
+        try:
+            filters[name] = kind(value)
+        except ValueError:
+            errors.append(f"Ignored {name.replace('_', ' ')} '{value}': not a number.")
+    if 'game_type' in filters and filters['game_type'] not in GAME_TYPE_LABELS:
+        errors.append(f"Ignored unknown game type '{filters.pop('game_type')}'.")
+    return filters, errors
+
+
+GAMES_SQL = "SELECT wm.matchup_id, s.year, wm.week_start, wm.game_type, wm.player1_id, p1.name, wm.player1_score, wm.player2_id, p2.name, wm.player2_score, wm.notes FROM weekly_matchups wm JOIN seasons s ON wm.season_id = s.season_id JOIN players p1 ON wm.player1_id = p1.player_id JOIN players p2 ON wm.player2_id = p2.player_id"
+
+
+def _insert_games(index, games):
+    index.executemany("INSERT INTO games VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                      [g[:10] + (max(g[6], g[9]), min(g[6], g[9]), abs(g[6] - g[9]), g[10]) for g in games])
+    index.executemany("INSERT INTO game_text (rowid, body) VALUES (?, ?)",
+                      [(g[0], f"{g[5]} vs {g[8]} {GAME_TYPE_LABELS.get(g[3], g[3])} week {g[2]} {g[1]} {g[10] or ''}") for g in games])
+
+
+def populate(source, index):
+    """Fills an empty index connection (SCHEMA already applied) from a league DB connection."""
+    games = source.execute(GAMES_SQL).fetchall()
+    _insert_games(index, games)
+    rows = [('player', pid, name, name) for pid, name in source.execute("SELECT player_id, name FROM players")]
+    rows += [('season', year, f'{year} season', f"{playoff_format or ''} {notes or ''}")
+             for year, playoff_format, notes in source.execute("SELECT year, playoff_format, notes FROM seasons")]
+    rows += [('game_type', game_type, label, game_type.replace('_', ' ')) for game_type, label in GAME_TYPE_LABELS.items()]
+    index.executemany("INSERT INTO suggest (kind, ref, label, body) VALUES (?, ?, ?, ?)", rows)
+    index.execute("INSERT INTO game_text (game_text) VALUES ('optimize')")
+    index.execute("INSERT INTO suggest (suggest) VALUES ('optimize')")
+    return len(games)
+
+
+def add_games(source, index, after_matchup_id):
+    """Indexes the games with a matchup_id above after_matchup_id (the ones a load just inserted); returns how many."""
+    games = source.execute(GAMES_SQL + " WHERE wm.matchup_id > ?", (after_matchup_id,)).fetchall()
+    _insert_games(index, games)
+    return len(games)
+
+
+def _build(db_path, index):
+    source = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    try:
+        index.executescript(SCHEMA)
+        count = populate(source, index)
+    finally:
+        source.close()
+    index.executemany("INSERT INTO meta (key, value) VALUES (?, ?)",
+                      [('version', INDEX_VERSION), ('source_sha1', db_fingerprint(db_path)[2])])
+    index.execute("ANALYZE")
+    index.commit()
+    return count
+
+
+def build_sidecar(db_path, out=None):
+    """Writes the index for db_path to its sidecar file (or `out`); returns the number of games indexed."""
+    out = out or sidecar_path(db_path)
+    tmp = out + '.tmp'
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    index = sqlite3.connect(tmp)
+    try:
+        count = _build(db_path, index)
+    finally:
+        index.close()
+    os.replace(tmp, out)
+    return count
+
+
+def update_sidecar(db_path, after_matchup_id, previous_sha1):
+    """Adds a load's new games to db_path's sidecar in place; returns how many, or None if it can't.
+
+    previous_sha1 is the DB's fingerprint before the load. Players, seasons and
+    game types can't be added by a load, so only games and game_text change. A
+    sidecar that wasn't built from that version of the DB (or an older index
+    version) is left alone and the caller rebuilds it with build_sidecar().
+    """
+    index = sqlite3.connect(sidecar_path(db_path), isolation_level=None)
+    try:
+        try:
+            meta = dict(index.execute("SELECT key, value FROM meta"))
+        except sqlite3.DatabaseError:
+            return None
+        if meta.get('version') != INDEX_VERSION or meta.get('source_sha1') != previous_sha1:
+            return None
+        source = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+        try:
+            index.execute("BEGIN IMMEDIATE")
+            try:
+                count = add_games(source, index, after_matchup_id)
+                index.execute("UPDATE meta SET value = ? WHERE key = 'source_sha1'", (db_fingerprint(db_path)[2],))
+            except BaseException:
+                index.execute("ROLLBACK")
+                raise
+            index.execute("COMMIT")
+        finally:
+            source.close()
+        return count
+    finally:
+        index.close()
+
+
+def search_sql(query, filters):
+    """(sql, params) for the games matching an fts_query() string and parsed filters; LIMIT/OFFSET params go last."""
+    where, params = [], []
+    if query:
+        where.append("game_text MATCH ?")
+        params.append(query)
+    for name, column in (('year', 'g.year'), ('week', 'g.week'), ('game_type', 'g.game_type')):
+        if name in filters:
+            where.append(f"{column} = ?")
+            params.append(filters[name])
+    low, high = filters.get('min_score'), filters.get('max_score')
+    if low is not None and high is not None:
+        # Either team scored in the range.
+        where.append("(g.high_score BETWEEN ? AND ? OR g.low_score BETWEEN ? AND ?)")
+        params += [low, high, low, high]
+    elif low is not None:
+        where.append("g.high_score >= ?")
+        params.append(low)
+    elif high is not None:
+        where.append("g.low_score <= ?")
+        params.append(high)
+    if 'min_margin' in filters:
+        where.append("g.margin >= ?")
+        params.append(filters['min_margin'])
+    if 'max_margin' in filters:
+        where.append("g.margin <= ?")
+        params.append(filters['max_margin'])
+
+    sql = "SELECT g.* FROM games g"
+    if query:
+        sql += " JOIN game_text ON game_text.rowid = g.matchup_id"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY " + ("game_text.rank, " if query else "") + "g.year DESC, g.week DESC, g.matchup_id"
+    return sql + " LIMIT ? OFFSET ?", params
+
+
+def plan_samples():
+    """search()'s SQL with and without text, for no filter, each filter and all of them, for `db_indexes.py check`."""
+    sample = {'year': 2020, 'week': 1, 'game_type': 'regular', 'min_score': 100.0, 'max_score': 150.0,
+              'min_margin': 1.0, 'max_margin': 10.0}
+    filter_sets = [{}] + [{name: value} for name, value in sample.items()] + [sample]
+    return {'SearchIndex.search': [search_sql(query, filters)[0] for query in ('', '"x"*') for filters in filter_sets]}
+
+
+class SearchIndex:
+    def __init__(self, conn, source):
+        self.source = source  # 'sidecar' or 'memory'
+        self._conn = conn
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()  # one connection shared by the request threads
+
+    @classmethod
+    def open(cls, db_path):
+        """The sidecar index for db_path if it was built from this version of the file, else one built in memory."""
+        path = sidecar_path(db_path)
+        if os.path.exists(path):
+            conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True, check_same_thread=False)
+            try:
+                meta = dict(conn.execute("SELECT key, value FROM meta"))
+            except sqlite3.DatabaseError:
+                meta = {}
+            if meta.get('version') == INDEX_VERSION and meta.get('source_sha1') == db_fingerprint(db_path)[2]:
+                return cls(conn, 'sidecar')
+            conn.close()
+            print(f"Search index {path} is out of date; building it in memory. Run `python search.py build` to refresh it.")
+        else:
+            print(f"No search index at {path}; building it in memory.")
+        conn = sqlite3.connect(':memory:', check_same_thread=False)
+        _build(db_path, conn)
+        return cls(conn, 'memory')
+
+    def suggest(self, text, limit=SUGGEST_LIMIT):
+        """[{kind, ref, label}] of players, seasons and game types matching text as a prefix, best first."""
+        query = fts_query(text)
+        if not query:
+            return []
+        with self._lock:
+            rows = self._conn.execute("SELECT kind, ref, label FROM suggest WHERE suggest MATCH ? ORDER BY rank LIMIT ?",
+                                      (query, limit)).fetchall()
+        return [dict(r) for r in rows]
+
+    def search(self, text='', filters=None, page=1, per_page=PER_PAGE):
+        """Games matching the text and filters, one page at a time, plus player/season hits on page 1.
+
+        Returns {'hits', 'games', 'page', 'has_next'}; games are dicts of the games
+        table, most relevant first when there is text, most recent first otherwise.
+        """
+        query = fts_query(text)
+        page = max(1, page)
+        sql, params = search_sql(query, filters or {})
+        params += [per_page + 1, (page - 1) * per_page]
+        with self._lock:
+            games = [dict(r) for r in self._conn.execute(sql, params)]
+            hits = [dict(r) for r in self._conn.execute(
+                "SELECT kind, ref, label FROM suggest WHERE suggest MATCH ? AND kind != 'game_type' ORDER BY rank LIMIT ?",
+                (query, SUGGEST_LIMIT))] if query and page == 1 else []
+        return {'hits': hits, 'games': games[:per_page], 'page': page, 'has_next': len(games) > per_page}
+
+    def close(self):
+        with self._lock:  # let a query that is already running finish
+            self._conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('command', choices=['build', 'query'])
+    parser.add_argument('text', nargs='?', default='', help="Search text (query only)")
+    parser.add_argument('--db', default=DEFAULT_DB)
+    args = parser.parse_args(argv)
+    if args.command == 'build':
+        started = time.perf_counter()
+        count = build_sidecar(args.db)
+        print(f"Indexed {count} game(s) into {sidecar_path(args.db)} in {time.perf_counter() - started:.2f}s")
+        return 0
+    index = SearchIndex.open(args.db)
+    started = time.perf_counter()
+    result = index.search(args.text)
+    elapsed = (time.perf_counter() - started) * 1000
+    for hit in result['hits']:
+        print(f"{hit['kind']:<8} {hit['label']}")
+    for g in result['games']:
+        print(f"{g['year']} week {g['week']:<2} {GAME_TYPE_LABELS.get(g['game_type'], g['game_type']):<15} "
+              f"{g['p1_name']} {g['player1_score']} - {g['player2_score']} {g['p2_name']}  {g['notes'] or ''}")
+    print(f"{len(result['hits'])} hit(s), {len(result['games'])} game(s){' (more on the next page)' if result['has_next'] else ''} "
+          f"in {elapsed:.2f} ms from the {index.source} index")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Week-by-week standings and all-play power rankings for one season.
+
+The season's regular-season games are added into player x week arrays of
+wins, losses, ties and points for/against (np.add.at, so a team with two
+games in a week counts both), and a cumulative sum along the week axis gives
+every team's record after every week in one pass. The standing after a week
+is a lexsort on wins (ties count half), then points for, which is how
+ingest.rerank orders teams before playoff results are applied.
+
+All-play compares each team's score with every other team's score that week
+(playoff_odds.all_play_weekly). The power ranking orders teams by their
+running all-play win share, so it doesn't depend on who they happened to play.
+
+/seasons/<year>/timeline renders the result and /seasons/<year>/timeline.json
+returns the same series for charts; both come from one cached build per season.
+"""
+import numpy as np
+
+from playoff_odds import all_play_weekly
+
+SERIES = ('scores', 'wins', 'losses', 'ties', 'points_for', 'points_against', 'rank',
+          'all_play_wins', 'all_play_losses', 'all_play_ties', 'power_rank')
+
+
+def _ranks(primary, secondary):
+    """1-based rank per column of a player x week array, highest primary first, then highest secondary."""
+    order = np.lexsort((-secondary, -primary), axis=0)
+    ranks = np.empty(primary.shape, dtype=np.int64)
+    np.put_along_axis(ranks, order, np.arange(1, primary.shape[0] + 1)[:, None], axis=0)
+    return ranks
+
+
+def _series(values, digits=None):
+    if digits is None:
+        return [int(v) for v in values]
+    return [None if np.isnan(v) else round(float(v), digits) for v in values]
+
+
+def build_timeline(conn, season_id):
+    """The season's timeline, or None if it has no regular-season games.
+
+    {'season_id', 'weeks': [week numbers], 'players': [...]}, one player dict per
+    team ordered by the standing after the last week, holding player_id, name
+    and a list with one value per week for every name in SERIES (scores is
+    None for a week without a game; everything else is cumulative).
+    """
+    games = conn.execute("SELECT wm.week_start, wm.player1_id, p1.name, wm.player2_id, p2.name, wm.player1_score, wm.player2_score FROM weekly_matchups wm JOIN players p1 ON wm.player1_id = p1.player_id JOIN players p2 ON wm.player2_id = p2.player_id WHERE wm.season_id = ? AND wm.game_type = 'regular' ORDER BY wm.week_start, wm.matchup_id", (season_id,)).fetchall()
+    if not games:
+        return None
+    names = {g[1]: g[2] for g in games}
+    names.update((g[3], g[4]) for g in games)
+    players = sorted(names)
+    team = {pid: t for t, pid in enumerate(players)}
+    weeks = sorted({g[0] for g in games})
+    column = {w: k for k, w in enumerate(weeks)}
+
+    # One row per game side, in game order: (team, week, own score, opponent score).
+    week = np.repeat([column[g[0]] for g in games], 2)
+    side = np.array([team[pid] for g in games for pid in (g[1], g[3])])
+    own = np.array([score for g in games for score in (g[5], g[6])], dtype=float)
+    opp = own.reshape(-1, 2)[:, ::-1].ravel()
+
+    def running(values):
+        grid = np.zeros((len(players), len(weeks)))
+        np.add.at(grid, (side, week), values)
+        return np.cumsum(grid, axis=1)
+
+    wins, losses, ties = running(own > opp), running(own < opp), running(own == opp)
+    points_for, points_against = running(own), running(opp)
+    scores = np.full((len(players), len(weeks)), np.nan)
+    scores[side, week] = own  # same as playoff_odds: the last game of a week is that week's score
+    ap_wins, ap_losses, ap_ties = (np.cumsum(x, axis=1) for x in all_play_weekly(scores))
+    ap_games = ap_wins + ap_losses + ap_ties
+    ap_share = np.divide(ap_wins + 0.5 * ap_ties, ap_games, out=np.zeros(ap_games.shape), where=ap_games > 0)
+
+    series = {'scores': scores, 'wins': wins, 'losses': losses, 'ties': ties,
+              'points_for': points_for, 'points_against': points_against,
+              'rank': _ranks(wins + 0.5 * ties, points_for),
+              'all_play_wins': ap_wins, 'all_play_losses': ap_losses, 'all_play_ties': ap_ties,
+              'power_rank': _ranks(ap_share, points_for)}
+    rows = []
+    for t in np.argsort(series['rank'][:, -1], kind='stable'):
+        row = {'player_id': players[t], 'name': names[players[t]]}
+        for name in SERIES:
+            row[name] = _series(series[name][t], 2 if name in ('scores', 'points_for', 'points_against') else None)
+        rows.append(row)
+    return {'season_id': season_id, 'weeks': weeks, 'players': rows}
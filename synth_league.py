@@ -0,0 +1,168 @@
+"""Generates a synthetic league DB with the same schema as the real one, at any scale.
+
+    python synth_league.py OUT.db [--managers 1000] [--seasons 50] [--teams 200] [--seed 1]
+
+The tables are copied from REAL_Fantasy_Football_DB.db and indexed with
+db_indexes. Each season `teams` managers play a round-robin regular season of
+13 or 14 weeks, with a few managers joining or leaving every year. The top four teams by
+record, then points for, play semifinals, a championship and a 3rd place game,
+and the bottom two play the toilet bowl. About one season in five uses the
+combined format, where each playoff round spans two weeks (week_end /
+weeks_included). Scores come from a persistent skill per manager plus weekly
+noise. season_results and championships are derived from the games with the
+same rules as ingest.py, so `ingest.py check` passes on the output.
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import time
+
+import numpy as np
+
+import db_indexes
+import ingest
+
+APP_ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_DB = os.path.join(APP_ROOT_DIR, 'REAL_Fantasy_Football_DB.db')
+FIRST_YEAR = 2000
+SYLLABLES = ('ka', 'ro', 'mi', 'ta', 'be', 'lu', 'so', 'da', 'ne', 'vi', 'jo', 'ra', 'pe', 'zu', 'li', 'go')
+
+
+def _names(count):
+    """Distinct manager names: each number spelled in base len(SYLLABLES), one syllable per digit."""
+    names = []
+    for n in range(count):
+        parts, k = [], n + len(SYLLABLES)
+        while k:
+            k, r = divmod(k, len(SYLLABLES))
+            parts.append(SYLLABLES[r])
+        names.append(''.join(reversed(parts)).capitalize())
+    return names
+
+
+def _create_schema(conn):
+    source = sqlite3.connect(f'file:{SCHEMA_DB}?mode=ro', uri=True)
+    try:
+        tables = [sql for (sql,) in source.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")]
+    finally:
+        source.close()
+    for sql in tables:
+        conn.execute(sql)
+
+
+def _round_robin(teams, weeks):
+    """(week, home, away) for `weeks` weeks of the circle method over an even-sized list."""
+    order = list(teams)
+    games = []
+    for week in range(1, weeks + 1):
+        half = len(order) // 2
+        games.extend((week, order[i], order[-1 - i]) for i in range(half))
+        order = [order[0], order[-1]] + order[1:-1]
+    return games
+
+
+def _season_games(rng, season_id, teams, skill, combined):
+    """All weekly_matchups rows for one season, regular games first."""
+    reg_end = 13 if rng.random() < 0.5 else 14
+    games = _round_robin(teams, reg_end)
+    noise = rng.normal(115.0, 22.0, size=(len(games), 2))
+    rows = [(season_id, week, None, None, a, b, round(max(20.0, skill[a] + noise[k, 0]), 2), round(max(20.0, skill[b] + noise[k, 1]), 2), 'regular', None)
+            for k, (week, a, b) in enumerate(games)]
+
+    record = {t: [0.0, 0.0] for t in teams}  # wins (ties as half), points for
+    for _, _, _, _, a, b, sa, sb, _, _ in rows:
+        record[a][1] += sa
+        record[b][1] += sb
+        record[a][0] += 1.0 if sa > sb else 0.5 if sa == sb else 0.0
+        record[b][0] += 1.0 if sb > sa else 0.5 if sa == sb else 0.0
+    standing = sorted(teams, key=lambda t: (-record[t][0], -record[t][1]))
+
+    span = 2 if combined else 1
+
+    def play(week, a, b, game_type):
+        score = lambda t: round(sum(max(20.0, skill[t] + rng.normal(115.0, 22.0)) for _ in range(span)), 2)
+        sa, sb = score(a), score(b)
+        while game_type != 'semifinal' and sa == sb:  # placement games need a winner
+            sb = score(b)
+        if combined:
+            rows.append((season_id, week, week + 1, f'{week},{week + 1}', a, b, sa, sb, game_type, None))
+        else:
+            rows.append((season_id, week, None, None, a, b, sa, sb, game_type, None))
+        return (a, b) if sa >= sb else (b, a)
+
+    semis, final = reg_end + 1, reg_end + 1 + span
+    w1, l1 = play(semis, standing[0], standing[3], 'semifinal')
+    w2, l2 = play(semis, standing[1], standing[2], 'semifinal')
+    play(semis, standing[-2], standing[-1], 'toilet_bowl')
+    play(final, w1, w2, 'championship')
+    play(final, l1, l2, '3rd_place')
+    return reg_end, standing[:4], rows
+
+
+def generate(out_path, managers=1000, seasons=50, teams=200, seed=1):
+    """Writes a new league DB to out_path and returns its row counts."""
+    if managers < 6:
+        raise ValueError("a league needs at least 6 managers")
+    teams = max(6, min(teams, managers) // 2 * 2)
+    rng = np.random.default_rng(seed)
+    if os.path.exists(out_path):
+        os.remove(out_path)
+    conn = sqlite3.connect(out_path, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("BEGIN")
+        _create_schema(conn)
+        player_ids = list(range(1, managers + 1))
+        conn.executemany("INSERT INTO players (player_id, name) VALUES (?, ?)", zip(player_ids, _names(managers)))
+        skill = dict(zip(player_ids, rng.normal(0.0, 8.0, size=managers)))
+
+        league = [int(p) for p in rng.choice(player_ids, size=teams, replace=False)]
+        matchups = 0
+        for k in range(seasons):
+            season_id = FIRST_YEAR + k
+            if k:
+                # Roughly one manager in ten is replaced between seasons.
+                playing = set(league)
+                bench = [p for p in player_ids if p not in playing]
+                for slot in rng.choice(teams, size=min(len(bench), max(1, teams // 10)), replace=False):
+                    league[slot] = bench.pop(int(rng.integers(len(bench))))
+            combined = rng.random() < 0.2
+            reg_end, playoff_teams, rows = _season_games(rng, season_id, league, skill, combined)
+            conn.execute("INSERT INTO seasons (season_id, year, regular_season_end_week, playoff_format) VALUES (?, ?, ?, ?)",
+                         (season_id, season_id, reg_end, 'combined' if combined else 'weekly'))
+            conn.executemany("INSERT INTO weekly_matchups (season_id, week_start, week_end, weeks_included, player1_id, player2_id, player1_score, player2_score, game_type, notes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            matchups += len(rows)
+            totals = ingest.regular_deltas(rows)
+            conn.executemany("INSERT INTO season_results (player_id, season_id, rank, regular_season_record, wins, losses, ties, points_for, points_against, points_per_game, points_against_per_game, total_moves, made_playoffs) VALUES (?, ?, 0, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                             [(pid, sid) + ingest.season_row(*t) + (int(rng.integers(0, 60)), int(pid in playoff_teams))
+                              for (sid, pid), t in totals.items()])
+            final = next(r for r in rows if r[8] == 'championship')
+            winner, runner_up = (final[4], final[5]) if final[6] > final[7] else (final[5], final[4])
+            conn.execute("INSERT INTO championships (season_id, winner_id, runner_up_id) VALUES (?, ?, ?)", (season_id, winner, runner_up))
+            ingest.rerank(conn, season_id)
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    db_indexes.migrate(out_path)
+    return {'players': managers, 'seasons': seasons, 'teams_per_season': teams, 'matchups': matchups}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('out')
+    parser.add_argument('--managers', type=int, default=1000)
+    parser.add_argument('--seasons', type=int, default=50)
+    parser.add_argument('--teams', type=int, default=200, help="Teams per season (even, at most --managers)")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+    started = time.perf_counter()
+    counts = generate(args.out, args.managers, args.seasons, args.teams, args.seed)
+    print(f"Wrote {args.out}: {counts['players']} managers, {counts['seasons']} seasons x {counts['teams_per_season']} teams, "
+          f"{counts['matchups']} matchups ({os.path.getsize(args.out) / 1e6:.1f} MB) in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,19 @@
+import shutil
+
+import flask
+
+import coldstart
+
+
+def test_install_trusts_the_build_without_hashing_templates(monkeypatch, tmp_path):
+    def digest():
+        raise AssertionError("install() hashed the templates")
+    monkeypatch.setattr(coldstart, 'templates_digest', digest)
+    monkeypatch.setenv('FFL_COMPILED_TEMPLATES', '1')
+
+    assert coldstart.install(flask.Flask('probe'))
+
+    partial = tmp_path / 'compiled'
+    partial.mkdir()
+    shutil.copy(f'{coldstart.COMPILED_DIR}/{coldstart.SOURCE_HASH_FILE}', partial)
+    assert not coldstart.install(flask.Flask('probe'), str(partial))  # no build_info.json: compile didn't finish
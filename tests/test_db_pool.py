@@ -0,0 +1,17 @@
+import os
+import shutil
+
+from app import DATABASE
+from db_pool import ConnectionPool
+
+
+def test_release_closes_the_connection_when_the_file_is_gone(tmp_path):
+    path = str(tmp_path / 'league.db')
+    shutil.copy(DATABASE, path)
+    pool = ConnectionPool(path)
+    conn = pool.acquire()
+    os.remove(path)
+
+    pool.release(conn)  # used to raise FileNotFoundError from the fingerprint check
+
+    assert pool._idle == []
@@ -0,0 +1,33 @@
+import json
+import os
+import sqlite3
+
+import freeze
+
+
+def test_output_path_keeps_file_urls_literal(tmp_path):
+    out = str(tmp_path)
+    assert freeze.output_path(out, '/') == os.path.join(out, 'index.html')
+    assert freeze.output_path(out, '/seasons/2020') == os.path.join(out, 'seasons', '2020', 'index.html')
+    assert freeze.output_path(out, '/seasons/2020/timeline.json') == os.path.join(out, 'seasons', '2020', 'timeline.json')
+
+
+def test_freeze_writes_the_timeline_json(tmp_path):
+    from app import DATABASE
+    conn = sqlite3.connect(f'file:{DATABASE}?mode=ro', uri=True)
+    try:
+        year = conn.execute("SELECT MAX(year) FROM seasons").fetchone()[0]
+    finally:
+        conn.close()
+
+    summary = freeze.freeze(str(tmp_path), full=True)
+
+    assert summary['failed'] == []
+    assert (tmp_path / 'seasons' / str(year) / 'timeline' / 'index.html').exists()
+    with open(tmp_path / 'seasons' / str(year) / 'timeline.json', encoding='utf-8') as f:
+        assert json.load(f)
+    # The static site has no /search, so its nav doesn't link there; the live site still does.
+    with open(tmp_path / 'index.html', encoding='utf-8') as f:
+        assert '/search' not in f.read()
+    from app import app
+    assert b'/search' in app.test_client().get('/').get_data()
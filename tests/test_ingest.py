@@ -0,0 +1,49 @@
+import shutil
+import sqlite3
+
+import pytest
+
+import ingest
+from app import DATABASE
+
+
+@pytest.fixture
+def league(tmp_path):
+    """A copy of the league DB plus two seasons whose ids and years overlap: id 2025 is the
+    2026 season and id 7 the 2025 season."""
+    path = str(tmp_path / 'league.db')
+    shutil.copy(DATABASE, path)
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("INSERT INTO seasons (season_id, year, regular_season_end_week, playoff_format) VALUES (2025, 2026, 14, 'weekly')")
+        conn.execute("INSERT INTO seasons (season_id, year, regular_season_end_week, playoff_format) VALUES (7, 2025, 14, 'weekly')")
+    conn.close()
+    return path
+
+
+def test_season_id_and_year_resolve_separately(league):
+    conn = sqlite3.connect(league)
+    try:
+        resolver = ingest._Resolver(conn)
+    finally:
+        conn.close()
+    assert resolver.season({'season': '2025'}) == 7
+    assert resolver.season({'season_id': '2025'}) == 2025
+    assert resolver.season({'season': '2026'}) == 2025
+    assert resolver.season({'season_id': '7', 'season': '2026'}) == 7
+    with pytest.raises(ingest.IngestError):
+        resolver.season({'season_id': '2026'})
+
+
+def test_load_by_year_uses_that_years_season(league):
+    conn = sqlite3.connect(league)
+    p1, p2 = [r[0] for r in conn.execute("SELECT player_id FROM players ORDER BY player_id LIMIT 2")]
+    conn.close()
+    summary = ingest.load(league, [{'season': '2025', 'week': '1', 'player1_id': p1, 'player2_id': p2,
+                                    'player1_score': '101.5', 'player2_score': '99'}])
+    assert summary['seasons'] == [7]
+    conn = sqlite3.connect(league)
+    try:
+        assert conn.execute("SELECT season_id FROM weekly_matchups WHERE matchup_id > ?", (summary['last_matchup_id'],)).fetchall() == [(7,)]
+    finally:
+        conn.close()
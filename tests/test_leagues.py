@@ -0,0 +1,19 @@
+import shutil
+
+from app import DATABASE
+from leagues import LeagueIndex, LeagueRegistry
+
+
+def test_summaries_skip_a_league_removed_after_the_listing(tmp_path):
+    leagues_dir = tmp_path / 'leagues'
+    leagues_dir.mkdir()
+    shutil.copy(DATABASE, leagues_dir / 'alpha.db')
+    shutil.copy(DATABASE, leagues_dir / 'beta.db')
+    registry = LeagueRegistry(DATABASE, str(leagues_dir))
+    listing = registry.all()
+    registry.all = lambda: list(listing)  # the removal lands between the listing and the stat
+    (leagues_dir / 'beta.db').unlink()
+
+    slugs = [s['slug'] for s in LeagueIndex(registry).summaries()]
+
+    assert 'alpha' in slugs and 'beta' not in slugs
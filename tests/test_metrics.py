@@ -0,0 +1,16 @@
+import metrics
+from api import API_PREFIX
+from app import app
+
+
+def test_streamed_export_queries_are_counted():
+    key = ('api_export_matchups',)
+    before = metrics.SQL_QUERIES.values.get(key, 0)
+    client = app.test_client()
+
+    response = client.get(API_PREFIX + '/export/matchups.ndjson')
+    assert response.get_data()
+    response.close()
+
+    assert metrics.SQL_QUERIES.values.get(key, 0) > before
+    assert 'ffl_sql_queries_total{endpoint="api_export_matchups"}' in client.get('/metrics').get_data(as_text=True)
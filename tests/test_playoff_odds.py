@@ -0,0 +1,40 @@
+import sqlite3
+
+import playoff_odds
+
+SCHEMA = """
+CREATE TABLE seasons (season_id INTEGER PRIMARY KEY, year INTEGER, playoff_format TEXT);
+CREATE TABLE weekly_matchups (matchup_id INTEGER PRIMARY KEY, season_id INTEGER, week_start INTEGER, weeks_included TEXT,
+                              player1_id INTEGER, player2_id INTEGER, player1_score REAL, player2_score REAL, game_type TEXT);
+CREATE TABLE season_results (season_id INTEGER, player_id INTEGER, made_playoffs INTEGER);
+"""
+
+
+def six_team_bracket():
+    """Six even teams (1-6) that make the playoffs and six (7-12) that score 0.
+
+    Team t plays t + 1 games, all against the zero teams, so the seeding is
+    fixed (team 6 is the 1 seed, team 1 the 6 seed), while every playoff team
+    scores 90 or 110 and can win any playoff game.
+    """
+    conn = sqlite3.connect(':memory:')
+    conn.executescript(SCHEMA)
+    conn.execute("INSERT INTO seasons VALUES (1, 2030, 'weekly')")
+    for team in range(1, 7):
+        for week in range(1, team + 2):
+            conn.execute("INSERT INTO weekly_matchups (season_id, week_start, player1_id, player2_id, player1_score, player2_score, game_type) "
+                         "VALUES (1, ?, ?, ?, ?, 0, 'regular')", (week, team, team + 6, 90.0 if week % 2 else 110.0))
+    conn.executemany("INSERT INTO season_results VALUES (1, ?, ?)", [(pid, int(pid <= 6)) for pid in range(1, 13)])
+    return conn
+
+
+def test_six_team_bracket_gives_the_top_seeds_byes():
+    odds = playoff_odds.season_odds(six_team_bracket(), 1, n_sims=4000)
+    for team in range(1, 7):
+        assert odds[team]['playoff_pct'] == 100.0
+        assert odds[team]['title_pct'] > 0  # the 5 and 6 seeds (teams 2 and 1) aren't dropped from the bracket
+    for team in range(7, 13):
+        assert odds[team]['playoff_pct'] == 0.0
+    assert abs(sum(o['title_pct'] for o in odds.values()) - 100.0) < 1e-6
+    # A bye means one win fewer to take the title.
+    assert min(odds[5]['title_pct'], odds[6]['title_pct']) > max(odds[1]['title_pct'], odds[2]['title_pct'])